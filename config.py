@@ -4,240 +4,291 @@ MIGRATED TO 100% LOCAL SOLUTION
 """
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-class Config:
-    """Main configuration class"""
-    
-    def __init__(self):
-        # Paths
-        self.BASE_DIR = Path(__file__).parent
-        self.LOGS_DIR = self.BASE_DIR / "logs"
-        self.ASSETS_DIR = self.BASE_DIR / "assets"
-        self.DATA_DIR = self.BASE_DIR / "data"
-        self.MODELS_DIR = self.DATA_DIR / "models"
-        self.MEMORY_DB_DIR = self.DATA_DIR / "memory_db"
-        self.CONVERSATIONS_DIR = self.DATA_DIR / "conversations"
-        
-        # Ensure directories exist
-        for directory in [self.LOGS_DIR, self.ASSETS_DIR, self.DATA_DIR,
-                          self.MODELS_DIR, self.MEMORY_DB_DIR,
-                          self.CONVERSATIONS_DIR]:
-            directory.mkdir(exist_ok=True)
-
-
-
+@dataclass(frozen=True, slots=True)
 class LocalAIConfig:
     """Local AI configuration - 100% OFFLINE"""
-    
+
     # Ollama Configuration (LLM Local)
-    OLLAMA_HOST = "http://localhost:11434"
-    DEFAULT_MODEL = "mistral:7b"
-    ALTERNATIVE_MODELS = ["llama3:8b", "phi3:mini", "codellama:7b"]
-    
+    OLLAMA_HOST: str = "http://localhost:11434"
+    DEFAULT_MODEL: str = "mistral:7b"
+    ALTERNATIVE_MODELS: tuple = ("llama3:8b", "phi3:mini", "codellama:7b")
+
     # Model settings optimisés
-    MAX_TOKENS = 2048
-    TEMPERATURE = 0.7
-    TIMEOUT = 10  # Timeout Ollama
-    
+    MAX_TOKENS: int = 2048
+    TEMPERATURE: float = 0.7
+    TIMEOUT: int = 10  # Timeout Ollama
+
+    # OpenAI (optionnel) - utilisé uniquement si OPENAI_API_KEY est défini
+    OPENAI_MODEL: str = "gpt-3.5-turbo"
+
     # System prompt Jarvis optimisé
-    SYSTEM_PROMPT = """Tu es Jarvis, l'assistant IA personnel futuriste inspiré
+    SYSTEM_PROMPT: str = """Tu es Jarvis, l'assistant IA personnel futuriste inspiré
     d'Iron Man et de Gideon de Flash. Tu es intelligent, efficace et toujours
     prêt à aider. Tu fonctionnes entièrement en local pour garantir la
     confidentialité. Réponds de manière concise mais complète. Tu peux
-    contrôler des systèmes, répondre à des questions et avoir des 
+    contrôler des systèmes, répondre à des questions et avoir des
     conversations naturelles."""
-    
+
     # Context management local
-    MAX_CONTEXT_LENGTH = 4000  # Tokens de contexte
-    CONVERSATION_MEMORY_LIMIT = 50  # Nombre d'échanges gardés en mémoire
+    MAX_CONTEXT_LENGTH: int = 4000  # Tokens de contexte
+    CONVERSATION_MEMORY_LIMIT: int = 50  # Nombre d'échanges gardés en mémoire
 
+    # Cache de réponses (exact LRU + similarité sémantique)
+    RESPONSE_CACHE_SIZE: int = 256
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Similarité cosinus minimale
+    SEMANTIC_CACHE_SIZE: int = 64  # Embeddings gardés (GideonCore et AssistantCore)
 
+
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     """Audio-related configuration - ENHANCED LOCAL"""
-    
+
     # TTS Settings optimisés
-    TTS_RATE = 200
-    TTS_VOLUME = 0.8
-    TTS_VOICE_ID = None  # Auto-detect best voice
-    
+    TTS_RATE: int = 200
+    TTS_VOLUME: float = 0.8
+    TTS_VOICE_ID: str = None  # Auto-detect best voice
+    SIMULATE_TTS_DELAY: bool = False  # Sans TTS: simuler la durée de parole
+
+    # Streaming OpenAI TTS (GideonCoreFixed, PCM 16 bits mono)
+    OPENAI_TTS_MODEL: str = "tts-1"
+    OPENAI_TTS_VOICE: str = "nova"
+    OPENAI_TTS_SAMPLE_RATE: int = 24000
+
     # Speech Recognition local optimisé
-    VOICE_RECOGNITION_LANGUAGE = "en-US"
-    ALTERNATIVE_LANGUAGES = ["fr-FR", "en-GB"]
-    
+    VOICE_RECOGNITION_LANGUAGE: str = "en-US"
+    ALTERNATIVE_LANGUAGES: tuple = ("fr-FR", "en-GB")
+
+    # Backend de reconnaissance: "local" (Vosk si installé) ou "cloud" (Google)
+    ASR_BACKEND: str = "local"
+    VOSK_MODEL_PATH: str = "data/models/vosk-model-small"
+
+    # Local Whisper model (faster-whisper, optional)
+    WHISPER_MODEL: str = "small"
+    WHISPER_COMPUTE_TYPE: str = "int8"
+
     # Audio processing - OPTIMISÉ
-    SAMPLE_RATE = 16000  # Optimal pour reconnaissance vocale
-    CHANNELS = 1  # Mono pour performance
-    CHUNK_SIZE = 1024
-    
+    SAMPLE_RATE: int = 16000  # Optimal pour reconnaissance vocale
+    CHANNELS: int = 1  # Mono pour performance
+    CHUNK_SIZE: int = 1024
+
     # Wake word detection avancée
-    ACTIVATION_KEYWORDS = ["jarvis", "gideon", "hey jarvis", "hey gideon",
-                          "computer"]
-    WAKE_WORD_THRESHOLD = 0.75
-    WAKE_WORD_TIMEOUT = 5.0
-    
+    ACTIVATION_KEYWORDS: tuple = ("jarvis", "gideon", "hey jarvis", "hey gideon",
+                                  "computer")
+    WAKE_WORD_THRESHOLD: float = 0.75
+    WAKE_WORD_TIMEOUT: float = 5.0
+
     # Audio thresholds macOS optimisés
-    ENERGY_THRESHOLD = 300
-    DYNAMIC_ENERGY_THRESHOLD = True
-    PAUSE_THRESHOLD = 0.8
-    PHRASE_TIME_LIMIT = 10.0
-    TIMEOUT = 5.0
-    
+    ENERGY_THRESHOLD: int = 300
+    DYNAMIC_ENERGY_THRESHOLD: bool = True
+    PAUSE_THRESHOLD: float = 0.8
+    PHRASE_TIME_LIMIT: float = 10.0
+    TIMEOUT: float = 5.0
+    RECALIBRATION_INTERVAL: float = 60.0  # Secondes entre deux calibrations
+
     # Continuous listening
-    LISTEN_TIMEOUT = 1.0
-    PHRASE_TIMEOUT = 2.0
-    MIC_TIMEOUT = 5.0
+    LISTEN_TIMEOUT: float = 1.0
+    PHRASE_TIMEOUT: float = 2.0
+    MIC_TIMEOUT: float = 5.0
 
 
+@dataclass(frozen=True, slots=True)
 class VisionConfig:
     """Vision and face recognition configuration - LOCAL ONLY"""
-    
+
     # Face recognition files
-    USER_REFERENCE_IMAGE = "data/user_reference.jpg"
-    FACE_CASCADE_PATH = "data/models/haarcascade_frontalface_default.xml"
-    
+    USER_REFERENCE_IMAGE: str = "data/user_reference.jpg"
+    FACE_CASCADE_PATH: str = "data/models/haarcascade_frontalface_default.xml"
+
     # Detection settings
-    CONFIDENCE_THRESHOLD = 0.85
-    FACE_RECOGNITION_THRESHOLD = 0.6
-    
+    CONFIDENCE_THRESHOLD: float = 0.85
+    FACE_RECOGNITION_THRESHOLD: float = 0.6
+
     # Performance settings
-    FRAME_SKIP = 3  # Process every 3rd frame
-    MAX_DETECTION_TIME = 2.0
-    CAMERA_RESOLUTION = (640, 480)
-    
+    FRAME_SKIP: int = 3  # Process every 3rd frame
+    MAX_DETECTION_TIME: float = 2.0
+    CAMERA_RESOLUTION: tuple = (640, 480)
+    AUTH_CAMERA_RESOLUTION: tuple = (320, 240)  # Capture réduite pour l'authentification
+
     # Face detection optimization
-    MIN_FACE_SIZE = (30, 30)
-    SCALE_FACTOR = 1.1
-    MIN_NEIGHBORS = 5
+    MIN_FACE_SIZE: tuple = (30, 30)
+    SCALE_FACTOR: float = 1.1
+    MIN_NEIGHBORS: int = 5
 
+    # Optional ONNX face detector (RetinaFace-mobilenet0.25), input (w, h)
+    FACE_DETECTOR_MODEL: str = "data/models/retinaface_mnet025.onnx"
+    FACE_DETECTOR_MODEL_INT8: str = "data/models/retinaface_mnet025_int8.onnx"  # Prioritaire si présent
+    DETECTOR_INPUT_SIZE: tuple = (320, 240)
+
+    # Optional ONNX face embedding model (MobileFaceNet int8), used instead
+    # of dlib when the file is present
+    FACE_EMBEDDING_MODEL: str = "data/models/mobilefacenet_int8.onnx"
+    FACE_EMBEDDING_THRESHOLD: float = 0.6  # Cosine similarity
+
+@dataclass(frozen=True, slots=True)
 class MemoryConfig:
     """Local memory and knowledge base configuration"""
-    
+
     # ChromaDB settings
-    CHROMADB_PATH = "data/memory_db"
-    COLLECTION_NAME = "jarvis_memory"
-    
+    CHROMADB_PATH: str = "data/memory_db"
+    COLLECTION_NAME: str = "jarvis_memory"
+
     # Embedding model (local)
-    EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # Sentence transformers local
-    EMBEDDING_DIMENSION = 384
-    
+    EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"  # Sentence transformers local
+    EMBEDDING_DIMENSION: int = 384
+
     # Memory management
-    MAX_CONVERSATION_HISTORY = 1000
-    MAX_MEMORY_ENTRIES = 10000
-    SIMILARITY_THRESHOLD = 0.75
-    
+    MAX_CONVERSATION_HISTORY: int = 1000
+    MAX_MEMORY_ENTRIES: int = 10000
+    SIMILARITY_THRESHOLD: float = 0.75
+
     # Context retrieval
-    MAX_RELEVANT_MEMORIES = 5
-    MEMORY_DECAY_FACTOR = 0.95  # Importance décroit avec le temps
-    
+    MAX_RELEVANT_MEMORIES: int = 5
+    MEMORY_DECAY_FACTOR: float = 0.95  # Importance décroit avec le temps
+
     # Conversation persistence
-    SAVE_CONVERSATIONS = True
-    CONVERSATION_BATCH_SIZE = 10
+    SAVE_CONVERSATIONS: bool = True
+    CONVERSATION_BATCH_SIZE: int = 10
 
+@dataclass(frozen=True, slots=True)
 class CommandsConfig:
     """Local system commands configuration - macOS"""
-    
+
     # Available command categories
-    ENABLED_COMMANDS = [
+    ENABLED_COMMANDS: tuple = (
         "file_operations",
-        "application_control", 
+        "application_control",
         "system_info",
         "media_control",
         "network_tools",
         "automation"
-    ]
-    
+    )
+
     # File operations
-    SEARCH_LOCATIONS = [
+    SEARCH_LOCATIONS: tuple = (
         "~/Desktop",
-        "~/Documents", 
+        "~/Documents",
         "~/Downloads",
         "~/Applications"
-    ]
-    
+    )
+
     # Application shortcuts
-    COMMON_APPS = {
+    COMMON_APPS: dict = field(default_factory=lambda: {
         "browser": ["Safari", "Chrome", "Firefox"],
         "editor": ["TextEdit", "VSCode", "Sublime"],
         "media": ["Music", "Photos", "QuickTime"],
         "system": ["Activity Monitor", "System Preferences"]
-    }
-    
+    })
+
     # System monitoring
-    MONITOR_RESOURCES = True
-    RESOURCE_CHECK_INTERVAL = 30  # seconds
+    MONITOR_RESOURCES: bool = True
+    RESOURCE_CHECK_INTERVAL: int = 30  # seconds
 
+@dataclass(frozen=True, slots=True)
 class UIConfig:
     """UI configuration - ENHANCED"""
-    
+
     # Window settings
-    OVERLAY_OPACITY = 0.92
-    WINDOW_WIDTH = 500
-    WINDOW_HEIGHT = 400
-    
+    OVERLAY_OPACITY: float = 0.92
+    WINDOW_WIDTH: int = 500
+    WINDOW_HEIGHT: int = 400
+
     # Colors - Jarvis theme futuriste
-    PRIMARY_COLOR = "#1a237e"    # Bleu profond
-    SECONDARY_COLOR = "#0d47a1"  # Bleu électrique
-    ACCENT_COLOR = "#00e676"     # Vert Matrix
-    TEXT_COLOR = "#ffffff"
-    SUCCESS_COLOR = "#4caf50"
-    WARNING_COLOR = "#ff9800"
-    ERROR_COLOR = "#f44336"
-    
+    PRIMARY_COLOR: str = "#1a237e"    # Bleu profond
+    SECONDARY_COLOR: str = "#0d47a1"  # Bleu électrique
+    ACCENT_COLOR: str = "#00e676"     # Vert Matrix
+    TEXT_COLOR: str = "#ffffff"
+    SUCCESS_COLOR: str = "#4caf50"
+    WARNING_COLOR: str = "#ff9800"
+    ERROR_COLOR: str = "#f44336"
+
     # Animation et performance
-    ANIMATION_DURATION = 250
-    FPS_TARGET = 60
-    VISUALIZATION_BARS = 32
-    
+    ANIMATION_DURATION: int = 250
+    FPS_TARGET: int = 60
+    VISUALIZATION_BARS: int = 32
+
     # Interface modes
-    SHOW_DEBUG_PANEL = True
-    SHOW_SYSTEM_TRAY = True
-    MINIMIZE_TO_TRAY = True
+    SHOW_DEBUG_PANEL: bool = True
+    SHOW_SYSTEM_TRAY: bool = True
+    MINIMIZE_TO_TRAY: bool = True
 
+@dataclass(frozen=True, slots=True)
 class SystemConfig:
     """System configuration - PRODUCTION READY"""
-    
+
     # Environment
-    DEBUG = os.getenv('JARVIS_DEBUG', 'false').lower() == 'true'
-    LOG_LEVEL = "INFO" if not DEBUG else "DEBUG"
-    LOG_FILE = "logs/jarvis.log"
-    LOG_MAX_SIZE = 10 * 1024 * 1024  # 10MB
-    LOG_BACKUP_COUNT = 5
-    
+    DEBUG: bool = os.getenv('JARVIS_DEBUG', 'false').lower() == 'true'
+    LOG_LEVEL: str = "INFO" if not DEBUG else "DEBUG"
+    LOG_FILE: str = "logs/jarvis.log"
+    LOG_MAX_SIZE: int = 10 * 1024 * 1024  # 10MB
+    LOG_BACKUP_COUNT: int = 5
+
     # Memory management strict
-    MEMORY_LIMIT_MB = 300  # Limite stricte
-    MEMORY_CHECK_INTERVAL = 15  # Plus fréquent
-    MEMORY_WARNING_THRESHOLD = 250
-    MEMORY_CRITICAL_THRESHOLD = 280
-    
+    MEMORY_LIMIT_MB: int = 300  # Limite stricte
+    MEMORY_CHECK_INTERVAL: int = 15  # Plus fréquent
+    MEMORY_WARNING_THRESHOLD: int = 250
+    MEMORY_CRITICAL_THRESHOLD: int = 280
+
     # Performance monitoring
-    ENABLE_METRICS = True
-    METRICS_INTERVAL = 30
-    
+    ENABLE_METRICS: bool = True
+    METRICS_INTERVAL: int = 30
+
     # Health monitoring
-    HEALTH_CHECK_INTERVAL = 60
-    AUTO_RECOVERY = True
-    MAX_RESTART_ATTEMPTS = 3
-    
+    HEALTH_CHECK_INTERVAL: int = 60
+    AUTO_RECOVERY: bool = True
+    MAX_RESTART_ATTEMPTS: int = 3
+
     # Hotkeys et contrôles
-    TOGGLE_HOTKEY = "F12"
-    EMERGENCY_STOP = "F11"
-    
+    TOGGLE_HOTKEY: str = "F12"
+    EMERGENCY_STOP: str = "F11"
+
     # Startup behavior
-    AUTO_START_LISTENING = True
-    AUTO_CALIBRATE_AUDIO = True
-    LOAD_PREVIOUS_CONTEXT = True
+    AUTO_START_LISTENING: bool = True
+    AUTO_CALIBRATE_AUDIO: bool = True
+    LOAD_PREVIOUS_CONTEXT: bool = True
+
+
+BASE_DIR = Path(__file__).parent
+DATA_DIR = BASE_DIR / "data"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Main configuration class - arbre immuable de sous-configurations"""
+
+    # Paths
+    BASE_DIR: Path = BASE_DIR
+    LOGS_DIR: Path = BASE_DIR / "logs"
+    ASSETS_DIR: Path = BASE_DIR / "assets"
+    DATA_DIR: Path = DATA_DIR
+    MODELS_DIR: Path = DATA_DIR / "models"
+    MEMORY_DB_DIR: Path = DATA_DIR / "memory_db"
+    CONVERSATIONS_DIR: Path = DATA_DIR / "conversations"
+
+    # Sous-configurations
+    ai: LocalAIConfig = field(default_factory=LocalAIConfig)
+    audio: AudioConfig = field(default_factory=AudioConfig)
+    vision: VisionConfig = field(default_factory=VisionConfig)
+    memory: MemoryConfig = field(default_factory=MemoryConfig)
+    commands: CommandsConfig = field(default_factory=CommandsConfig)
+    ui: UIConfig = field(default_factory=UIConfig)
+    system: SystemConfig = field(default_factory=SystemConfig)
+
+    def __post_init__(self):
+        # Ensure directories exist
+        for directory in [self.LOGS_DIR, self.ASSETS_DIR, self.DATA_DIR,
+                          self.MODELS_DIR, self.MEMORY_DB_DIR,
+                          self.CONVERSATIONS_DIR]:
+            directory.mkdir(exist_ok=True)
+
+    @property
+    def face_recognition(self) -> VisionConfig:
+        """Backward compatibility alias pour l'ancien code"""
+        return self.vision
+
 
-# Global config instances avec nouvelle structure
+# Global config instance
 config = Config()
-config.ai = LocalAIConfig()
-config.audio = AudioConfig()
-config.vision = VisionConfig()
-config.memory = MemoryConfig()
-config.commands = CommandsConfig()
-config.ui = UIConfig()
-config.system = SystemConfig()
-
-# Backward compatibility aliases
-config.face_recognition = config.vision  # Alias pour l'ancien code 
\ No newline at end of file
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Fixtures partagées des tests
+Embedder factice pour les caches sémantiques : aucun modèle requis
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import config
+
+
+class FakeEmbedder:
+    """Vecteurs unitaires fixes par texte, compte les appels à encode"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    def encode(self, text, normalize_embeddings=True):
+        self.calls += 1
+        return self.vectors[text]
+
+
+@pytest.fixture
+def fake_embedder():
+    """Fabrique d'embedders : fake_embedder({texte: vecteur})"""
+    return FakeEmbedder
+
+
+@pytest.fixture
+def unit():
+    """unit(*composantes) : vecteur normé de dimension EMBEDDING_DIMENSION"""
+    np = pytest.importorskip("numpy")
+
+    def make(*components):
+        vector = np.zeros(config.memory.EMBEDDING_DIMENSION, np.float32)
+        vector[:len(components)] = components
+        return vector / np.linalg.norm(vector)
+
+    return make
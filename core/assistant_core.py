@@ -7,18 +7,90 @@ import face_recognition
 import cv2
 import speech_recognition as sr
 import pyttsx3
-import openai
+import httpx
 import numpy as np
+import asyncio
+import atexit
+import itertools
+import json
+import os
+import re
 import threading
 import queue
 import time
-from typing import Optional, Callable, Any
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Callable, Any, List, AsyncIterator, Tuple
 from dataclasses import dataclass
 
 from config import config
 from .event_system import EventSystem
 from .logger import GideonLogger
 
+# OpenAI (optional) - only used as a fallback when OPENAI_API_KEY is set
+try:
+    from openai import AsyncOpenAI
+    HAS_OPENAI = True
+except ImportError:
+    HAS_OPENAI = False
+
+# Local sentence embeddings (optional) - enables the semantic response cache
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+# Local speech recognition (optional) - falls back to Google when missing
+try:
+    from faster_whisper import WhisperModel
+    HAS_WHISPER = True
+except ImportError:
+    HAS_WHISPER = False
+
+# JIT-compiled face distance kernel (optional) - NumPy fallback otherwise
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Sentence boundary used to hand streamed LLM output to TTS
+SENTENCE_END = re.compile(r'[.!?]\s')
+
+# Built-in voice commands, compiled once (from original code)
+OPEN_VSCODE_PATTERN = re.compile(r'ouvre (?:vs code|visual studio code)', re.IGNORECASE)
+WEB_SEARCH_PATTERN = re.compile(r'\brecherche\b\s*(?P<query>.*)', re.IGNORECASE)
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _min_squared_distance(faces, reference):
+        """Smallest squared L2 distance between the face rows and the reference"""
+        best = np.inf
+        for i in prange(faces.shape[0]):
+            total = 0.0
+            for k in range(faces.shape[1]):
+                diff = faces[i, k] - reference[k]
+                total += diff * diff
+            best = min(best, total)
+        return best
+
+def faces_match(faces: np.ndarray, reference: np.ndarray, tolerance: float) -> bool:
+    """
+    Check whether any face encoding is within tolerance of the reference
+    
+    Args:
+        faces: Face encodings, one row per face
+        reference: Known user encoding
+        tolerance: Maximum L2 distance for a match
+        
+    Returns:
+        True if at least one face matches
+    """
+    if HAS_NUMBA:
+        return _min_squared_distance(faces, reference) <= tolerance * tolerance
+    return bool((np.linalg.norm(faces - reference, axis=1) <= tolerance).any())
+
 @dataclass
 class VoiceCommand:
     """Voice command data structure"""
@@ -36,21 +108,75 @@ class GideonCore:
         self.logger = GideonLogger()
         self.event_system = EventSystem()
         
-        # Initialize AI
-        openai.api_key = config.ai.OPENAI_API_KEY
-        
-        # Initialize TTS
+        # Initialize AI - local Ollama through a keep-alive async HTTP client,
+        # driven by a dedicated event loop so requests never block the
+        # voice/TTS threads
+        self.http_client = httpx.AsyncClient(
+            base_url=config.ai.OLLAMA_HOST,
+            timeout=config.ai.TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4)
+        )
+        openai_key = os.getenv('OPENAI_API_KEY')
+        self.openai_client = AsyncOpenAI(api_key=openai_key) if HAS_OPENAI and openai_key else None
+        
+        # System message built once; the clients only read it
+        self._system_msg = {"role": "system", "content": config.ai.SYSTEM_PROMPT}
+        
+        # Response cache: exact prompts (LRU) then semantically close prompts
+        self._response_cache = OrderedDict()
+        self._cache_embeddings = np.empty((0, config.memory.EMBEDDING_DIMENSION), np.float32)
+        self._cache_responses = []
+        self.embedder = None
+        if HAS_SENTENCE_TRANSFORMERS:
+            try:
+                self.embedder = SentenceTransformer(config.memory.EMBEDDING_MODEL)
+            except Exception as e:
+                self.logger.error(f"Failed to load embedding model: {e}")
+        
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        
+        # Initialize TTS - a single worker thread owns the engine
         self.tts = pyttsx3.init()
         self._configure_tts()
+        self._tts_queue = queue.PriorityQueue()
+        self._tts_sequence = itertools.count()
+        self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+        self._tts_thread.start()
         
-        # Initialize speech recognition
+        # Initialize speech recognition - the microphone stream is opened
+        # once and calibrated for ambient noise a single time
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.recognizer.dynamic_energy_threshold = True
+        self.microphone = sr.Microphone(sample_rate=config.audio.SAMPLE_RATE)
+        self._mic_source = self.microphone.__enter__()
+        self.recognizer.adjust_for_ambient_noise(self._mic_source, duration=1.0)
+        atexit.register(self._close_microphone)
+        
+        # Local int8 Whisper model avoids the network round-trip to Google
+        self.asr_model = None
+        if HAS_WHISPER:
+            try:
+                self.asr_model = WhisperModel(
+                    config.audio.WHISPER_MODEL,
+                    device="cpu",
+                    compute_type=config.audio.WHISPER_COMPUTE_TYPE
+                )
+                self.logger.info("Local Whisper speech recognition loaded")
+            except Exception as e:
+                self.logger.error(f"Failed to load Whisper model: {e}")
         
-        # Initialize face recognition
+        # Initialize face recognition (ONNX network preferred over dlib)
+        self.face_cascade = None
+        self.face_net = self._load_face_net()
         self.user_encoding = None
         self._load_user_face()
         
+        # Compile the distance kernel now rather than on the first real frame
+        if HAS_NUMBA:
+            faces_match(np.zeros((1, 128)), np.zeros(128), 0.0)
+        
         # System state
         self.is_listening = False
         self.is_speaking = False
@@ -60,6 +186,13 @@ class GideonCore:
         # Threading
         self.voice_thread = None
         self.face_thread = None
+        self._pipeline_future = None
+        
+        # Voice command dispatch table: first matching pattern wins
+        self._command_handlers = [
+            (OPEN_VSCODE_PATTERN, self._handle_open_vscode),
+            (WEB_SEARCH_PATTERN, self._handle_web_search),
+        ]
         
         self.logger.info("Gideon Core initialized successfully")
     
@@ -76,14 +209,95 @@ class GideonCore:
         self.tts.setProperty('rate', config.audio.TTS_RATE)
         self.tts.setProperty('volume', config.audio.TTS_VOLUME)
     
+    def _load_face_net(self):
+        """Load the ONNX face embedding network, if the model file is installed"""
+        model_path = Path(config.vision.FACE_EMBEDDING_MODEL)
+        if not model_path.exists():
+            return None
+        
+        try:
+            net = cv2.dnn.readNetFromONNX(str(model_path))
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+            net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            self.face_cascade = cv2.CascadeClassifier(config.vision.FACE_CASCADE_PATH)
+            self.logger.info("ONNX face embedding network loaded")
+            return net
+        except Exception as e:
+            self.logger.error(f"Failed to load face embedding network: {e}")
+            return None
+    
+    def _embed_faces(self, bgr_frame: np.ndarray) -> np.ndarray:
+        """
+        Detect faces with the Haar cascade and embed them with the ONNX network
+        
+        Args:
+            bgr_frame: Camera frame in BGR order
+            
+        Returns:
+            L2-normalized embeddings, one row per detected face
+        """
+        gray = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2GRAY)
+        boxes = self.face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=config.vision.SCALE_FACTOR,
+            minNeighbors=config.vision.MIN_NEIGHBORS,
+            minSize=config.vision.MIN_FACE_SIZE
+        )
+        if len(boxes) == 0:
+            return np.empty((0, 0), np.float32)
+        
+        crops = [bgr_frame[y:y + h, x:x + w] for x, y, w, h in boxes]
+        blob = cv2.dnn.blobFromImages(
+            crops, scalefactor=1 / 127.5, size=(112, 112),
+            mean=(127.5, 127.5, 127.5), swapRB=True
+        )
+        self.face_net.setInput(blob)
+        embeddings = self.face_net.forward().reshape(len(crops), -1)
+        return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    
+    def _warm_up_face_models(self):
+        """Run the face models once on a blank frame so the first real frame is fast"""
+        try:
+            if self.face_net is not None:
+                blob = cv2.dnn.blobFromImage(
+                    np.zeros((112, 112, 3), np.uint8), scalefactor=1 / 127.5,
+                    size=(112, 112), mean=(127.5, 127.5, 127.5), swapRB=True
+                )
+                self.face_net.setInput(blob)
+                self.face_net.forward()
+            else:
+                width, height = config.vision.AUTH_CAMERA_RESOLUTION
+                dummy = np.zeros((height, width, 3), np.uint8)
+                face_recognition.face_locations(dummy, model="hog")
+                face_recognition.face_encodings(dummy, known_face_locations=[(0, 10, 10, 0)])
+        except Exception as e:
+            self.logger.debug(f"Face model warm-up failed: {e}")
+    
     def _load_user_face(self):
-        """Load and encode user face from photo"""
+        """Load and encode user face from photo, reusing the cached encoding if fresh"""
         try:
-            user_image = face_recognition.load_image_file(config.face_recognition.USER_PHOTO_PATH)
-            encodings = face_recognition.face_encodings(user_image)
+            photo_path = Path(config.vision.USER_REFERENCE_IMAGE)
+            if self.face_net is not None:
+                cache_path = photo_path.with_name(f"{photo_path.stem}_onnx.npy")
+            else:
+                cache_path = photo_path.with_suffix('.npy')
+            
+            # The encoding only depends on the photo, so reuse it across runs
+            if cache_path.exists() and cache_path.stat().st_mtime >= photo_path.stat().st_mtime:
+                self.user_encoding = np.ascontiguousarray(np.load(cache_path), dtype=np.float64)
+                self.logger.info("User face encoding loaded from cache")
+                return
+            
+            if self.face_net is not None:
+                image = cv2.imread(str(photo_path))
+                encodings = list(self._embed_faces(image)) if image is not None else []
+            else:
+                user_image = face_recognition.load_image_file(str(photo_path))
+                encodings = face_recognition.face_encodings(user_image)
             
             if encodings:
-                self.user_encoding = encodings[0]
+                self.user_encoding = np.ascontiguousarray(encodings[0], dtype=np.float64)
+                np.save(cache_path, self.user_encoding)
                 self.logger.info("User face encoding loaded successfully")
             else:
                 self.logger.error("No face found in user photo")
@@ -102,19 +316,31 @@ class GideonCore:
         if priority and self.is_speaking:
             self.tts.stop()
         
-        def _speak():
-            self.is_speaking = True
-            self.event_system.emit('speech_started', {'text': text})
-            
-            self.logger.info(f"🗣️ Speaking: {text}")
-            self.tts.say(text)
-            self.tts.runAndWait()
-            
-            self.is_speaking = False
-            self.event_system.emit('speech_ended', {'text': text})
+        # Queue for the TTS worker - returns immediately
+        self._tts_queue.put((0 if priority else 1, next(self._tts_sequence), text))
+    
+    def _tts_worker(self):
+        """Speak queued texts one at a time, priority texts first"""
+        while True:
+            _, _, text = self._tts_queue.get()
+            if text is None:
+                break
+            try:
+                self._speak_blocking(text)
+            except Exception as e:
+                self.logger.error(f"TTS error: {e}")
+    
+    def _speak_blocking(self, text: str):
+        """Speak text with TTS, returning once playback is finished"""
+        self.is_speaking = True
+        self.event_system.emit('speech_started', {'text': text})
+        
+        self.logger.info(f"🗣️ Speaking: {text}")
+        self.tts.say(text)
+        self.tts.runAndWait()
         
-        # Run in separate thread to avoid blocking
-        threading.Thread(target=_speak, daemon=True).start()
+        self.is_speaking = False
+        self.event_system.emit('speech_ended', {'text': text})
     
     def listen_once(self) -> Optional[VoiceCommand]:
         """
@@ -124,39 +350,40 @@ class GideonCore:
             VoiceCommand object or None if no speech detected
         """
         try:
-            with self.microphone as source:
-                self.logger.debug("🎤 Listening for command...")
-                self.event_system.emit('listening_started')
-                
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                
-                # Listen with timeout
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=config.audio.VOICE_RECOGNITION_TIMEOUT,
-                    phrase_time_limit=10
-                )
-                
-                self.event_system.emit('listening_ended')
-                
-                # Recognize speech
+            self.logger.debug("🎤 Listening for command...")
+            self.event_system.emit('listening_started')
+            
+            # Listen with timeout on the persistent, pre-calibrated stream
+            audio = self.recognizer.listen(
+                self._mic_source, 
+                timeout=config.audio.TIMEOUT,
+                phrase_time_limit=10
+            )
+            
+            self.event_system.emit('listening_ended')
+            
+            # Recognize speech - locally when possible
+            if self.asr_model is not None:
+                text = self._transcribe_locally(audio)
+                if not text:
+                    raise sr.UnknownValueError()
+            else:
                 text = self.recognizer.recognize_google(
                     audio, 
                     language=config.audio.VOICE_RECOGNITION_LANGUAGE
                 )
-                
-                command = VoiceCommand(
-                    text=text,
-                    confidence=1.0,  # Google API doesn't provide confidence
-                    timestamp=time.time()
-                )
-                
-                self.logger.info(f"🎤 Heard: {text}")
-                self.event_system.emit('voice_command', {'command': command})
-                
-                return command
-                
+            
+            command = VoiceCommand(
+                text=text,
+                confidence=1.0,  # Google API doesn't provide confidence
+                timestamp=time.time()
+            )
+            
+            self.logger.info(f"🎤 Heard: {text}")
+            self.event_system.emit('voice_command', {'command': command})
+            
+            return command
+            
         except sr.WaitTimeoutError:
             self.logger.debug("Voice recognition timeout")
             return None
@@ -170,6 +397,26 @@ class GideonCore:
             self.logger.error(f"Unexpected error during listening: {e}")
             return None
     
+    def _transcribe_locally(self, audio: "sr.AudioData") -> str:
+        """Transcribe captured audio with the local Whisper model"""
+        samples = np.frombuffer(
+            audio.get_raw_data(convert_rate=16000, convert_width=2), np.int16
+        ).astype(np.float32) / 32768.0
+        
+        segments, _ = self.asr_model.transcribe(
+            samples,
+            language=config.audio.VOICE_RECOGNITION_LANGUAGE.split('-')[0],
+            vad_filter=True,
+            beam_size=1
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+    
+    def _close_microphone(self):
+        """Close the persistent microphone stream"""
+        if self._mic_source is not None:
+            self.microphone.__exit__(None, None, None)
+            self._mic_source = None
+    
     def start_continuous_listening(self):
         """Start continuous voice command listening in background thread"""
         if self.is_listening:
@@ -182,18 +429,69 @@ class GideonCore:
                 command = self.listen_once()
                 if command:
                     self.voice_queue.put(command)
-                time.sleep(0.1)  # Small delay to prevent CPU overload
         
         self.voice_thread = threading.Thread(target=_listen_loop, daemon=True)
         self.voice_thread.start()
         
         self.logger.info("Continuous listening started")
     
+    def start_voice_pipeline(self):
+        """
+        Start the event-driven voice pipeline: speech recognition and AI
+        generation run as independent asyncio tasks on the core event loop,
+        connected by a queue, and each sentence is handed to the TTS worker
+        as soon as it is generated
+        """
+        if self.is_listening:
+            return
+        
+        self.is_listening = True
+        self._pipeline_future = asyncio.run_coroutine_threadsafe(
+            self._voice_pipeline(), self._loop
+        )
+        
+        self.logger.info("Voice pipeline started")
+    
+    async def _voice_pipeline(self):
+        """Run the recognition and response tasks until listening stops"""
+        commands = asyncio.Queue()
+        await asyncio.gather(
+            self._recognition_task(commands),
+            self._response_task(commands)
+        )
+    
+    async def _recognition_task(self, commands: asyncio.Queue):
+        """Push recognized commands; listening resumes while replies are spoken"""
+        while self.is_listening:
+            command = await asyncio.to_thread(self.listen_once)
+            if command:
+                await commands.put(command)
+    
+    async def _response_task(self, commands: asyncio.Queue):
+        """Answer commands, streaming AI replies sentence by sentence to TTS"""
+        while True:
+            command = await commands.get()
+            self.event_system.emit('command_processing', {'command': command})
+            
+            try:
+                response = self._match_builtin_command(command.text.lower())
+                if response is not None:
+                    self.speak(response)
+                    continue
+                
+                async for sentence in self.stream_ai_sentences(command.text):
+                    self.speak(sentence)
+            except Exception as e:
+                self.logger.error(f"Voice pipeline error: {e}")
+    
     def stop_continuous_listening(self):
         """Stop continuous voice command listening"""
         self.is_listening = False
         if self.voice_thread:
             self.voice_thread.join(timeout=2)
+        if self._pipeline_future:
+            self._pipeline_future.cancel()
+            self._pipeline_future = None
         
         self.logger.info("Continuous listening stopped")
     
@@ -219,49 +517,140 @@ class GideonCore:
         Returns:
             True if user is authenticated, False otherwise
         """
-        if not self.user_encoding:
+        if self.user_encoding is None:
             self.logger.error("No user face encoding available")
             return False
         
         self.logger.info("Starting face recognition authentication...")
         self.speak("Searching for your face...", priority=True)
         
+        # Warm the face models up while the prompt plays and the camera opens
+        warmup_thread = threading.Thread(target=self._warm_up_face_models, daemon=True)
+        warmup_thread.start()
+        
         webcam = cv2.VideoCapture(0)
         if not webcam.isOpened():
             self.logger.error("Could not open webcam")
             self.speak("Camera access failed")
             return False
         
+        # Keep only the freshest frame in the driver buffer
+        webcam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        webcam.set(cv2.CAP_PROP_FPS, 15)
+        
+        # Small MJPG frames: the camera compresses, and there are far fewer
+        # pixels to convert and scan than at the driver's default resolution
+        auth_width, auth_height = config.vision.AUTH_CAMERA_RESOLUTION
+        webcam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        webcam.set(cv2.CAP_PROP_FRAME_WIDTH, auth_width)
+        webcam.set(cv2.CAP_PROP_FRAME_HEIGHT, auth_height)
+        self.logger.debug(
+            f"Camera resolution: {webcam.get(cv2.CAP_PROP_FRAME_WIDTH):.0f}x"
+            f"{webcam.get(cv2.CAP_PROP_FRAME_HEIGHT):.0f}"
+        )
+        
+        # Capture runs in its own thread so the camera never idles while
+        # faces are being encoded; stale frames are dropped
+        frames = queue.Queue(maxsize=1)
+        capturing = threading.Event()
+        capturing.set()
+        
+        def _capture_loop():
+            while capturing.is_set():
+                ret, captured = webcam.read()
+                if not ret:
+                    continue
+                try:
+                    frames.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    frames.put_nowait(captured)
+                except queue.Full:
+                    pass
+        
+        capture_thread = threading.Thread(target=_capture_loop, daemon=True)
+        capture_thread.start()
+        
         authenticated = False
-        start_time = time.time()
+        
+        # Thresholds and hot callables are bound to locals once, not looked
+        # up on every frame
+        tolerance = config.vision.FACE_RECOGNITION_THRESHOLD
+        embedding_threshold = config.vision.FACE_EMBEDDING_THRESHOLD
+        debug = config.system.DEBUG
+        user_encoding = self.user_encoding
+        use_face_net = self.face_net is not None
+        embed_faces = self._embed_faces
+        find_faces = face_recognition.face_locations
+        encode_faces = face_recognition.face_encodings
+        cvt_color = cv2.cvtColor
+        resize = cv2.resize
+        next_frame = frames.get
+        now = time.monotonic
+        
+        # Reusable RGB buffers, allocated on the first frame
+        rgb_frame = None
+        rgb_small = None
+        scale = 1
+        
+        warmup_thread.join()
+        
+        # The detection window starts once the models are warm: a cold first
+        # inference must not eat the time allotted to real frames
+        deadline = now() + config.vision.MAX_DETECTION_TIME
         
         try:
-            while time.time() - start_time < config.face_recognition.DETECTION_TIMEOUT:
-                ret, frame = webcam.read()
-                if not ret:
+            while now() < deadline:
+                try:
+                    frame = next_frame(timeout=0.5)
+                except queue.Empty:
                     continue
                 
-                # Convert BGR to RGB
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                if use_face_net:
+                    # ONNX embeddings are L2-normalized: dot product is cosine similarity
+                    embeddings = embed_faces(frame)
+                    if len(embeddings) and (
+                        embeddings @ user_encoding >= embedding_threshold
+                    ).any():
+                        authenticated = True
+                else:
+                    if rgb_frame is None:
+                        height, width = frame.shape[:2]
+                        # Only downscale if the driver ignored the requested size
+                        scale = max(1, width // auth_width)
+                        rgb_frame = np.empty((height, width, 3), np.uint8)
+                        rgb_small = (np.empty((height // scale, width // scale, 3), np.uint8)
+                                     if scale > 1 else rgb_frame)
                 
-                # Find faces in frame
-                face_locations = face_recognition.face_locations(rgb_frame)
-                face_encodings = face_recognition.face_encodings(rgb_frame, face_locations)
+                    # Convert BGR to RGB into the preallocated contiguous buffer
+                    cvt_color(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
                 
-                for face_encoding in face_encodings:
-                    # Compare with known user face
-                    matches = face_recognition.compare_faces(
-                        [self.user_encoding], 
-                        face_encoding,
-                        tolerance=config.face_recognition.TOLERANCE
-                    )
-                    
-                    if matches[0]:
-                        authenticated = True
-                        break
+                    # Detect at the auth resolution (HOG cost scales with pixel
+                    # count), then scale the boxes back up for encoding
+                    if scale > 1:
+                        resize(rgb_frame, (rgb_small.shape[1], rgb_small.shape[0]),
+                               dst=rgb_small, interpolation=cv2.INTER_AREA)
+                    small_locations = find_faces(rgb_small, model="hog")
+                
+                    # Only run the expensive encoding when a face was found
+                    face_encodings = []
+                    if small_locations:
+                        face_locations = [
+                            (top * scale, right * scale, bottom * scale, left * scale)
+                            for top, right, bottom, left in small_locations
+                        ]
+                        face_encodings = encode_faces(
+                            rgb_frame, known_face_locations=face_locations, num_jitters=1
+                        )
+                
+                    if face_encodings:
+                        # Compare all detected faces with the known user face at once
+                        if faces_match(np.asarray(face_encodings), user_encoding, tolerance):
+                            authenticated = True
                 
                 # Show video feed (optional, for debugging)
-                if config.system.DEBUG:
+                if debug:
                     cv2.imshow("Face Recognition", frame)
                     if cv2.waitKey(1) & 0xFF == ord('q'):
                         break
@@ -272,8 +661,11 @@ class GideonCore:
         except Exception as e:
             self.logger.error(f"Face recognition error: {e}")
         finally:
+            capturing.clear()
+            capture_thread.join(timeout=1)
             webcam.release()
-            cv2.destroyAllWindows()
+            if config.system.DEBUG:
+                cv2.destroyAllWindows()
         
         self.is_authenticated = authenticated
         
@@ -288,9 +680,83 @@ class GideonCore:
         
         return authenticated
     
-    def generate_ai_response(self, prompt: str, context: dict = None) -> str:
+    def _build_messages(self, prompt: str, context: dict = None) -> List[dict]:
+        """Build chat messages for the AI from a prompt and optional context"""
+        messages = [self._system_msg]
+        
+        if context:
+            context_str = f"Context: {context}"
+            messages.append({"role": "system", "content": context_str})
+        
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    async def _get_cached_response(self, prompt: str) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """
+        Return a cached response for this prompt or a very similar one
+        
+        Returns:
+            (response or None, prompt embedding) - the embedding is computed
+            on an exact-cache miss (None without embedder) so that
+            _cache_response can store it without encoding the prompt again
+        """
+        key = prompt.strip().lower()
+        if key in self._response_cache:
+            self._response_cache.move_to_end(key)
+            return self._response_cache[key], None
+        
+        if self.embedder is None:
+            return None, None
+        
+        embedding = await asyncio.to_thread(self.embedder.encode, key, normalize_embeddings=True)
+        if not self._cache_responses:
+            return None, embedding
+        
+        # Embeddings are normalized: dot product is cosine similarity
+        similarities = self._cache_embeddings @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] >= config.ai.SEMANTIC_CACHE_THRESHOLD:
+            return self._cache_responses[best], embedding
+        return None, embedding
+    
+    def _cache_response(self, prompt: str, response: str, embedding: Optional[np.ndarray] = None):
+        """Store a response in the exact cache, and in the semantic cache with its lookup embedding"""
+        key = prompt.strip().lower()
+        self._response_cache[key] = response
+        if len(self._response_cache) > config.ai.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        
+        if embedding is None:
+            return
+        limit = config.ai.SEMANTIC_CACHE_SIZE
+        self._cache_embeddings = np.vstack([self._cache_embeddings, embedding])[-limit:]
+        self._cache_responses = (self._cache_responses + [response])[-limit:]
+    
+    def _ollama_payload(self, messages: List[dict], stream: bool) -> dict:
+        """Build an Ollama /api/chat request body"""
+        return {
+            "model": config.ai.DEFAULT_MODEL,
+            "messages": messages,
+            "options": {
+                "num_predict": config.ai.MAX_TOKENS,
+                "temperature": config.ai.TEMPERATURE
+            },
+            "stream": stream
+        }
+    
+    async def _openai_response(self, messages: List[dict]) -> str:
+        """Fallback completion through OpenAI (only when a key is configured)"""
+        response = await self.openai_client.chat.completions.create(
+            model=config.ai.OPENAI_MODEL,
+            messages=messages,
+            max_tokens=config.ai.MAX_TOKENS,
+            temperature=config.ai.TEMPERATURE
+        )
+        return response.choices[0].message.content
+    
+    async def generate_ai_response_async(self, prompt: str, context: dict = None) -> str:
         """
-        Generate AI response using OpenAI API
+        Generate AI response using the local Ollama chat API
         
         Args:
             prompt: User prompt
@@ -299,32 +765,153 @@ class GideonCore:
         Returns:
             AI generated response
         """
+        # Only context-free prompts are cacheable
+        embedding = None
+        if context is None:
+            cached, embedding = await self._get_cached_response(prompt)
+            if cached is not None:
+                self.logger.info(f"AI Response served from cache for: {prompt[:50]}...")
+                return cached
+        
+        messages = self._build_messages(prompt, context)
+        ai_response = None
         try:
-            messages = [
-                {"role": "system", "content": config.ai.SYSTEM_PROMPT}
-            ]
-            
-            if context:
-                context_str = f"Context: {context}"
-                messages.append({"role": "system", "content": context_str})
-            
-            messages.append({"role": "user", "content": prompt})
-            
-            response = openai.ChatCompletion.create(
-                model=config.ai.MODEL,
-                messages=messages,
-                max_tokens=config.ai.MAX_TOKENS,
-                temperature=config.ai.TEMPERATURE
+            response = await self.http_client.post(
+                "/api/chat", json=self._ollama_payload(messages, stream=False)
             )
+            response.raise_for_status()
             
-            ai_response = response.choices[0].message.content
+            ai_response = response.json()["message"]["content"]
             self.logger.info(f"AI Response generated for: {prompt[:50]}...")
             
+        except Exception as e:
+            self.logger.error(f"AI response generation failed: {e}")
+        
+        if ai_response is None and self.openai_client:
+            try:
+                ai_response = await self._openai_response(messages)
+            except Exception as e:
+                self.logger.error(f"OpenAI fallback failed: {e}")
+        
+        if ai_response is not None:
+            if context is None:
+                self._cache_response(prompt, ai_response, embedding)
             return ai_response
+        
+        return "I'm sorry, I'm having trouble processing that request right now."
+    
+    async def stream_ai_sentences(self, prompt: str, context: dict = None) -> AsyncIterator[str]:
+        """
+        Stream the AI response, yielding each sentence as soon as it is complete
+        
+        Args:
+            prompt: User prompt
+            context: Additional context for the AI
             
+        Yields:
+            Complete sentences of the response
+        """
+        embedding = None
+        if context is None:
+            cached, embedding = await self._get_cached_response(prompt)
+            if cached is not None:
+                yield cached
+                return
+        
+        messages = self._build_messages(prompt, context)
+        buffer = ""
+        full_response = ""
+        received = False
+        failed = False
+        try:
+            async with self.http_client.stream(
+                "POST", "/api/chat", json=self._ollama_payload(messages, stream=True)
+            ) as response:
+                response.raise_for_status()
+                
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    content = data.get("message", {}).get("content", "")
+                    buffer += content
+                    full_response += content
+                    received = True
+                    while (match := SENTENCE_END.search(buffer)):
+                        sentence, buffer = buffer[:match.end()], buffer[match.end():]
+                        yield sentence.strip()
+                    if data.get("done"):
+                        break
+                    
         except Exception as e:
-            self.logger.error(f"AI response generation failed: {e}")
-            return "I'm sorry, I'm having trouble processing that request right now."
+            self.logger.error(f"AI response streaming failed: {e}")
+            failed = True
+            fallback = None
+            if self.openai_client and not received:
+                try:
+                    fallback = await self._openai_response(messages)
+                except Exception as fallback_error:
+                    self.logger.error(f"OpenAI fallback failed: {fallback_error}")
+            buffer += " " + (fallback or "I'm sorry, I'm having trouble processing that request right now.")
+        
+        if buffer.strip():
+            yield buffer.strip()
+        
+        if context is None and received and not failed:
+            self._cache_response(prompt, full_response.strip(), embedding)
+    
+    def speak_ai_response(self, prompt: str, context: dict = None) -> str:
+        """
+        Generate an AI response and speak it sentence by sentence while the
+        rest of the response is still being generated
+        
+        Args:
+            prompt: User prompt
+            context: Additional context for the AI
+            
+        Returns:
+            Full AI generated response
+        """
+        async def _stream_and_speak() -> str:
+            sentences = []
+            async for sentence in self.stream_ai_sentences(prompt, context):
+                sentences.append(sentence)
+                self.speak(sentence)
+            return " ".join(sentences)
+        
+        future = asyncio.run_coroutine_threadsafe(_stream_and_speak(), self._loop)
+        return future.result()
+    
+    async def generate_ai_responses_async(self, prompts: List[str]) -> List[str]:
+        """
+        Generate several AI responses concurrently
+        
+        Args:
+            prompts: User prompts to answer
+            
+        Returns:
+            Responses in the same order as the prompts
+        """
+        return list(await asyncio.gather(
+            *(self.generate_ai_response_async(prompt) for prompt in prompts)
+        ))
+    
+    def generate_ai_response(self, prompt: str, context: dict = None) -> str:
+        """
+        Generate AI response (synchronous wrapper for non-async callers)
+        
+        Args:
+            prompt: User prompt
+            context: Additional context for the AI
+            
+        Returns:
+            AI generated response
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.generate_ai_response_async(prompt, context), self._loop
+        )
+        return future.result()
     
     def process_voice_command(self, command: VoiceCommand) -> str:
         """
@@ -341,30 +928,50 @@ class GideonCore:
         self.logger.info(f"Processing command: {command.text}")
         self.event_system.emit('command_processing', {'command': command})
         
-        # Built-in commands (from original code)
-        if any(phrase in command_text for phrase in ["ouvre vs code", "ouvre visual studio code"]):
-            response = "Opening Visual Studio Code."
-            self.event_system.emit('system_command', {'action': 'open_vscode'})
-            return response
-            
-        elif "recherche" in command_text:
-            search_term = command_text.replace("recherche", "").strip()
-            response = f"Searching for: {search_term}"
-            self.event_system.emit('web_search', {'query': search_term})
+        # Built-in commands
+        response = self._match_builtin_command(command_text)
+        if response is not None:
             return response
         
         # Default to AI response
         response = self.generate_ai_response(command.text)
         return response
     
+    def _match_builtin_command(self, command_text: str) -> Optional[str]:
+        """Run the first built-in command matching the text, if any"""
+        for pattern, handler in self._command_handlers:
+            match = pattern.search(command_text)
+            if match:
+                return handler(match)
+        return None
+    
+    def _handle_open_vscode(self, match: re.Match) -> str:
+        """Open Visual Studio Code"""
+        self.event_system.emit('system_command', {'action': 'open_vscode'})
+        return "Opening Visual Studio Code."
+    
+    def _handle_web_search(self, match: re.Match) -> str:
+        """Search the web for the text following 'recherche'"""
+        search_term = match.group('query').strip()
+        self.event_system.emit('web_search', {'query': search_term})
+        return f"Searching for: {search_term}"
+    
     def shutdown(self):
         """Graceful shutdown of all systems"""
         self.logger.info("Shutting down Gideon Core...")
         
         self.stop_continuous_listening()
+        self._close_microphone()
         
         if self.tts:
             self.tts.stop()
+        self._tts_queue.put((0, next(self._tts_sequence), None))
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self.http_client.aclose(), self._loop).result(timeout=2)
+        except Exception as e:
+            self.logger.error(f"Failed to close HTTP client: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
         
         self.event_system.emit('system_shutdown')
         self.logger.info("Gideon Core shutdown complete") 
\ No newline at end of file
@@ -3,12 +3,19 @@ Enhanced core assistant functionality with FIXED dependencies
 Compatible version with modern OpenAI API and fallback options
 """
 
+import asyncio
+import importlib.util
 import threading
 import queue
 import time
+import json
 import logging
-from typing import Optional, Callable, Any
-from dataclasses import dataclass
+import os
+import re
+from collections import deque, OrderedDict
+from typing import Optional, Callable, Any, Iterator, AsyncIterator, Union
+from dataclasses import dataclass, field
+from pathlib import Path
 
 # Core imports - always available
 from config import config
@@ -17,12 +24,19 @@ from .logger import GideonLogger
 
 # Optional imports with fallbacks
 try:
-    from openai import OpenAI  # ✅ NEW API (>= 1.0.0)
+    from openai import AsyncOpenAI  # ✅ NEW API (>= 1.0.0)
+    import httpx  # Installed with openai
     HAS_OPENAI = True
 except ImportError:
     HAS_OPENAI = False
     logging.warning("OpenAI not available - AI responses disabled")
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 try:
     import cv2
     HAS_OPENCV = True
@@ -31,14 +45,23 @@ except ImportError:
     logging.warning("OpenCV not available - video features disabled")
 
 try:
-    import mtcnn  # ✅ Alternative to face_recognition
-    from PIL import Image
     import numpy as np
-    HAS_FACE_DETECTION = True
+    # ✅ mtcnn (alternative to face_recognition) loads TensorFlow: only check
+    # that it is installed here, it is imported when actually needed
+    HAS_FACE_DETECTION = importlib.util.find_spec("mtcnn") is not None
 except ImportError:
     HAS_FACE_DETECTION = False
+if not HAS_FACE_DETECTION:
     logging.warning("Face detection not available - using dummy authentication")
 
+try:
+    import onnxruntime as ort  # ✅ Single-shot face detector (RetinaFace)
+    import numpy as np
+    HAS_ONNX = True
+except ImportError:
+    HAS_ONNX = False
+    logging.warning("ONNX Runtime not available - using MTCNN for live detection")
+
 try:
     import speech_recognition as sr
     HAS_SPEECH_RECOGNITION = True
@@ -46,6 +69,13 @@ except ImportError:
     HAS_SPEECH_RECOGNITION = False
     logging.warning("Speech recognition not available")
 
+try:
+    from vosk import Model as VoskModel, KaldiRecognizer  # ✅ Local streaming ASR
+    HAS_VOSK = True
+except ImportError:
+    HAS_VOSK = False
+    logging.warning("Vosk not available - using cloud speech recognition")
+
 try:
     import pyttsx3
     HAS_TTS = True
@@ -60,12 +90,37 @@ except ImportError:
     HAS_AUDIO = False
     logging.warning("Audio input not available")
 
+# Sentence boundary used to hand streamed AI output to TTS
+SENTENCE_END = re.compile(r'[.!?]\s')
+
+RESPONSE_CACHE_SIZE = 256
+
+def _retinaface_priors(width: int, height: int) -> "np.ndarray":
+    """RetinaFace anchor boxes (cx, cy, w, h), normalized, for one input size"""
+    priors = []
+    for step, min_sizes in ((8, (16, 32)), (16, (64, 128)), (32, (256, 512))):
+        rows, cols = -(-height // step), -(-width // step)
+        cy, cx = np.meshgrid((np.arange(rows) + 0.5) * step / height,
+                             (np.arange(cols) + 0.5) * step / width, indexing='ij')
+        sizes = np.asarray(min_sizes, dtype=np.float32)
+        layer = np.empty((rows, cols, len(min_sizes), 4), dtype=np.float32)
+        layer[..., 0] = cx[..., None]
+        layer[..., 1] = cy[..., None]
+        layer[..., 2] = sizes / width
+        layer[..., 3] = sizes / height
+        priors.append(layer.reshape(-1, 4))
+    return np.concatenate(priors)
+
 @dataclass
 class VoiceCommand:
     """Voice command data structure"""
     text: str
     confidence: float
     timestamp: float
+    text_lower: str = field(default="", init=False, repr=False)  # Normalized once
+    
+    def __post_init__(self):
+        self.text_lower = self.text.lower()
 
 class GideonCoreFixed:
     """
@@ -73,19 +128,65 @@ class GideonCoreFixed:
     Graceful degradation when dependencies are missing
     """
     
+    # Built-in command triggers, matched in a single pass
+    _CMD_RE = re.compile(r"(?P<vscode>ouvre vs code|open vs code)|(?P<search>recherche|search)",
+                         re.IGNORECASE)
+    
+    # Offline answers (the "time" answer is built only when it matches)
+    _FALLBACK = {
+        "hello": "Hello! I'm Gideon, running in offline mode.",
+        "weather": "I cannot check weather in offline mode.",
+        "help": "I'm running with limited functionality. OpenAI is not available."
+    }
+    
     def __init__(self):
         self.logger = GideonLogger()
         self.event_system = EventSystem()
         
+        # Hot-path settings and availability flags, bound once
+        self._timeout = config.audio.TIMEOUT
+        self._lang = config.audio.VOICE_RECOGNITION_LANGUAGE
+        self._recalibration_interval = config.audio.RECALIBRATION_INTERVAL
+        self._model = config.ai.OPENAI_MODEL
+        self._max_tokens = config.ai.MAX_TOKENS
+        self._temp = config.ai.TEMPERATURE
+        self._sys_prompt = config.ai.SYSTEM_PROMPT
+        self._system_msg = {"role": "system", "content": self._sys_prompt}  # Lu seulement par les clients
+        self._has_tts = HAS_TTS
+        self._has_sr = HAS_SPEECH_RECOGNITION
+        self._has_audio = HAS_AUDIO
+        self._has_opencv = HAS_OPENCV
+        
+        # Repeated prompts (without context) reuse the previous answer at any
+        # temperature; the key includes the model and temperature used
+        self._resp_cache = OrderedDict()
+        
+        # Network I/O (chat and speech streams) runs on one asyncio loop in a
+        # background thread; the public methods stay synchronous
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        
         # Initialize AI with new API
         self.openai_client = None
         if HAS_OPENAI:
             try:
-                self.openai_client = OpenAI(api_key=config.ai.OPENAI_API_KEY)
+                # Pooled keep-alive connections (HTTP/2 when h2 is installed)
+                self.openai_client = AsyncOpenAI(
+                    api_key=os.getenv('OPENAI_API_KEY'),
+                    http_client=httpx.AsyncClient(
+                        http2=HAS_HTTP2,
+                        timeout=httpx.Timeout(30.0, connect=5.0),
+                        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120)
+                    )
+                )
+                self._warm_up_openai()
                 self.logger.info("✅ OpenAI client initialized (new API)")
             except Exception as e:
                 self.logger.error(f"❌ OpenAI initialization failed: {e}")
-                HAS_OPENAI = False
+        
+        # Reflects whether the client actually initialized, not just the import
+        self._has_openai = self.openai_client is not None
         
         # Initialize TTS
         self.tts = None
@@ -97,39 +198,118 @@ class GideonCoreFixed:
             except Exception as e:
                 self.logger.error(f"❌ TTS initialization failed: {e}")
         
+        # Without any voice output, speak() prints inline instead of queueing
+        self._can_speak = (self._has_audio and self._has_openai) or self.tts is not None
+        
+        # Speech is serialized through a queue drained by one worker thread
+        self._tts_queue = queue.Queue()
+        self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+        self._tts_thread.start()
+        
         # Initialize speech recognition
         self.recognizer = None
         self.microphone = None
+        self._mic_source = None
+        self._calibrated_at = 0.0
         if HAS_SPEECH_RECOGNITION:
             try:
                 self.recognizer = sr.Recognizer()
                 self.microphone = sr.Microphone()
+                
+                # Calibrate once; listen_once only recalibrates periodically
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
+                self._calibrated_at = time.time()
                 self.logger.info("✅ Speech recognition initialized")
             except Exception as e:
                 self.logger.error(f"❌ Speech recognition failed: {e}")
         
+        # Local streaming recognizer (Vosk), preferred over the Google API
+        self._vosk = None
+        if HAS_VOSK and HAS_AUDIO and config.audio.ASR_BACKEND == "local":
+            try:
+                self._vosk = KaldiRecognizer(
+                    VoskModel(config.audio.VOSK_MODEL_PATH), config.audio.SAMPLE_RATE
+                )
+                self.logger.info("✅ Local speech recognition initialized (Vosk)")
+            except Exception as e:
+                self.logger.error(f"❌ Vosk initialization failed: {e}")
+        
+        # Live face detection: RetinaFace-mobilenet through ONNX Runtime
+        # (int8 model preferred), MTCNN below stays the fallback
+        self.face_session = None
+        if HAS_ONNX:
+            try:
+                options = ort.SessionOptions()
+                options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                model_path = config.vision.FACE_DETECTOR_MODEL_INT8
+                if not Path(model_path).exists():
+                    model_path = config.vision.FACE_DETECTOR_MODEL
+                self.face_session = ort.InferenceSession(
+                    model_path, sess_options=options, providers=['CPUExecutionProvider']
+                )
+                self._face_input = self.face_session.get_inputs()[0].name
+                self._face_priors = _retinaface_priors(*config.vision.DETECTOR_INPUT_SIZE)
+                self.logger.info(f"✅ RetinaFace detector initialized (ONNX: {model_path})")
+            except Exception as e:
+                self.face_session = None
+                self.logger.error(f"❌ RetinaFace initialization failed: {e}")
+        
         # Initialize face detection (simplified)
         self.face_detector = None
         self.user_face_encoding = None
-        if HAS_FACE_DETECTION:
+        width, height = config.vision.CAMERA_RESOLUTION
+        self._det_hw = (height, width)  # Detector input size (live frames)
+        if self.face_session is not None:
+            # The ONNX detector covers both the photo and live frames, so the
+            # TensorFlow-based MTCNN is never loaded
+            self._load_user_face()
+        elif HAS_FACE_DETECTION:
             try:
+                import mtcnn
                 self.face_detector = mtcnn.MTCNN()
+                self._warm_up_face_detector()
                 self._load_user_face()
                 self.logger.info("✅ Face detection initialized")
             except Exception as e:
                 self.logger.error(f"❌ Face detection failed: {e}")
         
         # System state
-        self.is_listening = False
+        self._listening = threading.Event()
         self.is_speaking = False
         self.is_authenticated = False
-        self.voice_queue = queue.Queue()
+        
+        # Voice commands: single producer (listen loop), single consumer
+        self._voice_dq = deque()
+        self._voice_evt = threading.Event()
         
         # Threading
         self.voice_thread = None
         
+        # Continuous local recognition: the input stream callback fills a
+        # ring buffer that the listen loop drains
+        self._audio_stream = None
+        self._ring = deque(maxlen=50)
+        self._audio_ready = threading.Event()
+        
         self.logger.info("Gideon Core (Fixed) initialized successfully")
     
+    @property
+    def is_listening(self) -> bool:
+        """True while continuous listening is running"""
+        return self._listening.is_set()
+    
+    def _warm_up_openai(self):
+        """Open the API connection (TCP + TLS) in the background before the first prompt"""
+        async def _list_models():
+            await self.openai_client.models.list()
+        
+        def _done(future):
+            if future.exception():
+                self.logger.debug(f"OpenAI warm-up failed: {future.exception()}")
+        
+        asyncio.run_coroutine_threadsafe(_list_models(), self._loop).add_done_callback(_done)
+    
     def _configure_tts(self):
         """Configure text-to-speech settings"""
         if not self.tts:
@@ -149,27 +329,55 @@ class GideonCoreFixed:
         except Exception as e:
             self.logger.error(f"TTS configuration error: {e}")
     
+    def _warm_up_face_detector(self):
+        """Run MTCNN once on a blank frame so its graph is built before real use"""
+        try:
+            start = time.perf_counter()
+            self.face_detector.detect_faces(np.zeros((*self._det_hw, 3), dtype=np.uint8))
+            self.logger.info(f"Face detector warmed up in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            self.logger.warning(f"Face detector warm-up failed: {e}")
+    
     def _load_user_face(self):
         """Load user face with simplified detection"""
-        if not HAS_FACE_DETECTION or not HAS_OPENCV:
+        if (self.face_detector is None and self.face_session is None) or not self._has_opencv:
             return
             
         try:
             # Load image
-            image = cv2.imread(config.face_recognition.USER_PHOTO_PATH)
+            image = cv2.imread(config.vision.USER_REFERENCE_IMAGE)
             if image is None:
                 self.logger.warning("User photo not found - face auth disabled")
                 return
             
-            # Convert to RGB
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(rgb_image)
+            # MTCNN cost grows with pixel count: shrink the photo to the
+            # detector resolution first (the stored box is mapped back below)
+            height, width = image.shape[:2]
+            det_height, det_width = self._det_hw
+            scale = min(det_width / width, det_height / height, 1.0)
+            if scale < 1.0:
+                image = cv2.resize(image, None, fx=scale, fy=scale,
+                                   interpolation=cv2.INTER_AREA)
             
             # Detect faces
-            faces = self.face_detector.detect_faces(np.array(pil_image))
+            if self.face_session is not None:
+                faces = [{'box': [x1, y1, x2 - x1, y2 - y1]}
+                         for x1, y1, x2, y2 in self._detect_faces(image).tolist()]
+            else:
+                # Convert to RGB in place - the photo buffer is ours, no
+                # second W*H*3 allocation (MTCNN takes the array directly)
+                cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+                faces = self.face_detector.detect_faces(image)
             
             if faces:
-                self.user_face_encoding = faces[0]  # Store first face info
+                # Store first face info, box in original photo coordinates
+                face = faces[0]
+                if scale < 1.0:
+                    face = {**face, 'box': [round(v / scale) for v in face['box']]}
+                    if 'keypoints' in face:
+                        face['keypoints'] = {name: (round(x / scale), round(y / scale))
+                                             for name, (x, y) in face['keypoints'].items()}
+                self.user_face_encoding = face
                 self.logger.info("User face loaded successfully")
             else:
                 self.logger.warning("No face detected in user photo")
@@ -180,75 +388,164 @@ class GideonCoreFixed:
     def speak(self, text: str, priority: bool = False):
         """
         Speak text with TTS - with fallback
-        """
-        if priority and self.is_speaking:
-            if self.tts:
-                self.tts.stop()
         
-        def _speak():
-            self.is_speaking = True
+        Texts are queued for the TTS worker; a priority text drops whatever
+        is still waiting and interrupts the current utterance
+        """
+        if not self._can_speak and not config.audio.SIMULATE_TTS_DELAY:
+            # Console only: nothing to wait for, no worker round-trip
             self.event_system.emit('speech_started', {'text': text})
-            
             self.logger.info(f"🗣️ Speaking: {text}")
-            
-            if HAS_TTS and self.tts:
-                try:
-                    self.tts.say(text)
-                    self.tts.runAndWait()
-                except Exception as e:
-                    self.logger.error(f"TTS error: {e}")
-                    print(f"SPEECH: {text}")  # Fallback to console
-            else:
-                print(f"🗣️ GIDEON: {text}")  # Console fallback
-                time.sleep(len(text) * 0.05)  # Simulate speech time
-            
-            self.is_speaking = False
+            print(f"🗣️ GIDEON: {text}")  # Console fallback
             self.event_system.emit('speech_ended', {'text': text})
+            return
+        
+        if priority:
+            self._flush_tts_queue()
+            if self.is_speaking and self.tts:
+                self.tts.stop()
+        
+        self._tts_queue.put(text)
+    
+    def _flush_tts_queue(self):
+        """Discard texts that have not been spoken yet"""
+        while True:
+            try:
+                self._tts_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._tts_queue.task_done()
+    
+    def _tts_worker(self):
+        """Speak queued texts one after another"""
+        while True:
+            text = self._tts_queue.get()
+            try:
+                if text is None:
+                    break
+                self._speak(text)
+            finally:
+                self._tts_queue.task_done()
+    
+    def _speak(self, text: str):
+        """Speak one text - streamed OpenAI speech, then pyttsx3, then console"""
+        self.is_speaking = True
+        self.event_system.emit('speech_started', {'text': text})
+        
+        self.logger.info(f"🗣️ Speaking: {text}")
+        
+        if self._stream_openai_speech(text):
+            pass
+        elif self._has_tts and self.tts:
+            try:
+                self.tts.say(text)
+                self.tts.runAndWait()
+            except Exception as e:
+                self.logger.error(f"TTS error: {e}")
+                print(f"SPEECH: {text}")  # Fallback to console
+        else:
+            print(f"🗣️ GIDEON: {text}")  # Console fallback
+            if config.audio.SIMULATE_TTS_DELAY:
+                time.sleep(len(text) * 0.05)  # Simulate speech time
         
-        threading.Thread(target=_speak, daemon=True).start()
+        self.is_speaking = False
+        self.event_system.emit('speech_ended', {'text': text})
+    
+    def _stream_openai_speech(self, text: str) -> bool:
+        """
+        Play OpenAI speech while it is being synthesized: PCM chunks are
+        written to the output stream as they arrive
+        
+        Returns:
+            True if the text was spoken, False to use the local fallback
+        """
+        if not self._has_audio or not self.openai_client:
+            return False
+        
+        try:
+            self._run(self._stream_openai_speech_async(text))
+            return True
+        except Exception as e:
+            self.logger.error(f"Streaming TTS error: {e}")
+            return False
+    
+    async def _stream_openai_speech_async(self, text: str):
+        """Download speech on the event loop; blocking audio writes go to a thread"""
+        with sd.RawOutputStream(
+            samplerate=config.audio.OPENAI_TTS_SAMPLE_RATE, channels=1, dtype='int16'
+        ) as stream:
+            async with self.openai_client.audio.speech.with_streaming_response.create(
+                model=config.audio.OPENAI_TTS_MODEL,
+                voice=config.audio.OPENAI_TTS_VOICE,
+                input=text,
+                response_format="pcm"
+            ) as response:
+                async for chunk in response.iter_bytes(4096):
+                    await asyncio.to_thread(stream.write, chunk)
+    
+    def _run(self, coroutine) -> Any:
+        """Run a coroutine on the core event loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    def _iterate(self, async_iterator: AsyncIterator) -> Iterator:
+        """Consume an async iterator running on the core event loop from this thread"""
+        items = queue.Queue()
+        done = object()
+        
+        async def _drain():
+            try:
+                async for item in async_iterator:
+                    items.put(item)
+            finally:
+                items.put(done)
+        
+        future = asyncio.run_coroutine_threadsafe(_drain(), self._loop)
+        while (item := items.get()) is not done:
+            yield item
+        future.result()  # Re-raise any streaming error
+    
+    async def listen_once_async(self) -> Optional[VoiceCommand]:
+        """listen_once for asyncio callers - the blocking capture runs in a thread"""
+        return await asyncio.to_thread(self.listen_once)
     
     def listen_once(self) -> Optional[VoiceCommand]:
         """
         Listen for voice command - with fallback
         """
-        if not HAS_SPEECH_RECOGNITION or not self.recognizer or not self.microphone:
+        if self._vosk is not None:
+            return self._listen_locally()
+        
+        if not self._has_sr or not self.recognizer or not self.microphone:
             # Fallback: simulate listening
             self.logger.debug("Speech recognition not available - using dummy")
             return None
         
         try:
-            with self.microphone as source:
-                self.logger.debug("🎤 Listening for command...")
-                self.event_system.emit('listening_started')
-                
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                
-                # Listen with timeout
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=config.audio.VOICE_RECOGNITION_TIMEOUT,
-                    phrase_time_limit=10
-                )
-                
-                self.event_system.emit('listening_ended')
-                
-                # Recognize speech
-                text = self.recognizer.recognize_google(
-                    audio, 
-                    language=config.audio.VOICE_RECOGNITION_LANGUAGE
-                )
-                
-                command = VoiceCommand(
-                    text=text,
-                    confidence=1.0,
-                    timestamp=time.time()
-                )
-                
-                self.logger.info(f"🎤 Heard: {text}")
-                self.event_system.emit('voice_command', {'command': command})
-                
-                return command
+            # Reuse the stream kept open by continuous listening
+            if self._mic_source is not None:
+                audio = self._record_command(self._mic_source)
+            else:
+                with self.microphone as source:
+                    audio = self._record_command(source)
+            
+            self.event_system.emit('listening_ended')
+            
+            # Recognize speech
+            text = self.recognizer.recognize_google(
+                audio, 
+                language=self._lang
+            )
+            
+            command = VoiceCommand(
+                text=text,
+                confidence=1.0,
+                timestamp=time.time()
+            )
+            
+            self.logger.info(f"🎤 Heard: {text}")
+            self.event_system.emit('voice_command', {'command': command})
+            
+            return command
                 
         except sr.WaitTimeoutError:
             self.logger.debug("Voice recognition timeout")
@@ -260,149 +557,433 @@ class GideonCoreFixed:
             self.logger.error(f"Voice recognition error: {e}")
             return None
     
+    def _listen_locally(self) -> Optional[VoiceCommand]:
+        """
+        Recognize one phrase with Vosk while the audio is being captured -
+        no network round-trip, the result is ready as soon as the phrase ends
+        """
+        block_size = config.audio.SAMPLE_RATE // 4  # 250 ms
+        deadline = time.monotonic() + config.audio.TIMEOUT + config.audio.PHRASE_TIME_LIMIT
+        
+        try:
+            self.logger.debug("🎤 Listening for command...")
+            self.event_system.emit('listening_started')
+            
+            text = ""
+            with sd.RawInputStream(samplerate=config.audio.SAMPLE_RATE, blocksize=block_size,
+                                   dtype='int16', channels=1) as stream:
+                while time.monotonic() < deadline:
+                    data, _ = stream.read(block_size)
+                    if self._vosk.AcceptWaveform(bytes(data)):
+                        text = json.loads(self._vosk.Result())["text"]
+                        break
+                else:
+                    text = json.loads(self._vosk.FinalResult())["text"]
+            
+            self.event_system.emit('listening_ended')
+            
+            if not text:
+                self.logger.debug("Could not understand audio")
+                return None
+            
+            return self._make_command(text)
+            
+        except Exception as e:
+            self.logger.error(f"Voice recognition error: {e}")
+            return None
+    
+    def _make_command(self, text: str) -> VoiceCommand:
+        """Build and announce a recognized voice command"""
+        command = VoiceCommand(
+            text=text,
+            confidence=1.0,
+            timestamp=time.time()
+        )
+        
+        self.logger.info(f"🎤 Heard: {text}")
+        self.event_system.emit('voice_command', {'command': command})
+        
+        return command
+    
+    def _record_command(self, source) -> "sr.AudioData":
+        """Record one phrase, recalibrating for ambient noise only when stale"""
+        self.logger.debug("🎤 Listening for command...")
+        self.event_system.emit('listening_started')
+        
+        if time.time() - self._calibrated_at > self._recalibration_interval:
+            self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+            self._calibrated_at = time.time()
+        
+        # Listen with timeout
+        return self.recognizer.listen(
+            source, 
+            timeout=self._timeout,
+            phrase_time_limit=10
+        )
+    
+    def _detect_faces(self, bgr_frame: "np.ndarray") -> "np.ndarray":
+        """
+        Detect faces in a BGR frame
+        
+        Returns:
+            Array of boxes (x1, y1, x2, y2) in frame pixels
+        """
+        height, width = bgr_frame.shape[:2]
+        
+        if self.face_session is None:
+            faces = self.face_detector.detect_faces(cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB))
+            boxes = [(x, y, x + w, y + h) for x, y, w, h in (face['box'] for face in faces)
+                     if face['confidence'] >= config.vision.CONFIDENCE_THRESHOLD]
+            return np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        
+        # Single-shot detector at a fixed small input size: resize, BGR mean
+        # subtraction and NCHW float32 layout in one pass, straight from BGR
+        blob = cv2.dnn.blobFromImage(bgr_frame, 1.0, config.vision.DETECTOR_INPUT_SIZE,
+                                     mean=(104, 117, 123), swapRB=False)
+        loc, conf = self.face_session.run(None, {self._face_input: blob})[:2]
+        
+        scores = conf[0, :, 1]
+        keep = scores >= config.vision.CONFIDENCE_THRESHOLD
+        if not keep.any():
+            return np.empty((0, 4), dtype=np.float32)
+        
+        # Decode anchor offsets for the kept priors only (variances 0.1 / 0.2)
+        priors = self._face_priors[keep]
+        loc = loc[0, keep]
+        centers = priors[:, :2] + loc[:, :2] * 0.1 * priors[:, 2:]
+        sizes = priors[:, 2:] * np.exp(loc[:, 2:] * 0.2)
+        boxes = np.hstack([centers - sizes / 2, centers + sizes / 2]) * (width, height, width, height)
+        
+        # Non-maximum suppression on (x, y, w, h) boxes
+        rects = np.hstack([boxes[:, :2], boxes[:, 2:] - boxes[:, :2]])
+        selected = cv2.dnn.NMSBoxes(rects.tolist(), scores[keep].tolist(),
+                                    config.vision.CONFIDENCE_THRESHOLD, 0.4)
+        return boxes[np.asarray(selected, dtype=int).reshape(-1)]
+    
+    def detect_user_presence(self) -> bool:
+        """
+        Look for any face in front of the webcam for up to MAX_DETECTION_TIME
+        
+        Presence only: the detected face is never compared with the user's
+        reference photo, so this says nothing about identity
+        """
+        if not self._has_opencv or (self.face_session is None and self.face_detector is None):
+            return False
+        
+        webcam = cv2.VideoCapture(0)
+        if not webcam.isOpened():
+            self.logger.error("Could not open webcam")
+            return False
+        
+        present = False
+        deadline = time.monotonic() + config.vision.MAX_DETECTION_TIME
+        try:
+            while time.monotonic() < deadline:
+                ret, frame = webcam.read()
+                if not ret:
+                    continue
+                if len(self._detect_faces(frame)):
+                    present = True
+                    break
+        except Exception as e:
+            self.logger.error(f"Face detection error: {e}")
+        finally:
+            webcam.release()
+        
+        return present
+    
     def authenticate_user(self) -> bool:
         """
-        Authenticate user - with fallback to dummy auth
+        Authenticate user - simulated, no face identity matching in this core
+        
+        The webcam check only reports whether a face is present; it is logged
+        for information and never grants or denies access
         """
-        if not HAS_FACE_DETECTION or not HAS_OPENCV:
+        if not self._has_opencv or (self.face_session is None and self.face_detector is None):
             self.logger.info("Face recognition not available - using dummy authentication")
             self.speak("Face recognition not available. Authentication simulated.")
-            self.is_authenticated = True
-            self.event_system.emit('user_authenticated')
-            return True
-        
-        self.logger.info("Starting face recognition authentication...")
-        self.speak("Searching for your face...")
-        
-        # Simplified authentication simulation
-        self.logger.info("Simulating face detection...")
-        time.sleep(2)
+        elif self.detect_user_presence():
+            self.logger.info("Face present, identity not verified - authentication simulated")
+            self.speak("Face detected. Identity not verified, authentication simulated.")
+        else:
+            self.logger.info("No face detected - authentication simulated")
+            self.speak("No face detected. Authentication simulated.")
         
         self.is_authenticated = True
-        self.logger.info("User authenticated successfully")
-        self.speak("Hello! Authentication successful. I'm at your service.")
         self.event_system.emit('user_authenticated')
-        
         return True
     
-    def generate_ai_response(self, prompt: str, context: dict = None) -> str:
+    def generate_ai_response(self, prompt: str, context: dict = None,
+                             stream: bool = False) -> Union[str, Iterator[str]]:
         """
         Generate AI response using NEW OpenAI API
+        
+        With stream=True, returns an iterator over the response text as it
+        is generated instead of the full string
         """
-        if not HAS_OPENAI or not self.openai_client:
+        if stream:
+            return self._stream_ai_response(prompt, context)
+        
+        cache_key = (prompt, self._model, self._temp)
+        cacheable = not context
+        if cacheable and cache_key in self._resp_cache:
+            self._resp_cache.move_to_end(cache_key)
+            return self._resp_cache[cache_key]
+        
+        if not self._has_openai:
             # Fallback responses
-            fallback_responses = {
-                "hello": "Hello! I'm Gideon, running in offline mode.",
-                "time": f"The current time is {time.strftime('%H:%M:%S')}",
-                "weather": "I cannot check weather in offline mode.",
-                "help": "I'm running with limited functionality. OpenAI is not available."
-            }
-            
             prompt_lower = prompt.lower()
-            for key, response in fallback_responses.items():
+            if "hello" in prompt_lower:
+                return self._FALLBACK["hello"]
+            if "time" in prompt_lower:
+                return f"The current time is {time.strftime('%H:%M:%S')}"
+            for key, response in self._FALLBACK.items():
                 if key in prompt_lower:
                     return response
             
             return "I'm running in offline mode. Please check your OpenAI configuration."
         
         try:
-            messages = [
-                {"role": "system", "content": config.ai.SYSTEM_PROMPT}
-            ]
-            
-            if context:
-                context_str = f"Context: {context}"
-                messages.append({"role": "system", "content": context_str})
-            
-            messages.append({"role": "user", "content": prompt})
-            
-            # ✅ NEW OpenAI API (>= 1.0.0)
-            response = self.openai_client.chat.completions.create(
-                model=config.ai.MODEL,
-                messages=messages,
-                max_tokens=config.ai.MAX_TOKENS,
-                temperature=config.ai.TEMPERATURE
-            )
-            
-            ai_response = response.choices[0].message.content
+            ai_response = self._run(self.generate_ai_response_async(prompt, context))
             self.logger.info(f"AI Response generated for: {prompt[:50]}...")
             
+            if cacheable:
+                self._store_response(cache_key, ai_response)
             return ai_response
             
         except Exception as e:
             self.logger.error(f"AI response generation failed: {e}")
             return "I'm sorry, I'm having trouble processing that request right now."
     
+    def _stream_ai_response(self, prompt: str, context: dict = None) -> Iterator[str]:
+        """Yield the AI response piece by piece as OpenAI generates it"""
+        cache_key = (prompt, self._model, self._temp)
+        cacheable = not context
+        if cacheable and cache_key in self._resp_cache:
+            self._resp_cache.move_to_end(cache_key)
+            yield self._resp_cache[cache_key]
+            return
+        
+        if not self._has_openai:
+            yield self.generate_ai_response(prompt, context)
+            return
+        
+        parts = []
+        try:
+            for content in self._iterate(self._stream_ai_response_async(prompt, context)):
+                parts.append(content)
+                yield content
+        except Exception as e:
+            self.logger.error(f"AI response streaming failed: {e}")
+            yield " I'm sorry, I'm having trouble processing that request right now."
+            return
+        
+        self.logger.info(f"AI Response streamed for: {prompt[:50]}...")
+        if cacheable:
+            self._store_response(cache_key, "".join(parts))
+    
+    def _build_messages(self, prompt: str, context: dict = None) -> list:
+        """Build chat messages for the AI from a prompt and optional context"""
+        messages = [self._system_msg]
+        
+        if context:
+            context_str = f"Context: {context}"
+            messages.append({"role": "system", "content": context_str})
+        
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    async def generate_ai_response_async(self, prompt: str, context: dict = None) -> str:
+        """One chat completion on the event loop (errors propagate)"""
+        # ✅ NEW OpenAI API (>= 1.0.0)
+        response = await self.openai_client.chat.completions.create(
+            model=self._model,
+            messages=self._build_messages(prompt, context),
+            max_tokens=self._max_tokens,
+            temperature=self._temp
+        )
+        return response.choices[0].message.content
+    
+    async def _stream_ai_response_async(self, prompt: str,
+                                         context: dict = None) -> AsyncIterator[str]:
+        """Yield chat completion deltas as they arrive (errors propagate)"""
+        stream = await self.openai_client.chat.completions.create(
+            model=self._model,
+            messages=self._build_messages(prompt, context),
+            max_tokens=self._max_tokens,
+            temperature=self._temp,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    def _store_response(self, cache_key: tuple, response: str):
+        """Add a response to the LRU cache"""
+        self._resp_cache[cache_key] = response
+        if len(self._resp_cache) > RESPONSE_CACHE_SIZE:
+            self._resp_cache.popitem(last=False)
+    
+    def _speak_streamed(self, chunks: Iterator[str]) -> str:
+        """Queue each complete sentence for TTS as soon as it is generated"""
+        buffer = ""
+        full_response = []
+        for chunk in chunks:
+            buffer += chunk
+            full_response.append(chunk)
+            while (match := SENTENCE_END.search(buffer)):
+                sentence, buffer = buffer[:match.end()], buffer[match.end():]
+                self.speak(sentence.strip())
+        if buffer.strip():
+            self.speak(buffer.strip())
+        return "".join(full_response).strip()
+    
     def start_continuous_listening(self):
         """Start continuous voice listening - if available"""
-        if not HAS_SPEECH_RECOGNITION:
+        if not self._has_sr and self._vosk is None:
             self.logger.warning("Cannot start listening - speech recognition not available")
             return
             
         if self.is_listening:
             return
         
-        self.is_listening = True
+        self._listening.set()
         
-        def _listen_loop():
-            while self.is_listening:
-                command = self.listen_once()
-                if command:
-                    self.voice_queue.put(command)
-                time.sleep(0.1)
+        if self._vosk is not None:
+            # Audio arrives through the stream callback: no polling, no
+            # per-phrase stream open/close
+            self._ring.clear()
+            try:
+                self._audio_stream = sd.RawInputStream(
+                    samplerate=config.audio.SAMPLE_RATE,
+                    blocksize=config.audio.SAMPLE_RATE // 10,  # 100 ms
+                    dtype='int16', channels=1, callback=self._on_audio
+                )
+                self._audio_stream.start()
+            except Exception as e:
+                self.logger.error(f"Failed to open audio stream: {e}")
+            _listen_loop = self._streaming_listen_loop
+        else:
+            # Keep one microphone stream open for the whole listening session
+            try:
+                self._mic_source = self.microphone.__enter__()
+            except Exception as e:
+                self.logger.error(f"Failed to open microphone stream: {e}")
+            
+            def _listen_loop():
+                while self.is_listening:
+                    command = self.listen_once()
+                    if command:
+                        self._push_voice_command(command)
         
         self.voice_thread = threading.Thread(target=_listen_loop, daemon=True)
         self.voice_thread.start()
         
         self.logger.info("Continuous listening started")
     
+    def _on_audio(self, data, frames, time_info, status):
+        """Input stream callback: queue the block and wake the listen loop"""
+        self._ring.append(bytes(data))
+        self._audio_ready.set()
+    
+    def _streaming_listen_loop(self):
+        """Feed buffered audio to Vosk as it arrives and queue each phrase"""
+        while self.is_listening:
+            self._audio_ready.wait()
+            self._audio_ready.clear()
+            
+            while self._ring:
+                if self._vosk.AcceptWaveform(self._ring.popleft()):
+                    text = json.loads(self._vosk.Result())["text"]
+                    if text:
+                        self._push_voice_command(self._make_command(text))
+    
     def stop_continuous_listening(self):
         """Stop continuous listening"""
-        self.is_listening = False
+        self._listening.clear()
+        self._audio_ready.set()  # Wake the streaming loop immediately
         if self.voice_thread:
             self.voice_thread.join(timeout=2)
         
+        if self._audio_stream is not None:
+            try:
+                self._audio_stream.stop()
+                self._audio_stream.close()
+            except Exception as e:
+                self.logger.error(f"Failed to close audio stream: {e}")
+            self._audio_stream = None
+        
+        if self._mic_source is not None:
+            self._mic_source = None
+            try:
+                self.microphone.__exit__(None, None, None)
+            except Exception as e:
+                self.logger.error(f"Failed to close microphone stream: {e}")
+        
         self.logger.info("Continuous listening stopped")
     
     def get_next_voice_command(self, timeout: float = None) -> Optional[VoiceCommand]:
         """Get next voice command from queue"""
+        if not self._voice_dq:
+            self._voice_evt.clear()
+            # Re-check after clearing so a command pushed meanwhile is not missed
+            if not self._voice_dq:
+                self._voice_evt.wait(timeout)
         try:
-            return self.voice_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self._voice_dq.popleft()
+        except IndexError:
             return None
     
-    def process_voice_command(self, command: VoiceCommand) -> str:
-        """Process voice command and generate response"""
-        command_text = command.text.lower()
+    def _push_voice_command(self, command: VoiceCommand):
+        """Hand a recognized command to get_next_voice_command"""
+        self._voice_dq.append(command)
+        self._voice_evt.set()
+    
+    def process_voice_command(self, command: VoiceCommand, speak: bool = False) -> str:
+        """
+        Process voice command and generate response
+        
+        With speak=True the response is also spoken - AI responses sentence
+        by sentence while they are generated - and the caller must not speak
+        the returned text again; the full text is returned either way
+        """
+        command_text = command.text_lower
         
         self.logger.info(f"Processing command: {command.text}")
         self.event_system.emit('command_processing', {'command': command})
         
         # Built-in commands
-        if any(phrase in command_text for phrase in ["ouvre vs code", "open vs code"]):
+        match = self._CMD_RE.search(command_text)
+        if match and match.lastgroup == 'vscode':
             response = "Opening Visual Studio Code."
             self.event_system.emit('system_command', {'action': 'open_vscode'})
-            return response
             
-        elif "recherche" in command_text or "search" in command_text:
-            search_term = command_text.replace("recherche", "").replace("search", "").strip()
+        elif match and match.lastgroup == 'search':
+            search_term = command_text[match.end():].strip()
             response = f"Searching for: {search_term}"
             self.event_system.emit('web_search', {'query': search_term})
-            return response
         
         # Default to AI response
-        response = self.generate_ai_response(command.text)
+        elif speak:
+            return self._speak_streamed(self.generate_ai_response(command.text, stream=True))
+        else:
+            return self.generate_ai_response(command.text)
+        
+        if speak:
+            self.speak(response)
         return response
     
     def get_system_status(self) -> dict:
         """Get status of all system components"""
         return {
-            "openai": HAS_OPENAI,
-            "speech_recognition": HAS_SPEECH_RECOGNITION,
-            "tts": HAS_TTS,
+            "openai": self._has_openai,
+            "speech_recognition": self._has_sr,
+            "local_speech_recognition": self._vosk is not None,
+            "tts": self._has_tts,
             "face_detection": HAS_FACE_DETECTION,
-            "opencv": HAS_OPENCV,
-            "audio": HAS_AUDIO,
+            "onnx_face_detection": self.face_session is not None,
+            "opencv": self._has_opencv,
+            "audio": self._has_audio,
             "authenticated": self.is_authenticated,
             "listening": self.is_listening,
             "speaking": self.is_speaking
@@ -419,6 +1000,8 @@ class GideonCoreFixed:
                 self.tts.stop()
             except:
                 pass
+        self._tts_queue.put(None)
+        self._loop.call_soon_threadsafe(self._loop.stop)
         
         self.event_system.emit('system_shutdown')
         self.logger.info("Gideon Core shutdown complete") 
\ No newline at end of file
@@ -3,33 +3,85 @@ Gideon AI Assistant Core - PRODUCTION VERSION
 100% LOCAL avec Ollama - AUCUNE dépendance OpenAI
 """
 
+import re
+import socket
+import sys
 import time
 import logging
 import threading
-from typing import Optional, Dict, List
-from collections import deque
-from dataclasses import dataclass
-import json
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from urllib.parse import urlsplit
 
-# Ollama local - AUCUNE dépendance externe
+# Parsing JSON rapide pour le flux Ollama (une ligne par token)
 try:
-    import requests
-    HAS_REQUESTS = True
+    from orjson import loads as json_loads
+    HAS_ORJSON = True
 except ImportError:
-    HAS_REQUESTS = False
+    from json import loads as json_loads
+    HAS_ORJSON = False
+
+# Clés de cache entières (xxh3 64 bits) si disponible
+try:
+    from xxhash import xxh3_64_intdigest
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
 
 from config import config
+from core.optionals import HAS_NUMPY, HAS_REQUESTS, HAS_SENTENCE_TRANSFORMERS
+
+# Fin de phrase : découpe du flux de réponse pour la synthèse vocale
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+RESPONSE_TIME_EMA_ALPHA = 1 / 32
+
+# Prompt système Ollama, partagé par tous les tours de conversation
+SYSTEM_PROMPT = """Tu es Gideon, assistant IA personnel français inspiré de la série Flash.
+
+PERSONNALITÉ :
+- Tu es intelligent, serviable et légèrement futuriste
+- Tu t'exprimes en français parfait et naturel
+- Tu es poli mais pas obséquieux  
+- Tu utilises un ton amical et professionnel
+
+RÈGLES STRICTES :
+- TOUJOURS répondre en français impeccable
+- Phrases courtes et claires (max 2 lignes pour synthèse vocale)
+- Éviter les anglicismes
+- Utiliser "vous" pour être poli
+- Réponses concises mais complètes
+
+EXEMPLES DE RÉPONSES :
+- "Bonjour ! Comment puis-je vous aider ?"
+- "Parfaitement compris. Je m'en occupe."
+- "Excellent choix ! Voici ce que je propose..."
+- "Désolé, pourriez-vous reformuler votre demande ?"
+
+IMPORTANT : Réponse COURTE (1-2 phrases max) pour la synthèse vocale française."""
 
+# Rôles des messages Ollama, internés une fois pour tout le module
+ROLE_SYSTEM = sys.intern("system")
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
 
-@dataclass
-class ConversationContext:
-    """Context de conversation pour mémoire intelligente"""
-    user_input: str
-    ai_response: str
-    timestamp: float
-    response_time: float
-    success: bool = True
-    fallback_used: bool = False
+# Préfixes du prompt Ollama par rôle de message
+ROLE_PREFIXES = {ROLE_SYSTEM: "System: ", ROLE_USER: "User: ", ROLE_ASSISTANT: "Assistant: "}
+
+# Sonde de disponibilité Ollama (secondes)
+OLLAMA_PROBE_TIMEOUT = 0.05
+OLLAMA_PROBE_TTL = 5.0
+
+
+@dataclass(slots=True)
+class AssistantStats:
+    """Compteurs d'AssistantCore : attributs à slots plutôt que clés de dict"""
+    total_requests: int = 0
+    ollama_responses: int = 0
+    fallback_responses: int = 0
+    cached_responses: int = 0
+    avg_response_time: float = 0.0
+    errors: int = 0
 
 
 class OllamaLocalClient:
@@ -42,22 +94,61 @@ class OllamaLocalClient:
         self.is_available = False
         self.logger = logging.getLogger("OllamaClient")
         
-        # Test de connectivité Ollama
-        self._test_connection()
+        # Sonde TCP : adresse du démon et fin de validité du dernier résultat
+        url = urlsplit(self.base_url)
+        self._address = (url.hostname, url.port or 80)
+        self._probe_expiry = 0.0
+        
+        # Session HTTP persistante : connexion keep-alive réutilisée entre les tours
+        self._session = None
+        if HAS_REQUESTS:
+            requests = HAS_REQUESTS.module
+            self._session = requests.Session()
+            self._session.mount("http://", requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=4
+            ))
+        
+        # Test de connectivité Ollama : sonde TCP puis vérification HTTP unique
+        if self._test_connection():
+            self._verify_api()
     
     def _test_connection(self) -> bool:
-        """Test si Ollama est disponible"""
+        """Test si Ollama est disponible
+        
+        Sonde TCP courte (pas de requête HTTP) ; le résultat est réutilisé
+        pendant OLLAMA_PROBE_TTL secondes pour ne pas re-sonder à chaque
+        vérification de statut.
+        """
         if not HAS_REQUESTS:
             return False
-            
+        
+        now = time.monotonic()
+        if now < self._probe_expiry:
+            return self.is_available
+        self._probe_expiry = now + OLLAMA_PROBE_TTL
+        
+        try:
+            with socket.create_connection(self._address, timeout=OLLAMA_PROBE_TIMEOUT):
+                pass
+        except OSError as e:
+            if self.is_available:
+                self.logger.warning("⚠️ Ollama non disponible: %s", e)
+            self.is_available = False
+            return False
+        
+        self.is_available = True
+        return True
+    
+    def _verify_api(self) -> bool:
+        """Vérifie une fois que le port ouvert répond bien à l'API Ollama"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=3)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=3)
             if response.status_code == 200:
                 self.is_available = True
                 self.logger.info("✅ Ollama connecté et fonctionnel")
                 return True
         except Exception as e:
-            self.logger.warning(f"⚠️ Ollama non disponible: {e}")
+            self.logger.warning("⚠️ Ollama non disponible: %s", e)
         
         self.is_available = False
         return False
@@ -67,123 +158,169 @@ class OllamaLocalClient:
         if not self.is_available or not HAS_REQUESTS:
             return {"error": "Ollama non disponible"}
         
+        try:
+            content = "".join(self.chat_completion_stream(messages, model))
+        except Exception as e:
+            self.logger.error("❌ Erreur Ollama: %s", e)
+            return {"error": str(e)}
+        
+        return {
+            "choices": [{
+                "message": {
+                    "content": content
+                }
+            }]
+        }
+    
+    def chat_completion_stream(self, messages: List[Dict], model: str = None) -> Iterator[str]:
+        """Génère une réponse Ollama morceau par morceau (stream JSON lines)
+        
+        Args:
+            messages: Messages role/content à envoyer au modèle
+            model: Modèle Ollama, `default_model` si None
+            
+        Yields:
+            Fragments de texte dès leur génération par Ollama
+            
+        Raises:
+            RuntimeError: si Ollama est indisponible ou répond une erreur HTTP
+        """
+        if not self.is_available or not HAS_REQUESTS:
+            raise RuntimeError("Ollama non disponible")
+        
         model = model or self.default_model
         
-        # Construire le prompt à partir des messages
-        prompt = ""
+        # Construire le prompt à partir des messages (un seul join)
+        parts = []
         for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            if role == "system":
-                prompt += f"System: {content}\n"
-            elif role == "user":
-                prompt += f"User: {content}\n"
-            elif role == "assistant":
-                prompt += f"Assistant: {content}\n"
-        
-        prompt += "Assistant: "
+            prefix = ROLE_PREFIXES.get(msg.get("role", ROLE_USER))
+            if prefix is not None:
+                parts.append(prefix)
+                parts.append(msg.get("content", ""))
+                parts.append("\n")
+        parts.append("Assistant: ")
+        prompt = "".join(parts)
         
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "top_p": 0.9,
-                        "max_tokens": 150
-                    }
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "choices": [{
-                        "message": {
-                            "content": data.get("response", "")
-                        }
-                    }]
+        with self._session.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": model,
+                "prompt": prompt,
+                "stream": True,
+                "options": {
+                    "temperature": 0.7,
+                    "top_p": 0.9,
+                    "max_tokens": 150
                 }
-            else:
-                return {"error": f"Ollama HTTP {response.status_code}"}
-                
-        except Exception as e:
-            self.logger.error(f"❌ Erreur Ollama: {e}")
-            return {"error": str(e)}
+            },
+            timeout=10,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"Ollama HTTP {response.status_code}")
+            
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json_loads(line)
+                chunk = data.get("response", "")
+                if chunk:
+                    yield chunk
+                if data.get("done"):
+                    break
+    
+    def close(self):
+        """Ferme la session HTTP et ses connexions poolées"""
+        if self._session is not None:
+            self._session.close()
 
 
 class IntelligentFallbacks:
     """Système de fallbacks intelligents sans aucune dépendance externe"""
     
-    def __init__(self):
-        self.responses = {
-            # Réponses contextuelles
-            'greeting': [
-                "Hello! I'm Gideon, your local AI assistant. How can I help you today?",
-                "Hi there! I'm running entirely on your system. What can I do for you?",
-                "Greetings! Your local AI assistant is ready to assist you."
-            ],
-            'farewell': [
-                "Goodbye! Feel free to ask me anything anytime.",
-                "See you later! I'll be here when you need me.",
-                "Take care! I'm always ready to help."
-            ],
-            'time': [
-                f"The current time is {time.strftime('%H:%M:%S')}",
-                f"It's currently {time.strftime('%I:%M %p')}",
-                f"Right now it's {time.strftime('%H:%M')}"
-            ],
-            'weather': [
-                "I don't have current weather data, but I can help you find weather services.",
-                "For weather information, I'd recommend checking your local weather app.",
-                "I can't access weather data right now, but I can help with other tasks."
-            ],
-            'general': [
-                "I'm here to help! Could you be more specific about what you need?",
-                "I'm your local AI assistant. How can I assist you today?",
-                "I'm ready to help with various tasks. What would you like to do?"
-            ],
-            'error': [
-                "I'm experiencing some technical difficulties. Let me try a different approach.",
-                "Something went wrong there. Could you please rephrase your request?",
-                "I encountered an issue processing that. Can you try asking differently?"
-            ]
-        }
+    # Réponses contextuelles, partagées par toutes les instances ; les
+    # réponses 'time' sont des formats strftime évalués à chaque appel
+    RESPONSES = {
+        'greeting': (
+            "Hello! I'm Gideon, your local AI assistant. How can I help you today?",
+            "Hi there! I'm running entirely on your system. What can I do for you?",
+            "Greetings! Your local AI assistant is ready to assist you."
+        ),
+        'farewell': (
+            "Goodbye! Feel free to ask me anything anytime.",
+            "See you later! I'll be here when you need me.",
+            "Take care! I'm always ready to help."
+        ),
+        'time': (
+            "The current time is %H:%M:%S",
+            "It's currently %I:%M %p",
+            "Right now it's %H:%M"
+        ),
+        'weather': (
+            "I don't have current weather data, but I can help you find weather services.",
+            "For weather information, I'd recommend checking your local weather app.",
+            "I can't access weather data right now, but I can help with other tasks."
+        ),
+        'general': (
+            "I'm here to help! Could you be more specific about what you need?",
+            "I'm your local AI assistant. How can I assist you today?",
+            "I'm ready to help with various tasks. What would you like to do?"
+        ),
+        'error': (
+            "I'm experiencing some technical difficulties. Let me try a different approach.",
+            "Something went wrong there. Could you please rephrase your request?",
+            "I encountered an issue processing that. Can you try asking differently?"
+        )
+    }
+    
+    # Mots-clés par catégorie, dans l'ordre de priorité de détection,
+    # réunis en un seul motif à groupes nommés (une passe sur le texte)
+    KEYWORDS = (
+        ('greeting', r'hello|hi|hey|greetings'),
+        ('farewell', r'bye|goodbye|farewell|see you'),
+        ('time', r'time|hour|clock'),
+        ('weather', r'weather|temperature|rain|sunny'),
+    )
+    KEYWORD_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(f'(?P<{name}>{words})' for name, words in KEYWORDS) + r')\b',
+        re.IGNORECASE
+    )
+    CATEGORY_PRIORITY = {name: rank for rank, (name, _) in enumerate(KEYWORDS)}
     
     def get_contextual_response(self, user_input: str) -> str:
         """Génère une réponse contextuelle intelligente"""
-        input_lower = user_input.lower()
-        
-        # Détection contextuelle simple
-        if any(word in input_lower for word in ['hello', 'hi', 'hey', 'greetings']):
-            category = 'greeting'
-        elif any(word in input_lower for word in ['bye', 'goodbye', 'farewell', 'see you']):
-            category = 'farewell'
-        elif any(word in input_lower for word in ['time', 'hour', 'clock']):
-            category = 'time'
-        elif any(word in input_lower for word in ['weather', 'temperature', 'rain', 'sunny']):
-            category = 'weather'
-        else:
-            category = 'general'
+        # Détection contextuelle : catégorie la plus prioritaire trouvée
+        category = 'general'
+        best_rank = len(self.KEYWORDS)
+        for match in self.KEYWORD_PATTERN.finditer(user_input):
+            rank = self.CATEGORY_PRIORITY[match.lastgroup]
+            if rank < best_rank:
+                category, best_rank = match.lastgroup, rank
+                if rank == 0:
+                    break
         
-        # Sélection pseudo-aléatoire basée sur l'input
-        import hashlib
-        hash_input = f"{user_input}{int(time.time() / 300)}"  # Change toutes les 5 minutes
-        hash_val = int(hashlib.md5(hash_input.encode()).hexdigest(), 16)
-        responses = self.responses[category]
-        selected = responses[hash_val % len(responses)]
+        # Sélection pseudo-aléatoire basée sur l'input, change toutes les 5 minutes
+        responses = self.RESPONSES[category]
+        selected = responses[(hash(user_input) ^ int(time.time() // 300)) % len(responses)]
         
+        if category == 'time':
+            return time.strftime(selected)
         return selected
 
 
 class AssistantCore:
     """Core Assistant 100% LOCAL - Aucune dépendance externe pour fonctionner"""
     
-    def __init__(self):
+    # Message système partagé par toutes les requêtes (ne pas modifier)
+    _SYSTEM_MSG = {"role": ROLE_SYSTEM, "content": SYSTEM_PROMPT}
+    
+    def __init__(self, embedder=None):
+        """
+        Args:
+            embedder: Encodeur du cache sémantique (méthode
+                encode(texte, normalize_embeddings=True)) ; par défaut le
+                SentenceTransformer de la config s'il est installé
+        """
         self.logger = logging.getLogger("GideonCore")
         
         # Client Ollama local - PRIORITÉ
@@ -192,19 +329,48 @@ class AssistantCore:
         # Fallbacks intelligents - TOUJOURS DISPONIBLES
         self.fallbacks = IntelligentFallbacks()
         
-        # Mémoire de conversation
-        self.context_memory = deque(maxlen=10)
-        self.response_cache = {}
+        # Mémoire de conversation, une deque par champ (10 derniers échanges) ;
+        # les textes sont gardés directement sous forme de messages Ollama
+        self._ctx_user = deque(maxlen=10)
+        self._ctx_ai = deque(maxlen=10)
+        self._ctx_ts = deque(maxlen=10)
+        self._ctx_rt = deque(maxlen=10)
+        self._ctx_fallback = deque(maxlen=10)
+        
+        # Sommes glissantes sur la fenêtre de contexte, tenues à jour à chaque
+        # ajout/éviction : get_stats() reste O(1) quand l'UI l'interroge
+        self._ctx_rt_sum = 0.0
+        self._ctx_fallback_count = 0
+        
+        self.response_cache = OrderedDict()  # LRU, éviction O(1) à l'insertion
+        self._cache_max = config.ai.RESPONSE_CACHE_SIZE
+        
+        # Cache sémantique (optionnel) : embeddings normalisés dans une matrice
+        # préallouée remplie en anneau, réponses dans une liste parallèle
+        self.embedder = None
+        self._semantic_max = config.ai.SEMANTIC_CACHE_SIZE
+        self._semantic_embeddings = None
+        self._semantic_responses: List[Optional[str]] = []
+        self._semantic_next = 0
+        if embedder is None and HAS_SENTENCE_TRANSFORMERS and HAS_NUMPY:
+            try:
+                embedder = HAS_SENTENCE_TRANSFORMERS.module.SentenceTransformer(
+                    config.memory.EMBEDDING_MODEL
+                )
+            except Exception as e:
+                self.logger.error("❌ Échec chargement modèle d'embedding: %s", e)
+        if embedder is not None and HAS_NUMPY:
+            self.embedder = embedder
+            self._semantic_embeddings = HAS_NUMPY.module.zeros(
+                (self._semantic_max, config.memory.EMBEDDING_DIMENSION), dtype="float32"
+            )
+            self._semantic_responses = [None] * self._semantic_max
+        
+        # Messages Ollama des 3 derniers échanges (mêmes dicts que _ctx_user/_ctx_ai)
+        self._messages_tail = deque(maxlen=6)
         
         # Statistiques
-        self.stats = {
-            'total_requests': 0,
-            'ollama_responses': 0,
-            'fallback_responses': 0,
-            'cached_responses': 0,
-            'avg_response_time': 0,
-            'errors': 0
-        }
+        self.stats = AssistantStats()
         
         self.logger.info("✅ Gideon Assistant Core initialisé (100% LOCAL avec Ollama)")
     
@@ -214,135 +380,219 @@ class AssistantCore:
     
     def generate_ai_response(self, user_input: str, context: Dict = None) -> Dict:
         """Génère réponse IA - Ollama prioritaire avec fallbacks intelligents"""
-        start_time = time.time()
-        self.stats['total_requests'] += 1
+        result = {}
+        for _ in self.generate_ai_response_stream(user_input, result):
+            pass
+        return result
+    
+    def generate_ai_response_stream(self, user_input: str,
+                                    result: Optional[Dict] = None) -> Iterator[str]:
+        """Génère la réponse IA en flux, fragment par fragment
+        
+        Args:
+            user_input: Texte de l'utilisateur
+            result: Dict optionnel complété en fin de flux avec les mêmes
+                clés que `generate_ai_response` (response, method, ...)
+            
+        Yields:
+            Fragments de la réponse dès qu'Ollama les produit (la réponse
+            en cache ou le fallback arrivent en un seul fragment)
+        """
+        start_time = time.monotonic()  # Durées : horloge monotone, sans saut d'heure
+        self.stats.total_requests += 1
+        if result is None:
+            result = {}
         
         # Cache check
-        cache_key = f"{user_input.lower()}_{len(self.context_memory)}"
-        if cache_key in self.response_cache:
-            self.stats['cached_responses'] += 1
-            cached_response = self.response_cache[cache_key]
-            return {
+        cache_key = self._cache_key(user_input)
+        cached_response = self._get_cached_response(cache_key)
+        embedding = None
+        if cached_response is None and self.embedder is not None:
+            embedding = self._embed(user_input)
+            cached_response = self._get_similar_response(embedding)
+        if cached_response is not None:
+            yield cached_response
+            result.update({
                 'success': True,
                 'response': cached_response,
                 'method': 'cache',
-                'response_time': time.time() - start_time,
+                'response_time': time.monotonic() - start_time,
                 'cached': True
-            }
+            })
+            return
         
-        ai_response = None
-        method_used = "unknown"
+        parts = []
+        failed = False
+        method_used = "ollama"
         fallback_used = False
         
-        # 1. Essayer Ollama en priorité
+        # 1. Essayer Ollama en priorité, en streaming
         if self.ollama_client.is_available:
             try:
                 messages = self._build_context_messages(user_input)
-                
-                ollama_response = self.ollama_client.chat_completion(messages)
-                
-                if "choices" in ollama_response and ollama_response["choices"]:
-                    ai_response = ollama_response["choices"][0]["message"]["content"].strip()
-                    method_used = "ollama"
-                    self.stats['ollama_responses'] += 1
-                    
-                    # Cache si réponse substantielle
-                    if len(ai_response) > 10:
-                        self.response_cache[cache_key] = ai_response
-                        
-                        # Limiter taille cache
-                        if len(self.response_cache) > 50:
-                            oldest_key = next(iter(self.response_cache))
-                            del self.response_cache[oldest_key]
-                
+                for chunk in self.ollama_client.chat_completion_stream(messages):
+                    parts.append(chunk)
+                    yield chunk
             except Exception as e:
-                self.logger.error(f"❌ Erreur Ollama: {e}")
-                self.stats['errors'] += 1
+                self.logger.error("❌ Erreur Ollama: %s", e)
+                self.stats.errors += 1
+                failed = True
         
-        # 2. Fallback intelligent si Ollama échoue
-        if not ai_response:
+        ai_response = "".join(parts).strip()
+        if ai_response and not failed:
+            self.stats.ollama_responses += 1
+            self._cache_response(cache_key, ai_response, embedding)
+        else:
+            # 2. Fallback intelligent si Ollama n'a rien produit ou s'est
+            # interrompu : la réponse tronquée n'est ni cachée ni retournée,
+            # le fallback suit les fragments déjà émis
             ai_response = self.fallbacks.get_contextual_response(user_input)
             method_used = "fallback"
             fallback_used = True
-            self.stats['fallback_responses'] += 1
-        
-        # Calcul temps de réponse
-        response_time = time.time() - start_time
-        
-        # Mise à jour statistiques moyennes
-        total = self.stats['total_requests']
-        current_avg = self.stats['avg_response_time']
-        self.stats['avg_response_time'] = (current_avg * (total - 1) + response_time) / total
-        
-        # Ajout au contexte
-        context_entry = ConversationContext(
-            user_input=user_input,
-            ai_response=ai_response,
-            timestamp=time.time(),
-            response_time=response_time,
-            success=True,
-            fallback_used=fallback_used
-        )
-        self.context_memory.append(context_entry)
+            self.stats.fallback_responses += 1
+            yield f" {ai_response}" if parts else ai_response
         
-        self.logger.info(f"🤖 Réponse générée via {method_used} en {response_time:.2f}s")
-        
-        return {
+        response_time = self._record_response(user_input, ai_response, method_used,
+                                              fallback_used, start_time)
+        result.update({
             'success': True,
             'response': ai_response,
             'method': method_used,
             'response_time': response_time,
             'fallback_used': fallback_used,
             'cached': False
-        }
+        })
     
-    def _build_context_messages(self, user_input: str) -> List[Dict]:
-        """Construit messages avec contexte pour Ollama - FRANÇAIS OPTIMISÉ"""
-        messages = [
-            {
-                "role": "system",
-                "content": """Tu es Gideon, assistant IA personnel français inspiré de la série Flash.
-
-PERSONNALITÉ :
-- Tu es intelligent, serviable et légèrement futuriste
-- Tu t'exprimes en français parfait et naturel
-- Tu es poli mais pas obséquieux  
-- Tu utilises un ton amical et professionnel
-
-RÈGLES STRICTES :
-- TOUJOURS répondre en français impeccable
-- Phrases courtes et claires (max 2 lignes pour synthèse vocale)
-- Éviter les anglicismes
-- Utiliser "vous" pour être poli
-- Réponses concises mais complètes
-
-EXEMPLES DE RÉPONSES :
-- "Bonjour ! Comment puis-je vous aider ?"
-- "Parfaitement compris. Je m'en occupe."
-- "Excellent choix ! Voici ce que je propose..."
-- "Désolé, pourriez-vous reformuler votre demande ?"
-
-IMPORTANT : Réponse COURTE (1-2 phrases max) pour la synthèse vocale française."""
-            }
-        ]
+    def _cache_key(self, user_input: str) -> Hashable:
+        """Clé de cache : question normalisée + dernière question du contexte
         
-        # Ajout contexte récent (3 derniers échanges)
-        recent_context = list(self.context_memory)[-3:]
-        for ctx in recent_context:
-            messages.append({"role": "user", "content": ctx.user_input})
-            messages.append({"role": "assistant", "content": ctx.ai_response})
+        Une même question reposée plus tard dans la conversation retrouve
+        sa réponse, tant que le tour précédent est identique. Avec xxhash la
+        clé est un entier 64 bits (hash O(1) dans le dict) ; une collision ne
+        coûte qu'une réponse régénérée.
+        """
+        previous_input = self._ctx_user[-1]["content"].strip().casefold() if self._ctx_user else ""
+        normalized = user_input.strip().casefold()
+        if HAS_XXHASH:
+            return xxh3_64_intdigest(f"{previous_input}\x1f{normalized}".encode())
+        return (normalized, previous_input)
+    
+    def _get_cached_response(self, cache_key: Hashable) -> Optional[str]:
+        """Retourne la réponse en cache et la marque comme récemment utilisée"""
+        cached_response = self.response_cache.get(cache_key)
+        if cached_response is not None:
+            self.response_cache.move_to_end(cache_key)
+            self.stats.cached_responses += 1
+        return cached_response
+    
+    def _cache_response(self, cache_key: Hashable, ai_response: str, embedding=None):
+        """Met en cache une réponse Ollama substantielle (éviction LRU)
         
-        # Message actuel
-        messages.append({"role": "user", "content": user_input})
+        Args:
+            cache_key: Clé exacte issue de _cache_key
+            ai_response: Réponse à mémoriser
+            embedding: Embedding de la question (cache sémantique), si calculé
+        """
+        if len(ai_response) > 10:
+            self.response_cache[cache_key] = ai_response
+            self.response_cache.move_to_end(cache_key)
+            
+            # Limiter taille cache
+            if len(self.response_cache) > self._cache_max:
+                self.response_cache.popitem(last=False)
+            
+            # Cache sémantique : la plus ancienne entrée est écrasée (FIFO)
+            if embedding is not None:
+                slot = self._semantic_next
+                self._semantic_embeddings[slot] = embedding
+                self._semantic_responses[slot] = ai_response
+                self._semantic_next = (slot + 1) % self._semantic_max
+    
+    def _embed(self, user_input: str):
+        """Embedding normalisé de la question, précédée de la dernière question du contexte"""
+        previous_input = self._ctx_user[-1]["content"] if self._ctx_user else ""
+        return self.embedder.encode(f"{previous_input}\n{user_input}".strip().casefold(),
+                                    normalize_embeddings=True)
+    
+    def _get_similar_response(self, embedding) -> Optional[str]:
+        """Réponse en cache pour une question proche (similarité cosinus)"""
+        # Embeddings normalisés : le produit scalaire est la similarité cosinus
+        similarities = self._semantic_embeddings @ embedding
+        best = int(similarities.argmax())
+        response = self._semantic_responses[best]
+        if response is None or similarities[best] < config.ai.SEMANTIC_CACHE_THRESHOLD:
+            return None
         
-        return messages
+        self.stats.cached_responses += 1
+        return response
     
-    def process_voice_command(self, command: str) -> Dict:
-        """Traite commande vocale"""
-        self.logger.info(f"🎤 Commande vocale reçue: {command}")
+    def _record_response(self, user_input: str, ai_response: str, method_used: str,
+                         fallback_used: bool, start_time: float) -> float:
+        """Met à jour statistiques et contexte, retourne le temps de réponse"""
+        # Calcul temps de réponse (start_time vient de time.monotonic)
+        response_time = time.monotonic() - start_time
+        
+        # Moyenne mobile exponentielle : oublie le temps de chargement initial
+        # du modèle Ollama (la première mesure initialise la moyenne)
+        current_avg = self.stats.avg_response_time
+        if current_avg:
+            response_time_avg = current_avg + (response_time - current_avg) * RESPONSE_TIME_EMA_ALPHA
+        else:
+            response_time_avg = response_time
+        self.stats.avg_response_time = response_time_avg
+        
+        # Ajout au contexte : un seul dict par message, partagé avec _messages_tail
+        user_msg = {"role": ROLE_USER, "content": user_input}
+        assistant_msg = {"role": ROLE_ASSISTANT, "content": ai_response}
+        if len(self._ctx_rt) == self._ctx_rt.maxlen:
+            self._ctx_rt_sum -= self._ctx_rt[0]
+            self._ctx_fallback_count -= self._ctx_fallback[0]
+        self._ctx_rt_sum += response_time
+        self._ctx_fallback_count += fallback_used
+        
+        self._ctx_user.append(user_msg)
+        self._ctx_ai.append(assistant_msg)
+        self._ctx_ts.append(time.time())
+        self._ctx_rt.append(response_time)
+        self._ctx_fallback.append(fallback_used)
+        self._messages_tail.append(user_msg)
+        self._messages_tail.append(assistant_msg)
+        
+        self.logger.info("🤖 Réponse générée via %s en %.2fs", method_used, response_time)
+        return response_time
+    
+    def _build_context_messages(self, user_input: str) -> List[Dict]:
+        """Construit messages avec contexte pour Ollama - FRANÇAIS OPTIMISÉ"""
+        # Message système + 3 derniers échanges déjà sous forme de messages
+        return [self._SYSTEM_MSG, *self._messages_tail,
+                {"role": ROLE_USER, "content": user_input}]
+    
+    def process_voice_command(self, command: str,
+                              speak: Optional[Callable[[str], object]] = None) -> Dict:
+        """Traite commande vocale
+        
+        Args:
+            command: Texte reconnu
+            speak: Fonction TTS optionnelle ; si fournie, la réponse est
+                streamée et chaque phrase est prononcée dès qu'elle est
+                complète (le résultat contient alors 'spoken': True)
+        """
+        self.logger.info("🎤 Commande vocale reçue: %s", command)
         
         # Génération réponse
-        result = self.generate_ai_response(command)
+        if speak is None:
+            result = self.generate_ai_response(command)
+        else:
+            result = {}
+            buffer = ""
+            for chunk in self.generate_ai_response_stream(command, result):
+                buffer += chunk
+                *sentences, buffer = SENTENCE_END.split(buffer)
+                for sentence in sentences:
+                    speak(sentence)
+            if buffer.strip():
+                speak(buffer.strip())
+            result['spoken'] = True
         
         if result['success']:
             return {
@@ -350,7 +600,8 @@ IMPORTANT : Réponse COURTE (1-2 phrases max) pour la synthèse vocale français
                 'response': result['response'],
                 'method': result['method'],
                 'response_time': result['response_time'],
-                'fallback_used': result.get('fallback_used', False)
+                'fallback_used': result.get('fallback_used', False),
+                'spoken': result.get('spoken', False)
             }
         else:
             error_response = "I couldn't process that command right now. Please try again."
@@ -365,30 +616,78 @@ IMPORTANT : Réponse COURTE (1-2 phrases max) pour la synthèse vocale français
         """Status système"""
         return {
             'ollama_available': self.ollama_client.is_available,
-            'total_requests': self.stats['total_requests'],
-            'ollama_success_rate': (self.stats['ollama_responses'] / max(1, self.stats['total_requests'])) * 100,
-            'fallback_usage': (self.stats['fallback_responses'] / max(1, self.stats['total_requests'])) * 100,
-            'avg_response_time': self.stats['avg_response_time'],
-            'conversation_length': len(self.context_memory),
+            'total_requests': self.stats.total_requests,
+            'ollama_success_rate': (self.stats.ollama_responses / max(1, self.stats.total_requests)) * 100,
+            'fallback_usage': (self.stats.fallback_responses / max(1, self.stats.total_requests)) * 100,
+            'avg_response_time': self.stats.avg_response_time,
+            'conversation_length': len(self._ctx_user),
             'cache_size': len(self.response_cache)
         }
     
+    def get_stats(self) -> Dict:
+        """Statistiques pour le tableau de bord (O(1), sommes glissantes)"""
+        context_length = len(self._ctx_rt)
+        return asdict(self.stats) | {
+            'successful_ai_responses': self.stats.ollama_responses,
+            'cache_size': len(self.response_cache),
+            'conversation_length': context_length,
+            'recent_avg_response_time': self._ctx_rt_sum / context_length if context_length else 0.0,
+            'recent_fallbacks': self._ctx_fallback_count
+        }
+    
+    def _clear_context(self):
+        """Vide la mémoire de conversation et les messages Ollama associés"""
+        for history in (self._ctx_user, self._ctx_ai, self._ctx_ts,
+                        self._ctx_rt, self._ctx_fallback, self._messages_tail):
+            history.clear()
+        self._ctx_rt_sum = 0.0
+        self._ctx_fallback_count = 0
+    
+    def _clear_semantic_cache(self):
+        """Vide le cache sémantique (la matrice préallouée est conservée)"""
+        if self.embedder is not None:
+            self._semantic_embeddings.fill(0.0)
+            self._semantic_responses = [None] * self._semantic_max
+            self._semantic_next = 0
+    
     def reset_conversation(self):
         """Reset conversation context"""
-        self.context_memory.clear()
+        self._clear_context()
         self.response_cache.clear()
+        self._clear_semantic_cache()
         self.logger.info("🔄 Conversation context reset")
     
     def cleanup_memory_resources(self):
         """Nettoyage mémoire"""
-        self.context_memory.clear()
+        self._clear_context()
         self.response_cache.clear()
+        self._clear_semantic_cache()
         
     def cleanup(self):
         """Nettoyage complet"""
         self.cleanup_memory_resources()
+        self.ollama_client.close()
         self.logger.info("🧹 Cleanup assistant core terminé")
 
 
-# Instance globale
-assistant_core = AssistantCore() 
\ No newline at end of file
+# Instance globale, créée au premier usage : importer le module ne lance
+# ni le test de connexion Ollama ni l'import de requests
+_assistant_core: Optional[AssistantCore] = None
+_assistant_core_lock = threading.Lock()
+
+
+def get_assistant_core() -> AssistantCore:
+    """Retourne l'instance partagée d'AssistantCore, créée au premier appel"""
+    global _assistant_core
+    if _assistant_core is None:
+        with _assistant_core_lock:
+            if _assistant_core is None:
+                _assistant_core = AssistantCore()
+    return _assistant_core
+
+
+def __getattr__(name):
+    # Compatibilité : `assistant_core` résolu paresseusement (PEP 562)
+    if name == "assistant_core":
+        return get_assistant_core()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
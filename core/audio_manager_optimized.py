@@ -3,15 +3,21 @@ Enhanced Audio Manager for Gideon AI Assistant
 PRODUCTION OPTIMIZED FOR MACOS - Auto-calibration + Wake Word Detection
 """
 
+import asyncio
 import threading
 import time
 import logging
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import difflib
+import functools
+import json
 import platform
+import re
+from pathlib import Path
 from typing import Optional, Callable, List
 from dataclasses import dataclass, field
-import gc
+from collections import deque
 
 # Audio imports with fallbacks
 try:
@@ -36,6 +42,87 @@ except ImportError:
     HAS_TTS = False
     logging.warning("pyttsx3 not available")
 
+# Reconnaissance locale (optionnelle) - sinon Google Speech via HTTPS
+try:
+    import numpy as np
+    from faster_whisper import WhisperModel
+    HAS_WHISPER = True
+except ImportError:
+    HAS_WHISPER = False
+
+# Reconnaissance locale légère (Kaldi, modèles quantifiés) - sinon Google
+try:
+    from vosk import Model as VoskModel, KaldiRecognizer
+    HAS_VOSK = True
+except ImportError:
+    HAS_VOSK = False
+
+# Synthèse vocale neuronale en streaming (optionnelle) - sinon pyttsx3
+try:
+    from piper import PiperVoice
+    HAS_PIPER = True
+except ImportError:
+    HAS_PIPER = False
+
+# Fuzzy matching natif (C++) des wake words - sinon difflib
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Recherche multi-motifs Aho-Corasick des wake words exacts - sinon boucle `in`
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# JIT optionnel pour le calcul d'énergie du callback audio
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Index du microphone choisi, réutilisé aux démarrages suivants
+MIC_INDEX_CACHE = Path.home() / ".cache" / "gideon" / "mic_index.json"
+
+# Noms de microphones intégrés, prioritaires dans le score
+BUILTIN_MIC_KEYWORDS = frozenset(('built-in', 'internal', 'macbook'))
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_input_devices():
+    """Énumère les devices audio une seule fois par processus"""
+    return sd.query_devices()
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _frame_energy(block):
+        """Énergie RMS d'un bloc int16 (même échelle que recognizer.energy_threshold)"""
+        total = 0.0
+        for i in range(block.shape[0]):
+            sample = float(block[i])
+            total += sample * sample
+        return np.sqrt(total / block.shape[0])
+else:
+    def _frame_energy(block):
+        """Énergie RMS d'un bloc int16 (même échelle que recognizer.energy_threshold)"""
+        samples = block.astype(np.float32)
+        return float(np.sqrt(np.dot(samples, samples) / len(samples)))
+
+
+def _is_ring_phrase(audio) -> bool:
+    """True pour une phrase du ring buffer (ndarray int16), False pour un sr.AudioData
+    
+    Les ndarray ne viennent que du flux sounddevice : sans lui (ni numpy),
+    `np` n'est pas défini et l'audio est toujours un sr.AudioData.
+    """
+    return HAS_SOUNDDEVICE and isinstance(audio, np.ndarray)
+
+
 @dataclass
 class AudioConfig:
     """PRODUCTION audio configuration for macOS - FRANÇAIS"""
@@ -49,6 +136,10 @@ class AudioConfig:
     PHRASE_TIMEOUT: float = 6.0
     PAUSE_THRESHOLD: float = 0.6
     
+    # Capture directe sounddevice : ring buffer int16 préalloué
+    RING_BUFFER_SECONDS: float = 10.0  # Doit couvrir PHRASE_TIMEOUT
+    PHRASE_PREROLL: float = 0.25  # Audio conservé avant le début de la parole
+    
     # macOS specific optimizations
     ENERGY_THRESHOLD: int = 250
     DYNAMIC_ENERGY_THRESHOLD: bool = True
@@ -58,6 +149,19 @@ class AudioConfig:
     # Performance settings
     RETRY_DELAY: float = 1.0
     MAX_RETRIES: int = 3
+    VOICE_QUEUE_SIZE: int = 32  # Commandes en attente max (les plus anciennes sont jetées)
+    
+    # Local Whisper model (multilingue, quantifié int8 pour le CPU)
+    WHISPER_MODEL: str = "small"
+    WHISPER_COMPUTE_TYPE: str = "int8"
+    
+    # Modèle Vosk français (si Whisper absent), Google seulement en dessous
+    # de la confiance moyenne minimale
+    VOSK_MODEL_PATH: str = "data/models/vosk-model-small-fr-0.22"
+    VOSK_MIN_CONFIDENCE: float = 0.5
+    
+    # Voix Piper (ONNX) : l'audio est joué pendant que la synthèse continue
+    PIPER_VOICE_MODEL: str = "data/models/fr_FR-siwis-low.onnx"
     
     # Language settings - FRANÇAIS PAR DÉFAUT
     LANGUAGE: str = "fr-FR"
@@ -71,7 +175,17 @@ class AudioConfig:
     ])
     WAKE_WORD_THRESHOLD: float = 0.75
 
-@dataclass
+@dataclass(slots=True)
+class AudioStats:
+    """Compteurs du pipeline d'écoute (attributs à slots, incrémentés à chaque phrase)"""
+    total_listens: int = 0
+    successful_recognitions: int = 0
+    wake_words_detected: int = 0
+    failures: int = 0
+    calibrations: int = 0
+    avg_response_time: float = 0.0
+
+@dataclass(slots=True, frozen=True)
 class VoiceCommand:
     """Voice command data structure with wake word detection - FRANÇAIS"""
     text: str
@@ -84,6 +198,9 @@ class VoiceCommand:
 class MacOSAudioOptimizer:
     """macOS specific audio optimizations"""
     
+    # Device retenu dans ce processus : les instances suivantes le réutilisent
+    _selected_device: Optional[int] = None
+    
     @staticmethod
     def check_macos_permissions():
         """Vérifier et optimiser permissions microphone macOS"""
@@ -92,7 +209,7 @@ class MacOSAudioOptimizer:
         
         try:
             # Test rapide d'accès micro
-            devices = sd.query_devices()
+            devices = _scan_input_devices()
             
             # Chercher des devices d'entrée
             input_devices = [d for d in devices if d['max_input_channels'] > 0]
@@ -101,64 +218,126 @@ class MacOSAudioOptimizer:
                 logging.warning("❌ Aucun device d'entrée audio détecté sur macOS")
                 return False
             
-            logging.info(f"✅ {len(input_devices)} devices audio détectés sur macOS")
+            logging.info("✅ %s devices audio détectés sur macOS", len(input_devices))
             return True
             
         except Exception as e:
-            logging.error(f"❌ Erreur permissions audio macOS: {e}")
+            logging.error("❌ Erreur permissions audio macOS: %s", e)
             return False
     
+    @staticmethod
+    def compute_threshold(samples: "np.ndarray", block_size: int, ratio: float = 1.5) -> float:
+        """Seuil d'énergie à partir de bruit ambiant int16, en une passe NumPy
+        
+        Même échelle que recognizer.energy_threshold : RMS moyen des blocs
+        multiplié par `ratio` (dynamic_energy_ratio de speech_recognition).
+        
+        Args:
+            samples: Bruit ambiant int16 mono
+            block_size: Taille des blocs (CHUNK_SIZE)
+            ratio: Marge au-dessus du bruit moyen
+        """
+        blocks = samples[:len(samples) // block_size * block_size].reshape(-1, block_size)
+        blocks = blocks.astype(np.float32)
+        rms = np.sqrt(np.einsum('ij,ij->i', blocks, blocks) / block_size)
+        return float(rms.mean() * ratio)
+    
+    @staticmethod
+    def _score_input_device(device) -> float:
+        """Score d'un device d'entrée : intégré, sample rate et nombre de canaux"""
+        name_lower = device['name'].lower()
+        score = 0
+        
+        # Bonus pour devices intégrés
+        if any(keyword in name_lower for keyword in BUILTIN_MIC_KEYWORDS):
+            score += 10
+        
+        # Bonus pour sample rate élevé
+        score += min(device['default_samplerate'] / 1000, 48)
+        
+        # Bonus pour channels
+        return score + device['max_input_channels']
+    
+    @staticmethod
+    def _load_cached_device() -> Optional[int]:
+        """Relit l'index mémorisé s'il désigne toujours le même device d'entrée"""
+        try:
+            cached = json.loads(MIC_INDEX_CACHE.read_text())
+            device = sd.query_devices(cached['index'])
+        except Exception:
+            return None
+        
+        if device['max_input_channels'] > 0 and device['name'] == cached.get('name'):
+            return cached['index']
+        return None
+    
+    @staticmethod
+    def _save_cached_device(index: int, name: str):
+        """Mémorise le device choisi pour éviter le scan au prochain démarrage"""
+        try:
+            MIC_INDEX_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            MIC_INDEX_CACHE.write_text(json.dumps({'index': index, 'name': name}))
+        except OSError as e:
+            logging.debug("Cache microphone non écrit: %s", e)
+    
     @staticmethod
     def get_optimal_microphone():
-        """Obtenir le meilleur microphone pour macOS"""
+        """Obtenir le meilleur microphone pour macOS
+        
+        L'index choisi est mis en cache sur disque ; tant qu'il désigne le
+        même device d'entrée, l'énumération complète est évitée.
+        """
         if not HAS_SOUNDDEVICE:
             return sr.Microphone()
         
+        if MacOSAudioOptimizer._selected_device is not None:
+            return sr.Microphone(device_index=MacOSAudioOptimizer._selected_device)
+        
         try:
-            devices = sd.query_devices()
+            cached_index = MacOSAudioOptimizer._load_cached_device()
+            if cached_index is not None:
+                MacOSAudioOptimizer._selected_device = cached_index
+                return sr.Microphone(device_index=cached_index)
             
             # Priorité aux devices avec "built-in" ou "internal"
-            best_device = None
-            best_score = 0
-            
-            for i, device in enumerate(devices):
-                if device['max_input_channels'] > 0:
-                    score = 0
-                    name_lower = device['name'].lower()
-                    
-                    # Bonus pour devices intégrés
-                    if any(keyword in name_lower for keyword in ['built-in', 'internal', 'macbook']):
-                        score += 10
-                    
-                    # Bonus pour sample rate élevé
-                    score += min(device['default_samplerate'] / 1000, 48)
-                    
-                    # Bonus pour channels
-                    score += device['max_input_channels']
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_device = i
+            devices = _scan_input_devices()
+            best_device = max(
+                (i for i, device in enumerate(devices) if device['max_input_channels'] > 0),
+                key=lambda i: MacOSAudioOptimizer._score_input_device(devices[i]),
+                default=None
+            )
             
             if best_device is not None:
                 device_info = devices[best_device]
-                logging.info(f"🎤 Microphone optimal: {device_info['name']} "
-                           f"({device_info['default_samplerate']}Hz)")
+                logging.info("🎤 Microphone optimal: %s (%sHz)",
+                             device_info['name'], device_info['default_samplerate'])
+                MacOSAudioOptimizer._save_cached_device(best_device, device_info['name'])
+                MacOSAudioOptimizer._selected_device = best_device
                 return sr.Microphone(device_index=best_device)
             else:
                 logging.warning("⚠️ Utilisation microphone par défaut")
                 return sr.Microphone()
                 
         except Exception as e:
-            logging.error(f"❌ Erreur sélection microphone: {e}")
+            logging.error("❌ Erreur sélection microphone: %s", e)
             return sr.Microphone()
 
 class WakeWordDetector:
     """Détecteur de wake word intelligent avec fuzzy matching"""
     
     def __init__(self, wake_words: List[str], threshold: float = 0.75):
-        self.wake_words = [word.lower().strip() for word in wake_words]
+        self.wake_words = tuple(word.lower().strip() for word in wake_words)
+        self._wake_lens = tuple(len(word) for word in self.wake_words)
         self.threshold = threshold
+        
+        # Automate construit une fois : un seul parcours du texte pour tous les
+        # wake words ; la valeur (rang, mot) garde la priorité de la liste
+        self._automaton = None
+        if HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for rank, wake_word in enumerate(self.wake_words):
+                self._automaton.add_word(wake_word, (rank, wake_word))
+            self._automaton.make_automaton()
     
     def detect_wake_word(self, text: str) -> tuple:
         """Détecter wake word avec fuzzy matching"""
@@ -168,17 +347,43 @@ class WakeWordDetector:
         text_lower = text.lower().strip()
         
         # Recherche exacte d'abord
-        for wake_word in self.wake_words:
-            if wake_word in text_lower:
-                return True, wake_word
+        if self._automaton is not None:
+            matches = [value for _, value in self._automaton.iter(text_lower)]
+            if matches:
+                return True, min(matches)[1]
+        else:
+            for wake_word in self.wake_words:
+                if wake_word in text_lower:
+                    return True, wake_word
         
         # Fuzzy matching pour variations
+        if HAS_RAPIDFUZZ:
+            match = process.extractOne(text_lower, self.wake_words, scorer=fuzz.ratio,
+                                       score_cutoff=self.threshold * 100)
+            if match:
+                return True, f"{match[0]} (fuzzy: {match[1] / 100:.2f})"
+            return False, ""
+        
+        # Un seul matcher : l'index b2j du texte (seq2) est construit une fois,
+        # seul le wake word (seq1) change à chaque tour (autojunk par défaut,
+        # comme le SequenceMatcher(None, wake_word, text) d'origine)
+        matcher = difflib.SequenceMatcher(None, "", text_lower)
+        text_len = len(text_lower)
         best_match = ""
         best_ratio = 0
         
-        for wake_word in self.wake_words:
+        for wake_word, wake_len in zip(self.wake_words, self._wake_lens):
+            # Bornes supérieures du ratio : longueurs (2*min/somme) puis
+            # quick_ratio, avant le calcul complet des blocs communs
+            floor = max(self.threshold, best_ratio)
+            if 2 * min(wake_len, text_len) / (wake_len + text_len) < floor:
+                continue
+            
             # Ratio de similarité
-            ratio = difflib.SequenceMatcher(None, wake_word, text_lower).ratio()
+            matcher.set_seq1(wake_word)
+            if matcher.quick_ratio() < floor:
+                continue
+            ratio = matcher.ratio()
             
             if ratio > best_ratio and ratio >= self.threshold:
                 best_ratio = ratio
@@ -192,58 +397,82 @@ class WakeWordDetector:
 class FrenchVoiceManager:
     """Gestionnaire de voix françaises pour macOS"""
     
+    # Voix françaises prioritaires macOS
+    FRENCH_VOICE_PRIORITIES = (
+        'com.apple.speech.synthesis.voice.thomas',      # Thomas (FR)
+        'com.apple.voice.compact.fr-FR.Thomas',
+        'com.apple.speech.synthesis.voice.virginie',    # Virginie (FR)
+        'com.apple.voice.compact.fr-FR.Virginie',
+        'com.apple.eloquence.fr-FR.Grandpa',
+        'com.apple.eloquence.fr-FR.Grandma'
+    )
+    
     def __init__(self, tts_engine):
         self.tts_engine = tts_engine
         self.logger = logging.getLogger("FrenchVoice")
         
+        # getProperty('voices') interroge NSSpeechSynthesizer : lu une seule fois
+        self._voices = None
+        self._french_voices = ()
+    
+    def _load_voices(self) -> tuple:
+        """Liste des voix (et sous-liste française), mise en cache à la première lecture"""
+        if self._voices is None:
+            self._voices = tuple(self.tts_engine.getProperty('voices') or ())
+            self._french_voices = tuple(
+                voice for voice in self._voices
+                if ('fr' in voice.id.lower() or
+                    'french' in voice.name.lower() or
+                    'français' in voice.name.lower())
+            )
+        return self._voices
+        
     def configure_french_voice(self):
         """Configure la meilleure voix française disponible sur macOS"""
         if not self.tts_engine:
             return False
             
         try:
-            voices = self.tts_engine.getProperty('voices')
+            voices = self._load_voices()
             if not voices:
                 self.logger.warning("Aucune voix disponible")
                 return False
             
-            # Voix françaises prioritaires macOS
-            french_voice_priorities = [
-                'com.apple.speech.synthesis.voice.thomas',      # Thomas (FR)
-                'com.apple.voice.compact.fr-FR.Thomas',
-                'com.apple.speech.synthesis.voice.virginie',    # Virginie (FR)
-                'com.apple.voice.compact.fr-FR.Virginie',
-                'com.apple.eloquence.fr-FR.Grandpa',
-                'com.apple.eloquence.fr-FR.Grandma'
-            ]
-            
-            # Recherche voix française par priorité
-            for priority_voice in french_voice_priorities:
-                for voice in voices:
-                    if priority_voice in voice.id:
-                        self.tts_engine.setProperty('voice', voice.id)
-                        self.logger.info(f"✅ Voix française configurée: {voice.name}")
-                        return True
-            
-            # Fallback: chercher toute voix contenant "fr" ou "French"
+            # Recherche voix française par priorité, en un seul parcours des voix :
+            # seules les priorités meilleures que le candidat courant sont testées
+            priorities = self.FRENCH_VOICE_PRIORITIES
+            best_voice = None
+            best_rank = len(priorities)
             for voice in voices:
-                if ('fr' in voice.id.lower() or 
-                    'french' in voice.name.lower() or
-                    'français' in voice.name.lower()):
-                    self.tts_engine.setProperty('voice', voice.id)
-                    self.logger.info(f"✅ Voix française trouvée: {voice.name}")
-                    return True
+                for rank in range(best_rank):
+                    if priorities[rank] in voice.id:
+                        best_voice, best_rank = voice, rank
+                        break
+                if best_rank == 0:
+                    break
+            
+            if best_voice is not None:
+                self.tts_engine.setProperty('voice', best_voice.id)
+                self.logger.info("✅ Voix française configurée: %s", best_voice.name)
+                return True
+            
+            # Fallback: première voix contenant "fr" ou "French"
+            if self._french_voices:
+                voice = self._french_voices[0]
+                self.tts_engine.setProperty('voice', voice.id)
+                self.logger.info("✅ Voix française trouvée: %s", voice.name)
+                return True
             
             # Dernière option: lister toutes les voix pour debug
             self.logger.warning("❌ Aucune voix française trouvée")
             self.logger.info("Voix disponibles:")
             for i, voice in enumerate(voices[:5]):  # Montrer 5 premières
-                self.logger.info(f"  {i}: {voice.name} ({voice.id})")
+                self.logger.info("  %s: %s (%s)", i, voice.name, voice.id)
             
             return False
             
         except Exception as e:
-            self.logger.error(f"❌ Erreur configuration voix française: {e}")
+            self.logger.error("❌ Erreur configuration voix française: %s", e)
             return False
     
     def configure_french_speech_params(self):
@@ -259,7 +488,7 @@ class FrenchVoiceManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Erreur paramètres français: {e}")
+            self.logger.error("❌ Erreur paramètres français: %s", e)
             return False
     
     def test_french_speech(self):
@@ -272,12 +501,12 @@ class FrenchVoiceManager:
         
         for phrase in test_phrases:
             try:
-                self.logger.info(f"🔊 Test: {phrase}")
+                self.logger.info("🔊 Test: %s", phrase)
                 self.tts_engine.say(phrase)
                 self.tts_engine.runAndWait()
                 time.sleep(0.5)  # Pause entre phrases
             except Exception as e:
-                self.logger.error(f"❌ Erreur test vocal: {e}")
+                self.logger.error("❌ Erreur test vocal: %s", e)
                 return False
         
         return True
@@ -286,6 +515,29 @@ class FrenchVoiceManager:
 class EnhancedAudioManager:
     """PRODUCTION Audio Manager with macOS optimizations - FRANÇAIS INTÉGRÉ"""
     
+    # Remplacements pour meilleure prononciation française
+    FRENCH_REPLACEMENTS = {
+        'IA': 'intelligence artificielle',
+        'AI': 'intelligence artificielle',
+        'OK': 'd\'accord',
+        'email': 'courriel',
+        'emails': 'courriels',
+        'web': 'ouèbe',
+        'wifi': 'wi-fi',
+        'USD': 'dollars américains',
+        'EUR': 'euros',
+        '°C': ' degrés Celsius',
+        '°F': ' degrés Fahrenheit',
+    }
+    # Mots entourés d'espaces (lookarounds : deux termes voisins partagent
+    # l'espace, comme avec les str.replace successifs) puis unités collées
+    _FRENCH_TEXT_PATTERN = re.compile(
+        r'(?<= )(?:' + '|'.join(sorted(
+            (re.escape(word) for word in FRENCH_REPLACEMENTS if not word.startswith('°')),
+            key=len, reverse=True
+        )) + r')(?= )|°[CF]'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger("AudioManagerPRO")
         self.config = AudioConfig()
@@ -293,23 +545,60 @@ class EnhancedAudioManager:
         # Components
         self.recognizer = None
         self.microphone = None
+        self.stt = None  # Modèle Whisper local, prioritaire sur Google
+        self.vosk = None  # KaldiRecognizer Vosk, utilisé si Whisper est absent
         self.tts_engine = None
+        self.piper_voice = None  # Prioritaire sur pyttsx3 si le modèle est présent
         self.french_voice_manager = None  # Nouveau gestionnaire français
         
         # State management
         self.is_calibrated = False
         self.last_calibration = 0
         self.consecutive_failures = 0
+        # Échecs comptés depuis le thread de capture et celui de la
+        # reconnaissance : compteur et statistique modifiés sous verrou
+        self._failure_lock = threading.Lock()
+        self.last_successful_recognition = 0
+        self.is_listening = False
+        self.wake_word_detector = WakeWordDetector(self.config.WAKE_WORDS,
+                                                   self.config.WAKE_WORD_THRESHOLD)
+        
+        # Pipeline d'écoute asyncio : capture micro et transcription sur deux
+        # exécuteurs distincts, la phrase suivante est captée pendant que la
+        # précédente est reconnue
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True,
+                                             name="GideonAudioLoop")
+        self._loop_thread.start()
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GideonListen")
+        self._cpu_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GideonSTT")
+        self._listen_future = None
+        self._stop_event = asyncio.Event()  # Interrompt les pauses de la boucle d'écoute
+        
+        # Flux sounddevice + ring buffer (remplace recognizer.listen)
+        self._input_stream = None
+        self._ring = None
+        self._ring_total = 0  # Échantillons écrits depuis l'ouverture du flux
+        self._phrase_start = None
+        self._phrase_last_voice = 0
+        # Bornes (début, fin) des phrases détectées par le callback PortAudio :
+        # deque + Event comme voice_queue, aucun verrou dans le callback par bloc
+        self._phrases = deque(maxlen=4)
+        self._phrase_event = threading.Event()
+        
+        # Un producteur (boucle d'écoute) et un consommateur (get_next_command) :
+        # deque bornée (append/popleft atomiques) + Event, sans verrou par commande.
+        # Bornée : un consommateur bloqué ne fait pas grossir la mémoire
+        self.voice_queue = deque(maxlen=self.config.VOICE_QUEUE_SIZE)
+        self._voice_event = threading.Event()
+        
+        # Synthèse vocale dans un thread dédié : speak() ne bloque plus l'appelant
+        self.is_speaking = False
+        self._tts_queue = queue.Queue()
+        self._tts_thread = None
         
         # Statistiques
-        self.stats = {
-            'total_listens': 0,
-            'successful_recognitions': 0,
-            'failed_recognitions': 0,
-            'wake_words_detected': 0,
-            'last_calibration': 'Never',
-            'consecutive_failures': 0
-        }
+        self.stats = AudioStats()
         
         # Optimisations macOS
         self.macos_optimizer = MacOSAudioOptimizer()
@@ -341,10 +630,40 @@ class EnhancedAudioManager:
                     self.logger.warning("⚠️ Microphone non disponible")
                     
             except Exception as e:
-                self.logger.error(f"❌ Échec speech recognition: {e}")
+                self.logger.error("❌ Échec speech recognition: %s", e)
                 self.recognizer = None
                 self.microphone = None
         
+        # Whisper local : supprime l'aller-retour réseau vers Google
+        if HAS_WHISPER and self.recognizer:
+            try:
+                self.stt = WhisperModel(
+                    self.config.WHISPER_MODEL,
+                    device="cpu",
+                    compute_type=self.config.WHISPER_COMPUTE_TYPE
+                )
+                self.logger.info("✅ Reconnaissance Whisper locale chargée")
+            except Exception as e:
+                self.logger.error("❌ Échec chargement Whisper: %s", e)
+                self.stt = None
+        
+        # Vosk : une seule passe locale au lieu d'une requête Google par langue
+        if (HAS_VOSK and self.recognizer and self.stt is None
+                and Path(self.config.VOSK_MODEL_PATH).exists()):
+            try:
+                self.vosk = KaldiRecognizer(VoskModel(self.config.VOSK_MODEL_PATH),
+                                            self.config.SAMPLE_RATE)
+                self.vosk.SetWords(True)  # Confiance par mot dans le résultat
+                self.logger.info("✅ Reconnaissance Vosk locale chargée")
+            except Exception as e:
+                self.logger.error("❌ Échec chargement Vosk: %s", e)
+                self.vosk = None
+        
+        # Flux micro permanent : plus d'ouverture/fermeture PortAudio par écoute,
+        # quel que soit le moteur de reconnaissance
+        if HAS_SOUNDDEVICE and self.microphone:
+            self._open_input_stream()
+        
         # TTS français avec optimisations
         if HAS_TTS:
             try:
@@ -365,9 +684,89 @@ class EnhancedAudioManager:
                     self.logger.warning("⚠️ TTS configuré sans voix française spécifique")
                 
             except Exception as e:
-                self.logger.error(f"❌ Échec TTS français: {e}")
+                self.logger.error("❌ Échec TTS français: %s", e)
                 self.tts_engine = None
                 self.french_voice_manager = None
+        
+        # Piper : premier son dès la première phrase synthétisée
+        if HAS_PIPER and HAS_SOUNDDEVICE and Path(self.config.PIPER_VOICE_MODEL).exists():
+            try:
+                self.piper_voice = PiperVoice.load(self.config.PIPER_VOICE_MODEL)
+                self.logger.info("✅ Voix Piper chargée (synthèse en streaming)")
+            except Exception as e:
+                self.logger.error("❌ Échec chargement voix Piper: %s", e)
+                self.piper_voice = None
+        
+        if self.piper_voice or self.tts_engine:
+            self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True,
+                                                name="GideonTTS")
+            self._tts_thread.start()
+    
+    def _open_input_stream(self):
+        """Ouvre un flux PortAudio permanent qui remplit le ring buffer"""
+        try:
+            self._ring = np.empty(int(self.config.SAMPLE_RATE * self.config.RING_BUFFER_SECONDS),
+                                  dtype=np.int16)
+            self._input_stream = sd.InputStream(
+                device=getattr(self.microphone, 'device_index', None),
+                samplerate=self.config.SAMPLE_RATE,
+                channels=self.config.CHANNELS,
+                dtype='int16',
+                blocksize=self.config.CHUNK_SIZE,
+                callback=self._on_audio_block
+            )
+            self._input_stream.start()
+            self.logger.info("✅ Flux micro sounddevice ouvert (ring buffer)")
+        except Exception as e:
+            self.logger.error("❌ Échec flux sounddevice, retour à speech_recognition: %s", e)
+            self._input_stream = None
+            self._ring = None
+    
+    def _on_audio_block(self, indata, frames, time_info, status):
+        """Callback PortAudio : copie le bloc dans le ring buffer et segmente les phrases
+        
+        Une phrase commence au premier bloc dont l'énergie RMS dépasse le seuil du
+        recognizer et se termine après PAUSE_THRESHOLD secondes de silence
+        (ou PHRASE_TIMEOUT secondes de parole).
+        """
+        block = indata[:, 0]
+        ring = self._ring
+        size = len(ring)
+        
+        write = self._ring_total % size
+        first = min(frames, size - write)
+        ring[write:write + first] = block[:first]
+        if first < frames:
+            ring[:frames - first] = block[first:]
+        self._ring_total += frames
+        
+        rate = self.config.SAMPLE_RATE
+        threshold = getattr(self.recognizer, 'energy_threshold', self.config.ENERGY_THRESHOLD)
+        if _frame_energy(block) > threshold:
+            if self._phrase_start is None:
+                preroll = int(self.config.PHRASE_PREROLL * rate)
+                self._phrase_start = max(0, self._ring_total - frames - preroll)
+            self._phrase_last_voice = self._ring_total
+        elif self._phrase_start is None:
+            return
+        
+        silence = self._ring_total - self._phrase_last_voice
+        length = self._ring_total - self._phrase_start
+        if silence >= self.config.PAUSE_THRESHOLD * rate or length >= self.config.PHRASE_TIMEOUT * rate:
+            self._phrases.append((self._phrase_start, self._ring_total))
+            self._phrase_event.set()
+            self._phrase_start = None
+    
+    def _read_phrase(self, start: int, end: int) -> Optional["np.ndarray"]:
+        """Copie une phrase du ring buffer (int16 mono à SAMPLE_RATE)"""
+        size = len(self._ring)
+        if self._ring_total - start > size:
+            return None  # Déjà écrasée par l'audio plus récent
+        
+        begin, stop = start % size, end % size
+        if begin < stop:
+            return self._ring[begin:stop].copy()
+        return np.concatenate((self._ring[begin:], self._ring[:stop]))
     
     def auto_calibrate_microphone(self) -> bool:
         """Auto-calibration intelligente du microphone pour macOS"""
@@ -377,39 +776,59 @@ class EnhancedAudioManager:
         try:
             self.logger.info("🔧 Auto-calibration microphone macOS...")
             
-            with self.microphone as source:
-                # Calibration ambiante
-                old_threshold = self.recognizer.energy_threshold
-                
-                self.recognizer.adjust_for_ambient_noise(
-                    source, 
-                    duration=self.config.AMBIENT_NOISE_DURATION
+            # Calibration ambiante
+            old_threshold = self.recognizer.energy_threshold
+            ambient_samples = int(self.config.SAMPLE_RATE * self.config.AMBIENT_NOISE_DURATION)
+            
+            if (self._input_stream is not None and self._phrase_start is None
+                    and self._ring_total >= ambient_samples):
+                # Flux permanent : dernières secondes du ring buffer, calcul vectorisé
+                ambient = self._read_phrase(self._ring_total - ambient_samples, self._ring_total)
+                self.recognizer.energy_threshold = MacOSAudioOptimizer.compute_threshold(
+                    ambient, self.config.CHUNK_SIZE, self.recognizer.dynamic_energy_ratio
                 )
-                
-                new_threshold = self.recognizer.energy_threshold
-                
-                # Validation du threshold
-                if new_threshold < 100:
-                    self.recognizer.energy_threshold = 200
-                    self.logger.warning("⚠️ Threshold trop bas, ajusté à 200")
-                elif new_threshold > 1000:
-                    self.recognizer.energy_threshold = 800
-                    self.logger.warning("⚠️ Threshold trop haut, ajusté à 800")
-                
-                self.last_calibration = time.time()
-                self.stats['calibrations'] += 1
-                
-                self.logger.info(f"✅ Calibration terminée: {old_threshold} → {self.recognizer.energy_threshold}")
-                return True
+            else:
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(
+                        source, 
+                        duration=self.config.AMBIENT_NOISE_DURATION
+                    )
+            
+            new_threshold = self.recognizer.energy_threshold
+            
+            # Validation du threshold
+            if new_threshold < 100:
+                self.recognizer.energy_threshold = 200
+                self.logger.warning("⚠️ Threshold trop bas, ajusté à 200")
+            elif new_threshold > 1000:
+                self.recognizer.energy_threshold = 800
+                self.logger.warning("⚠️ Threshold trop haut, ajusté à 800")
+            
+            self.last_calibration = time.time()
+            self.is_calibrated = True
+            self.stats.calibrations += 1
+            
+            self.logger.info("✅ Calibration terminée: %s → %s", old_threshold, self.recognizer.energy_threshold)
+            return True
                 
         except Exception as e:
-            self.logger.error(f"❌ Erreur calibration: {e}")
+            self.logger.error("❌ Erreur calibration: %s", e)
             return False
     
     def _should_recalibrate(self) -> bool:
-        """Déterminer si une re-calibration est nécessaire"""
-        # Re-calibration périodique
-        if time.time() - self.last_calibration > self.config.AUTO_CALIBRATE_INTERVAL:
+        """Déterminer si une re-calibration est nécessaire
+        
+        La calibration (AMBIENT_NOISE_DURATION secondes de micro) est faite
+        une fois à l'initialisation ; avec un seuil d'énergie dynamique le
+        recognizer s'adapte pendant chaque écoute, la re-calibration
+        périodique n'est donc utile qu'en seuil fixe.
+        """
+        if not self.is_calibrated:
+            return True
+        
+        # Re-calibration périodique (seuil fixe uniquement)
+        if (not self.config.DYNAMIC_ENERGY_THRESHOLD
+                and time.time() - self.last_calibration > self.config.AUTO_CALIBRATE_INTERVAL):
             return True
         
         # Re-calibration après échecs multiples
@@ -437,7 +856,7 @@ class EnhancedAudioManager:
                 # Tentative de reconnaissance
                 text = self.recognizer.recognize_google(audio, language=self.config.LANGUAGE)
                 
-                self.logger.info(f"✅ Test micro réussi: '{text}'")
+                self.logger.info("✅ Test micro réussi: '%s'", text)
                 return True
                 
         except sr.WaitTimeoutError:
@@ -447,96 +866,204 @@ class EnhancedAudioManager:
             self.logger.info("✅ Micro fonctionne - parole non comprise (normal)")
             return True
         except Exception as e:
-            self.logger.error(f"❌ Test micro échoué: {e}")
+            self.logger.error("❌ Test micro échoué: %s", e)
             return False
     
     def listen_once(self) -> Optional[VoiceCommand]:
-        """Listen optimisé avec wake word detection"""
+        """Listen optimisé avec wake word detection (capture + reconnaissance, bloquant)"""
+        start_time = time.monotonic()
+        audio = self._blocking_listen()
+        command = self._blocking_recognize(audio, start_time) if audio is not None else None
+        
+        # Pause prolongée après échecs multiples
+        if command is None and self._needs_failure_pause():
+            time.sleep(5.0)
+        return command
+    
+    def _blocking_listen(self):
+        """Capture une phrase au microphone (appel bloquant)
+        
+        Returns:
+            np.ndarray int16 depuis le ring buffer sounddevice, sinon
+            sr.AudioData depuis recognizer.listen ; None si rien n'est capté
+        """
         if not self.recognizer or not self.microphone:
             return None
         
-        start_time = time.time()
-        self.stats['total_listens'] += 1
+        self.stats.total_listens += 1
         
         try:
             # Auto-calibration si nécessaire
             if self._should_recalibrate():
                 self.auto_calibrate_microphone()
             
+            if self._input_stream is not None:
+                if not self._phrases:
+                    self._phrase_event.wait(self.config.LISTEN_TIMEOUT)
+                self._phrase_event.clear()
+                try:
+                    phrase = self._phrases.popleft()
+                except IndexError:
+                    return None
+                if phrase is None:  # Arrêt demandé par stop_continuous_listening
+                    return None
+                return self._read_phrase(*phrase)
+            
             with self.microphone as source:
                 # Listen avec timeouts optimisés
-                audio = self.recognizer.listen(
+                return self.recognizer.listen(
                     source,
                     timeout=self.config.LISTEN_TIMEOUT,
                     phrase_time_limit=self.config.PHRASE_TIMEOUT
                 )
-                
-                # Reconnaissance avec langues multiples
-                text = None
-                for language in [self.config.LANGUAGE] + self.config.ALTERNATIVE_LANGUAGES:
-                    try:
-                        text = self.recognizer.recognize_google(audio, language=language)
-                        break
-                    except sr.UnknownValueError:
-                        continue
-                    except sr.RequestError:
-                        continue
-                
-                if not text:
-                    return None
-                
-                # Success metrics
-                response_time = time.time() - start_time
-                self.last_successful_recognition = time.time()
-                self.consecutive_failures = 0
-                self.stats['successful_recognitions'] += 1
-                
-                # Update average response time
-                total_success = self.stats['successful_recognitions']
-                current_avg = self.stats['avg_response_time']
-                self.stats['avg_response_time'] = ((current_avg * (total_success - 1)) + response_time) / total_success
-                
-                # Wake word detection
-                is_wake, wake_matched = self.wake_word_detector.detect_wake_word(text)
-                if is_wake:
-                    self.stats['wake_words_detected'] += 1
-                
-                command = VoiceCommand(
-                    text=text,
-                    confidence=1.0,
-                    timestamp=time.time(),
-                    language=self.config.LANGUAGE,
-                    is_wake_word=is_wake,
-                    wake_word_matched=wake_matched
-                )
-                
-                self.logger.info(f"🎤 Reconnu: '{text}' ({response_time:.2f}s)"
-                                + (f" WAKE: {wake_matched}" if is_wake else ""))
-                return command
-                
         except sr.WaitTimeoutError:
             return None
+        except Exception as e:
+            self.logger.error("❌ Erreur inattendue capture micro: %s", e)
+            self._record_failure()
+            return None
+    
+    def _blocking_recognize(self, audio, start_time: float) -> Optional[VoiceCommand]:
+        """Transcrit une phrase capturée et construit la VoiceCommand
+        
+        Args:
+            audio: Phrase capturée par _blocking_listen
+            start_time: Début de la capture (time.monotonic), pour le temps de réponse
+        """
+        confidence = 1.0
+        try:
+            # Reconnaissance locale si disponible, sinon Google multi-langues
+            if self.stt:
+                text = self._transcribe_locally(audio)
+            else:
+                text = None
+                if self.vosk is not None:
+                    text, confidence = self._transcribe_vosk(audio)
+                if confidence < self.config.VOSK_MIN_CONFIDENCE or not text:
+                    if _is_ring_phrase(audio):
+                        audio = sr.AudioData(audio.tobytes(), self.config.SAMPLE_RATE, 2)
+                    # Hors ligne, la transcription Vosk incertaine reste préférable à rien
+                    google_text = self._recognize_google(audio)
+                    if google_text:
+                        text, confidence = google_text, 1.0
         except sr.UnknownValueError:
             self.logger.debug("❓ Parole détectée mais non reconnue")
             return None
         except sr.RequestError as e:
-            self.logger.error(f"❌ Erreur service reconnaissance: {e}")
-            self.consecutive_failures += 1
+            self.logger.error("❌ Erreur service reconnaissance: %s", e)
+            self._record_failure()
+            return None
         except Exception as e:
-            self.logger.error(f"❌ Erreur inattendue reconnaissance: {e}")
-            self.consecutive_failures += 1
+            self.logger.error("❌ Erreur inattendue reconnaissance: %s", e)
+            self._record_failure()
+            return None
         
-        # Gestion des échecs
-        self.stats['failures'] += 1
+        if not text:
+            return None
         
-        # Pause prolongée après échecs multiples
-        if self.consecutive_failures >= self.config.MAX_RETRIES:
-            self.logger.warning(f"⚠️ {self.consecutive_failures} échecs consécutifs - pause prolongée")
-            time.sleep(5.0)
+        # Success metrics
+        response_time = time.monotonic() - start_time
+        now = time.time()
+        self.last_successful_recognition = now
+        with self._failure_lock:
+            self.consecutive_failures = 0
+        self.stats.successful_recognitions += 1
+        
+        # Update average response time
+        total_success = self.stats.successful_recognitions
+        current_avg = self.stats.avg_response_time
+        self.stats.avg_response_time = ((current_avg * (total_success - 1)) + response_time) / total_success
+        
+        # Wake word detection
+        is_wake, wake_matched = self.wake_word_detector.detect_wake_word(text)
+        if is_wake:
+            self.stats.wake_words_detected += 1
+        
+        command = VoiceCommand(
+            text=text,
+            confidence=confidence,
+            timestamp=now,
+            language=self.config.LANGUAGE,
+            is_wake_word=is_wake,
+            wake_word_matched=wake_matched
+        )
+        
+        if is_wake:
+            self.logger.info("🎤 Reconnu: '%s' (%.2fs) WAKE: %s", text, response_time, wake_matched)
+        else:
+            self.logger.info("🎤 Reconnu: '%s' (%.2fs)", text, response_time)
+        return command
+    
+    def _record_failure(self):
+        """Comptabilise un échec de capture ou de reconnaissance"""
+        with self._failure_lock:
+            self.consecutive_failures += 1
+            self.stats.failures += 1
+    
+    def _needs_failure_pause(self) -> bool:
+        """True (et remise à zéro du compteur) après MAX_RETRIES échecs consécutifs"""
+        with self._failure_lock:
+            failures = self.consecutive_failures
+            if failures < self.config.MAX_RETRIES:
+                return False
             self.consecutive_failures = 0
         
+        self.logger.warning("⚠️ %s échecs consécutifs - pause prolongée", failures)
+        return True
+    
+    def _recognize_google(self, audio: "sr.AudioData") -> Optional[str]:
+        """Reconnaissance Google, langue principale puis alternatives"""
+        for language in [self.config.LANGUAGE] + self.config.ALTERNATIVE_LANGUAGES:
+            try:
+                return self.recognizer.recognize_google(audio, language=language)
+            except sr.UnknownValueError:
+                continue
+            except sr.RequestError as e:
+                # Réseau indisponible : inutile de renvoyer l'audio dans une autre langue
+                self.logger.warning("⚠️ Google Speech indisponible: %s", e)
+                return None
         return None
     
+    def _transcribe_vosk(self, audio) -> tuple:
+        """Transcrit une phrase avec Vosk en une seule passe
+        
+        Args:
+            audio: ndarray int16 du ring buffer ou sr.AudioData
+            
+        Returns:
+            (texte ou None, confiance moyenne des mots entre 0 et 1)
+        """
+        if _is_ring_phrase(audio):
+            data = audio.tobytes()
+        else:
+            data = audio.get_raw_data(convert_rate=self.config.SAMPLE_RATE, convert_width=2)
+        
+        self.vosk.AcceptWaveform(data)
+        result = json.loads(self.vosk.FinalResult())  # Réinitialise aussi le recognizer
+        words = result.get("result")
+        if not words:
+            return None, 0.0
+        confidence = sum(word["conf"] for word in words) / len(words)
+        return result.get("text") or None, confidence
+    
+    def _transcribe_locally(self, audio) -> Optional[str]:
+        """Transcrit l'audio capturé (ndarray du ring buffer ou sr.AudioData) avec Whisper"""
+        if _is_ring_phrase(audio):
+            samples = audio.astype(np.float32)
+            samples *= 1.0 / 32768.0
+        else:
+            samples = np.frombuffer(
+                audio.get_raw_data(convert_rate=16000, convert_width=2), np.int16
+            ).astype(np.float32) / 32768.0
+        
+        segments, _ = self.stt.transcribe(
+            samples,
+            language=self.config.LANGUAGE.split('-')[0],
+            beam_size=1,
+            vad_filter=True
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip() or None
+    
     def start_continuous_listening(self):
         """Start optimized continuous listening with wake word detection"""
         if not self.recognizer or not self.microphone:
@@ -547,46 +1074,69 @@ class EnhancedAudioManager:
             self.logger.warning("⚠️ Déjà en écoute")
             return
         
-        def _intelligent_listen_loop():
-            self.logger.info("🎤 Démarrage écoute intelligente avec wake word...")
-            
-            while self.is_listening:
-                # Vérification état et pause si nécessaire
-                if self.consecutive_failures >= self.config.MAX_RETRIES:
-                    time.sleep(self.config.RETRY_DELAY * 2)
-                    continue
-                
-                # Écoute de commande
-                command = self.listen_once()
-                
-                if command:
-                    # Mettre en queue pour traitement
-                    self.voice_queue.put(command)
-                    
-                    # Log spécial pour wake words
-                    if command.is_wake_word:
-                        self.logger.info(f"🎯 WAKE WORD détecté: {command.wake_word_matched}")
-                    
-                    # Pause courte après succès
-                    time.sleep(0.3)
-                else:
-                    # Délai intelligent basé sur taux d'échec
-                    delay = self.config.RETRY_DELAY
-                    if self.consecutive_failures > 0:
-                        delay *= (1 + self.consecutive_failures * 0.3)
-                    
-                    time.sleep(min(delay, 3.0))
-                
-                # Nettoyage mémoire périodique
-                if self.stats['total_listens'] % 50 == 0:
-                    gc.collect()
+        # Sentinelle None et phrases captées hors écoute laissées par le
+        # dernier stop_continuous_listening : la nouvelle boucle repart à vide
+        self._phrases.clear()
+        self._phrase_event.clear()
         
         self.is_listening = True
-        self.listen_thread = threading.Thread(target=_intelligent_listen_loop, daemon=True)
-        self.listen_thread.start()
+        self._stop_event.clear()
+        self._listen_future = asyncio.run_coroutine_threadsafe(self._listen_loop(), self._loop)
         
         self.logger.info("🎤 Écoute continue démarrée avec optimisations macOS")
     
+    async def _listen_loop(self):
+        """Capture en continu ; chaque phrase est transcrite pendant la capture de la suivante"""
+        self.logger.info("🎤 Démarrage écoute intelligente avec wake word...")
+        loop = asyncio.get_running_loop()
+        pending = set()
+        
+        while self.is_listening:
+            # Pause et backoff en tête de chaque tour : les échecs de
+            # reconnaissance (exécuteur STT) comptent autant que ceux de capture,
+            # les phrases captées entre-temps attendent dans le ring buffer
+            if self._needs_failure_pause():
+                if await self._wait_stop(5.0):
+                    break
+            elif self.consecutive_failures > 0:
+                # Délai intelligent basé sur taux d'échec
+                delay = self.config.RETRY_DELAY * (1 + self.consecutive_failures * 0.3)
+                if await self._wait_stop(min(delay, 3.0)):
+                    break
+            
+            start_time = time.monotonic()
+            audio = await loop.run_in_executor(self._io_pool, self._blocking_listen)
+            
+            if audio is not None:
+                task = asyncio.create_task(self._recognize_and_enqueue(audio, start_time))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _wait_stop(self, delay: float) -> bool:
+        """Pause interruptible : True si l'arrêt de l'écoute a été demandé"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _recognize_and_enqueue(self, audio, start_time: float):
+        """Reconnaît une phrase sur l'exécuteur STT puis met la commande en queue"""
+        loop = asyncio.get_running_loop()
+        command = await loop.run_in_executor(self._cpu_pool, self._blocking_recognize,
+                                             audio, start_time)
+        if not command:
+            return
+        
+        self._enqueue_command(command)
+        
+        # Log spécial pour wake words
+        if command.is_wake_word:
+            self.logger.info("🎯 WAKE WORD détecté: %s", command.wake_word_matched)
+    
     def stop_continuous_listening(self):
         """Stop continuous listening"""
         if not self.is_listening:
@@ -594,63 +1144,82 @@ class EnhancedAudioManager:
         
         self.is_listening = False
         
-        if self.listen_thread:
-            self.listen_thread.join(timeout=2.0)
+        # Réveille la boucle : pause de backoff et attente d'une phrase du ring buffer
+        self._loop.call_soon_threadsafe(self._stop_event.set)
+        self._phrases.append(None)
+        self._phrase_event.set()
+        
+        if self._listen_future:
+            try:
+                self._listen_future.result(timeout=self.config.LISTEN_TIMEOUT + 2.0)
+            except Exception:
+                self._listen_future.cancel()
+            self._listen_future = None
         
         self.logger.info("🔇 Écoute continue arrêtée")
     
     def speak(self, text: str, force_french: bool = True) -> bool:
-        """Synthèse vocale française optimisée"""
-        if not self.tts_engine:
+        """Synthèse vocale française optimisée
+        
+        Le texte est mis en file pour le thread TTS et la méthode retourne
+        immédiatement : la génération de la réponse suivante peut continuer
+        pendant que la phrase courante est prononcée.
+        
+        Returns:
+            True si le texte a été mis en file, False si le TTS est indisponible
+        """
+        if not self._tts_thread:
             self.logger.error("❌ TTS engine non disponible")
             return False
         
-        try:
-            # Traitement du texte pour le français
-            if force_french and text:
-                # Nettoyage du texte pour meilleure prononciation française
-                processed_text = self._process_french_text(text)
-            else:
-                processed_text = text
-            
-            self.logger.info(f"🔊 Gideon dit (FR): {processed_text}")
-            
-            # Synthèse vocale
-            self.tts_engine.say(processed_text)
-            self.tts_engine.runAndWait()
-            
-            return True
+        # Traitement du texte pour le français
+        if force_french and text:
+            # Nettoyage du texte pour meilleure prononciation française
+            processed_text = self._process_french_text(text)
+        else:
+            processed_text = text
+        
+        self.logger.info("🔊 Gideon dit (FR): %s", processed_text)
+        self._tts_queue.put(processed_text)
+        return True
+    
+    def _tts_worker(self):
+        """Consomme la file TTS ; None arrête le thread"""
+        while True:
+            text = self._tts_queue.get()
+            if text is None:
+                break
             
-        except Exception as e:
-            self.logger.error(f"❌ Erreur synthèse vocale française: {e}")
-            return False
+            self.is_speaking = True
+            try:
+                if self.piper_voice:
+                    self._speak_piper(text)
+                else:
+                    self.tts_engine.say(text)
+                    self.tts_engine.runAndWait()
+            except Exception as e:
+                self.logger.error("❌ Erreur synthèse vocale française: %s", e)
+            finally:
+                self.is_speaking = not self._tts_queue.empty()
+    
+    def _speak_piper(self, text: str):
+        """Joue chaque fragment PCM int16 dès que Piper l'a synthétisé"""
+        with sd.OutputStream(samplerate=self.piper_voice.config.sample_rate,
+                             channels=1, dtype='int16') as stream:
+            for audio_bytes in self.piper_voice.synthesize_stream_raw(text):
+                stream.write(np.frombuffer(audio_bytes, dtype=np.int16))
     
     def _process_french_text(self, text: str) -> str:
         """Améliore le texte pour la synthèse vocale française"""
         if not text:
             return text
         
-        # Remplacements pour meilleure prononciation française
-        replacements = {
-            ' IA ': ' intelligence artificielle ',
-            ' AI ': ' intelligence artificielle ',
-            ' OK ': ' d\'accord ',
-            ' email ': ' courriel ',
-            ' emails ': ' courriels ',
-            ' web ': ' ouèbe ',
-            ' wifi ': ' wi-fi ',
-            ' bluetooth ': ' bluetooth ',
-            '°C': ' degrés Celsius',
-            '°F': ' degrés Fahrenheit',
-            ' USD ': ' dollars américains ',
-            ' EUR ': ' euros ',
-        }
-        
-        processed = text
-        for old, new in replacements.items():
-            processed = processed.replace(old, new)
-        
-        return processed
+        # Une seule passe regex au lieu d'un str.replace par terme
+        return self._FRENCH_TEXT_PATTERN.sub(self._french_replacement, text)
+    
+    @classmethod
+    def _french_replacement(cls, match: re.Match) -> str:
+        return cls.FRENCH_REPLACEMENTS[match.group(0)]
     
     def test_french_audio_complete(self) -> bool:
         """Test complet du système audio français"""
@@ -713,7 +1282,7 @@ class EnhancedAudioManager:
             
             # Reconnaissance française
             text = self.recognizer.recognize_google(audio, language="fr-FR")
-            self.logger.info(f"✅ Reconnu en français: '{text}'")
+            self.logger.info("✅ Reconnu en français: '%s'", text)
             
             # Confirmer par synthèse vocale
             confirmation = f"J'ai entendu: {text}"
@@ -728,14 +1297,24 @@ class EnhancedAudioManager:
             self.logger.warning("❓ Parole française non comprise")
             return False
         except Exception as e:
-            self.logger.error(f"❌ Erreur test micro français: {e}")
+            self.logger.error("❌ Erreur test micro français: %s", e)
             return False
     
+    def _enqueue_command(self, command: VoiceCommand):
+        """Ajoute une commande à la queue, en jetant la plus ancienne si pleine"""
+        if len(self.voice_queue) == self.voice_queue.maxlen:
+            self.logger.warning("⚠️ Queue vocale pleine - commande ignorée: '%s'", self.voice_queue[0].text)
+        self.voice_queue.append(command)
+        self._voice_event.set()
+    
     def get_next_command(self, timeout: float = None) -> Optional[VoiceCommand]:
         """Get next voice command from queue"""
+        if not self.voice_queue:
+            self._voice_event.wait(timeout)
+        self._voice_event.clear()
         try:
-            return self.voice_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self.voice_queue.popleft()
+        except IndexError:
             return None
     
     def get_stats(self) -> dict:
@@ -743,21 +1322,21 @@ class EnhancedAudioManager:
         success_rate = 0
         wake_word_rate = 0
         
-        if self.stats['total_listens'] > 0:
-            success_rate = (self.stats['successful_recognitions'] / self.stats['total_listens']) * 100
+        if self.stats.total_listens > 0:
+            success_rate = (self.stats.successful_recognitions / self.stats.total_listens) * 100
         
-        if self.stats['successful_recognitions'] > 0:
-            wake_word_rate = (self.stats['wake_words_detected'] / self.stats['successful_recognitions']) * 100
+        if self.stats.successful_recognitions > 0:
+            wake_word_rate = (self.stats.wake_words_detected / self.stats.successful_recognitions) * 100
         
         return {
-            'total_listens': self.stats['total_listens'],
-            'successful_recognitions': self.stats['successful_recognitions'],
-            'wake_words_detected': self.stats['wake_words_detected'],
-            'failures': self.stats['failures'],
-            'calibrations': self.stats['calibrations'],
+            'total_listens': self.stats.total_listens,
+            'successful_recognitions': self.stats.successful_recognitions,
+            'wake_words_detected': self.stats.wake_words_detected,
+            'failures': self.stats.failures,
+            'calibrations': self.stats.calibrations,
             'success_rate': f"{success_rate:.1f}%",
             'wake_word_rate': f"{wake_word_rate:.1f}%",
-            'avg_response_time': f"{self.stats['avg_response_time']:.2f}s",
+            'avg_response_time': f"{self.stats.avg_response_time:.2f}s",
             'consecutive_failures': self.consecutive_failures,
             'is_listening': self.is_listening,
             'is_speaking': self.is_speaking,
@@ -769,20 +1348,60 @@ class EnhancedAudioManager:
         """Enhanced cleanup with macOS optimizations"""
         self.stop_continuous_listening()
         
+        # Abandonner les phrases en attente puis arrêter le thread TTS
+        if self._tts_thread:
+            while True:
+                try:
+                    self._tts_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._tts_queue.put(None)
+            self._tts_thread.join(timeout=2.0)
+            self._tts_thread = None
+        
         if self.tts_engine:
             try:
                 self.tts_engine.stop()
             except:
                 pass
         
-        # Clear queue
-        while not self.voice_queue.empty():
+        if self._input_stream is not None:
             try:
-                self.voice_queue.get_nowait()
-            except queue.Empty:
-                break
+                self._input_stream.stop()
+                self._input_stream.close()
+            except Exception:
+                pass
+            self._input_stream = None
+        
+        # Arrêt de la boucle d'écoute et des exécuteurs
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=2.0)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+        
+        # Clear queue
+        self.voice_queue.clear()
         
         self.logger.info("🧹 Audio manager cleanup terminé (optimisé macOS)")
 
-# Instance globale corrigée pour le français
-audio_manager = EnhancedAudioManager() 
\ No newline at end of file
+# Instance globale corrigée pour le français, créée au premier usage :
+# importer le module n'initialise ni le micro ni le TTS
+_audio_manager: Optional[EnhancedAudioManager] = None
+_audio_manager_lock = threading.Lock()
+
+
+def get_audio_manager() -> EnhancedAudioManager:
+    """Retourne l'instance partagée d'EnhancedAudioManager, créée au premier appel"""
+    global _audio_manager
+    if _audio_manager is None:
+        with _audio_manager_lock:
+            if _audio_manager is None:
+                _audio_manager = EnhancedAudioManager()
+    return _audio_manager
+
+
+def __getattr__(name):
+    # `from core.audio_manager_optimized import audio_manager` reste valide (PEP 562)
+    if name == "audio_manager":
+        return get_audio_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,34 @@ from collections import deque
 import os
 import sys
 
+# Seuils GC en régime établi, communs à toute l'application : les blocs
+# audio sont des tableaux NumPy (non suivis par le GC) et chaque tour de
+# conversation n'alloue que quelques dicts, la génération 0 peut être rare
+GC_THRESHOLDS = (50000, 20, 20)
+
+_startup_heap_frozen = False
+
+
+def freeze_startup_heap():
+    """Gèle le tas de démarrage et applique GC_THRESHOLDS (une fois par processus)
+    
+    À appeler depuis le point d'entrée, une fois tous les composants construits :
+    modèles, clients et caches vont dans la génération permanente que le GC
+    ne parcourt plus. Les appels suivants sont ignorés.
+    """
+    global _startup_heap_frozen
+    if _startup_heap_frozen:
+        return
+    _startup_heap_frozen = True
+    
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(*GC_THRESHOLDS)
+    logging.getLogger("MemoryMonitor").info(
+        f"🧊 Tas de démarrage gelé ({gc.get_freeze_count()} objets), seuils GC {GC_THRESHOLDS}"
+    )
+
+
 @dataclass
 class MemoryThresholds:
     """Memory usage thresholds for different alert levels"""
@@ -27,6 +55,7 @@ class MemoryThresholds:
     GC_INTERVAL: int = 100    # Checks before forcing GC
     ALERT_INTERVAL: int = 30  # Seconds between alerts
     MONITORING_INTERVAL: int = 5  # Seconds between checks
+    USAGE_CACHE_TTL: float = 1.0  # Seconds between RSS reads in get_memory_usage
 
 @dataclass
 class MemoryInfo:
@@ -68,6 +97,41 @@ class MemoryMonitor:
         }
         
         self.process = psutil.Process()
+        
+        # Cached RSS reading for get_memory_usage()
+        self._last_check = float('-inf')
+        self._cached_mb = 0.0
+    
+    def get_memory_usage(self) -> float:
+        """Get process RSS in MB (cheap, re-read at most once per second)
+
+        Unlike get_current_memory(), this skips gc.get_objects(), GC stats and
+        system-wide memory queries, so it can sit on a per-command path.
+        """
+        now = time.monotonic()
+        if now - self._last_check >= self.thresholds.USAGE_CACHE_TTL:
+            try:
+                self._cached_mb = self.process.memory_info().rss / 1024 / 1024
+                self._last_check = now
+            except psutil.Error as e:
+                self.logger.error(f"❌ Error getting memory usage: {e}")
+        return self._cached_mb
+    
+    def check_memory_limit(self, limit_mb: Optional[float] = None) -> bool:
+        """Return True while RSS stays below limit_mb (default: HIGH_USAGE)"""
+        if limit_mb is None:
+            limit_mb = self.thresholds.HIGH_USAGE
+        return self.get_memory_usage() < limit_mb
+    
+    def force_garbage_collection(self, generation: int = 0) -> int:
+        """Run a garbage collection, young generation only by default
+
+        A gen-0 sweep is cheap enough for periodic checks; pass generation=2
+        for a full collection. Returns the number of objects collected.
+        """
+        collected = gc.collect(generation)
+        self.logger.debug(f"🗑️ GC gen {generation}: collected {collected} objects")
+        return collected
     
     def get_current_memory(self) -> MemoryInfo:
         """Get current memory usage information"""
@@ -145,26 +209,6 @@ class MemoryMonitor:
         # Step 3: Force full GC
         gc.collect()
         
-        # Step 4: Clear some internal caches if possible
-        try:
-            # Clear import cache for modules not in use
-            import sys
-            modules_to_remove = []
-            for module_name in sys.modules:
-                if module_name.startswith('_'):  # Private modules
-                    continue
-                module = sys.modules[module_name]
-                if hasattr(module, '__file__') and module.__file__:
-                    # Keep core modules
-                    if any(core in module.__file__ for core in ['core', 'config', 'gideon']):
-                        continue
-                    # Mark others for potential removal (be careful)
-                    
-            # Additional cleanup can be added here
-            
-        except Exception as e:
-            self.logger.debug(f"⚠️ Cache cleanup warning: {e}")
-        
         # Final measurement
         final_memory = self.get_current_memory()
         if not final_memory:
@@ -0,0 +1,61 @@
+"""
+Dépendances optionnelles de Gideon, testées sans être importées.
+
+`bool(HAS_X)` vérifie seulement que le module est installé
+(importlib.util.find_spec) ; l'import réel n'a lieu qu'au premier accès
+à `HAS_X.module`.
+"""
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Optional
+
+
+class LazyImportTester:
+    """Teste la présence d'un module et ne l'importe qu'à la demande"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._available: Optional[bool] = None
+        self._module: Optional[ModuleType] = None
+
+    def __bool__(self) -> bool:
+        if self._available is None:
+            try:
+                self._available = importlib.util.find_spec(self.name) is not None
+            except (ImportError, ValueError):
+                self._available = False
+        return self._available
+
+    @property
+    def module(self) -> ModuleType:
+        """Importe le module au premier accès puis le garde en cache
+
+        Raises:
+            ImportError: si le module n'est pas installé ou échoue à l'import
+        """
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self.name)
+            except ImportError:
+                self._available = False
+                raise
+            self._available = True
+        return self._module
+
+    def __repr__(self) -> str:
+        return f"LazyImportTester({self.name!r})"
+
+
+HAS_CV2 = LazyImportTester("cv2")
+HAS_MTCNN = LazyImportTester("mtcnn")
+HAS_NUMPY = LazyImportTester("numpy")
+HAS_PIL = LazyImportTester("PIL")
+HAS_PSUTIL = LazyImportTester("psutil")
+HAS_PYTTSX3 = LazyImportTester("pyttsx3")
+HAS_SOUNDDEVICE = LazyImportTester("sounddevice")
+HAS_SPEECH_RECOGNITION = LazyImportTester("speech_recognition")
+HAS_OPENAI = LazyImportTester("openai")
+HAS_REQUESTS = LazyImportTester("requests")
+HAS_SENTENCE_TRANSFORMERS = LazyImportTester("sentence_transformers")
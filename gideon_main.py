@@ -6,9 +6,12 @@ Futuristic AI assistant with desktop overlay interface
 
 import sys
 import signal
+import shlex
+import subprocess
 import threading
 import time
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence, Union
 
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from PyQt6.QtCore import QTimer
@@ -19,6 +22,34 @@ from core import GideonCore, GideonLogger
 from ui import GideonOverlay
 from modules import SmartHomeModule
 
+# Commandes système déclenchées par l'événement 'system_command'
+SYSTEM_COMMANDS = {
+    'open_vscode': "code",
+}
+
+
+@lru_cache(maxsize=128)
+def _split_command(command: str) -> tuple:
+    """Parse a command line once (no shell involved)"""
+    return tuple(shlex.split(command))
+
+
+def launch_detached(command: Union[str, Sequence[str]]) -> subprocess.Popen:
+    """
+    Launch an application without a shell, in its own session, so it does
+    not inherit the assistant's terminal, audio or camera file descriptors
+    """
+    args = _split_command(command) if isinstance(command, str) else list(command)
+    return subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True
+    )
+
+
 class GideonApplication:
     """
     Main Gideon AI Assistant application
@@ -359,14 +390,15 @@ class GideonApplication:
     def _handle_system_command(self, data):
         """Handle system command events"""
         action = data.get('action')
+        command = SYSTEM_COMMANDS.get(action)
+        if command is None:
+            return
         
-        if action == 'open_vscode':
-            import subprocess
-            try:
-                subprocess.Popen(["code"])
-                self.logger.info("Opened Visual Studio Code")
-            except Exception as e:
-                self.logger.error(f"Failed to open VS Code: {e}")
+        try:
+            launch_detached(command)
+            self.logger.info(f"System command launched: {action}")
+        except Exception as e:
+            self.logger.error(f"Failed to run system command {action}: {e}")
     
     def _handle_voice_command(self, data):
         """Handle voice command events"""
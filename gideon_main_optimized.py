@@ -24,10 +24,6 @@ from typing import Dict
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Early memory optimization
-import gc
-gc.set_threshold(700, 10, 10)
-
 try:
     from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar, QTextEdit
     from PyQt6.QtCore import QTimer, QThread, pyqtSignal, Qt
@@ -47,8 +43,8 @@ from config import config
 from core.logger import GideonLogger
 from core.event_system import EventSystem
 from core.audio_manager_optimized import audio_manager
-from core.assistant_core_production import assistant_core
-from core.memory_monitor import memory_monitor
+from core.assistant_core_production import get_assistant_core
+from core.memory_monitor import memory_monitor, freeze_startup_heap
 
 class GideonHealthMonitor:
     """Système de monitoring santé en temps réel"""
@@ -94,11 +90,11 @@ class GideonHealthMonitor:
         """Vérifier santé système IA"""
         try:
             # Utiliser la bonne interface AssistantCore Ollama
-            if not assistant_core.ollama_client.is_available:
+            if not get_assistant_core().ollama_client.is_available:
                 return 'WARNING'  # Fallbacks disponibles
             
             # Test simple API avec la nouvelle interface
-            test_result = assistant_core.generate_ai_response("test")
+            test_result = get_assistant_core().generate_ai_response("test")
             if test_result and test_result.get('success', False):
                 return 'HEALTHY'
             else:
@@ -337,7 +333,7 @@ class ProductionDebugPanel(QWidget):
             self.audio_stats.setText(audio_text)
             
             # AI Stats
-            ai_stats = assistant_core.get_stats()
+            ai_stats = get_assistant_core().get_stats()
             ai_text = (f"Requests: {ai_stats['total_requests']} | "
                       f"AI Success: {ai_stats['successful_ai_responses']} | "
                       f"Fallbacks: {ai_stats['fallback_responses']} | "
@@ -390,7 +386,7 @@ class ProductionDebugPanel(QWidget):
                         self.log_message(f"🗣️ Entendu (FR): {text}")
                         # Traiter avec Ollama français
                         try:
-                            result = assistant_core.generate_ai_response(text)
+                            result = get_assistant_core().generate_ai_response(text)
                             if result and result.get('success'):
                                 response = result['response']
                                 self.log_message(f"🤖 Gideon: {response}")
@@ -420,7 +416,7 @@ class ProductionDebugPanel(QWidget):
                 audio_ok = audio_manager.test_microphone()
                 
                 # Test AI
-                ai_response = assistant_core.generate_ai_response("test")
+                ai_response = get_assistant_core().generate_ai_response("test")
                 ai_ok = ai_response and len(ai_response) > 0
                 
                 # Test TTS
@@ -535,6 +531,9 @@ class ProductionGideonApp:
         welcome_msg = "Hello! Gideon AI is ready and optimized for production use."
         audio_manager.speak(welcome_msg)
         
+        # Tous les composants sont construits (le health check a créé le core)
+        freeze_startup_heap()
+        
         self.running = True
         self.logger.info("🎉 Gideon AI Production PRÊT!")
         return True
@@ -559,11 +558,12 @@ class ProductionGideonApp:
                         # Traitement intelligent
                         def process_command():
                             try:
-                                result = assistant_core.process_voice_command(command.text)
+                                # Réponse streamée : chaque phrase est dite dès qu'elle est prête
+                                result = get_assistant_core().process_voice_command(
+                                    command.text, speak=audio_manager.speak
+                                )
                                 
                                 if result['success']:
-                                    # Parler la réponse
-                                    audio_manager.speak(result['response'])
                                     
                                     # Utiliser 'response_time' au lieu de 'processing_time'
                                     response_time = result.get('response_time', 0)
@@ -644,7 +644,7 @@ class ProductionGideonApp:
         memory_monitor.stop_monitoring()
         
         # Cleanup assistant
-        assistant_core.cleanup()
+        get_assistant_core().cleanup()
         
         # Rapport final
         final_report = memory_monitor.get_memory_report()
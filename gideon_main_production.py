@@ -40,6 +40,11 @@ if SYSTEM_OS == "Linux" and "WAYLAND_DISPLAY" in os.environ:
 from core.assistant_core_production import AssistantCore
 from core.event_system import EventSystem
 from core.logger import GideonLogger
+from core.memory_monitor import freeze_startup_heap
+from core.optionals import (
+    HAS_CV2, HAS_MTCNN, HAS_OPENAI, HAS_PSUTIL, HAS_PYTTSX3,
+    HAS_SOUNDDEVICE, HAS_SPEECH_RECOGNITION
+)
 from config import config
 
 # UI conditionnelle
@@ -120,50 +125,20 @@ class SystemCompatibilityChecker:
             'memory_sufficient': True
         }
         
-        # Test imports
-        try:
-            from openai import OpenAI
-            compatibility['openai_available'] = True
-        except ImportError:
-            pass
-        
-        try:
-            import sounddevice as sd
-            compatibility['audio_available'] = True
-        except ImportError:
-            pass
-        
-        try:
-            import speech_recognition as sr
-            compatibility['speech_recognition_available'] = True
-        except ImportError:
-            pass
-        
-        try:
-            import pyttsx3
-            compatibility['tts_available'] = True
-        except ImportError:
-            pass
-        
-        try:
-            import cv2
-            compatibility['opencv_available'] = True
-        except ImportError:
-            pass
-        
-        try:
-            from mtcnn import MTCNN
-            compatibility['face_detection_available'] = True
-        except ImportError:
-            pass
+        # Test de présence sans import : cv2 et mtcnn (TensorFlow) ne sont
+        # chargés que lorsque l'authentification faciale s'en sert
+        compatibility['openai_available'] = bool(HAS_OPENAI)
+        compatibility['audio_available'] = bool(HAS_SOUNDDEVICE)
+        compatibility['speech_recognition_available'] = bool(HAS_SPEECH_RECOGNITION)
+        compatibility['tts_available'] = bool(HAS_PYTTSX3)
+        compatibility['opencv_available'] = bool(HAS_CV2)
+        compatibility['face_detection_available'] = bool(HAS_MTCNN)
         
         # Test mémoire
-        try:
-            import psutil
+        if HAS_PSUTIL:
+            psutil = HAS_PSUTIL.module
             available_memory = psutil.virtual_memory().available
             compatibility['memory_sufficient'] = available_memory > 500 * 1024 * 1024  # 500MB
-        except ImportError:
-            pass
         
         return compatibility
 
@@ -185,15 +160,15 @@ class SystemCompatibilityChecker:
         except:
             pass
         
-        # Test caméra basique
-        try:
-            import cv2
-            cap = cv2.VideoCapture(0)
-            permissions['camera'] = cap.isOpened()
-            if cap.isOpened():
-                cap.release()
-        except:
-            pass
+        # Test caméra basique (seul endroit du check qui charge cv2)
+        if HAS_CV2:
+            try:
+                cap = HAS_CV2.module.VideoCapture(0)
+                permissions['camera'] = cap.isOpened()
+                if cap.isOpened():
+                    cap.release()
+            except:
+                pass
         
         return permissions
     
@@ -337,6 +312,9 @@ class GideonApplication:
         # Démarrer tâches de fond
         self._start_background_tasks()
         
+        # Tous les composants sont construits : geler le tas de démarrage
+        freeze_startup_heap()
+        
         self.logger.info("🎉 Gideon AI Assistant prêt !")
         return True
     
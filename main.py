@@ -291,10 +291,10 @@ EXEMPLES:
                 print("💾 Mémoire: Info non disponible")
                 
         # Stats assistant
-        if self.assistant_core and hasattr(self.assistant_core, 'stats'):
-            stats = self.assistant_core.stats
+        if self.assistant_core and hasattr(self.assistant_core, 'get_stats'):
+            stats = self.assistant_core.get_stats()
             print(f"📈 Requêtes: {stats['total_requests']}")
-            print(f"📈 Ollama: {stats['ollama_responses']}")
+            print(f"📈 Ollama: {stats['successful_ai_responses']}")
             print(f"📈 Fallbacks: {stats['fallback_responses']}")
     
     def start_gui_mode(self):
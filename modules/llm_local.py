@@ -7,6 +7,7 @@ Local LLM Manager - Ollama Integration
 import requests
 import json
 import logging
+import re
 import time
 from typing import Iterator, Optional, Dict, Any, List
 from dataclasses import dataclass
@@ -28,10 +29,17 @@ class LLMResponse:
 class OllamaManager:
     """Manager for local Ollama LLM interactions"""
     
+    # Fallback categories detected from keywords (one named group per category)
+    FALLBACK_CATEGORY_PATTERN = re.compile(
+        r'\b(?:(?P<greeting>hello|hi|hey|greetings))\b',
+        re.IGNORECASE
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger("OllamaManager")
         self.host = config.ai.OLLAMA_HOST
         self.default_model = config.ai.DEFAULT_MODEL
+        self._system_msg = {"role": "system", "content": config.ai.SYSTEM_PROMPT}
         self.session = requests.Session()
         
         # Connection state
@@ -126,19 +134,18 @@ class OllamaManager:
     
     def _get_fallback_response(self, prompt: str, category: str = 'general') -> str:
         """Get intelligent fallback response"""
-        import hashlib
-        
         # Simple categorization
-        if any(word in prompt.lower() for word in ['hello', 'hi', 'hey', 'greetings']):
-            category = 'greeting'
-        elif len(prompt.strip()) == 0:
+        match = self.FALLBACK_CATEGORY_PATTERN.search(prompt)
+        if match:
+            category = match.lastgroup
+        elif not prompt.strip():
             category = 'error'
         
         responses = self.fallback_responses.get(category, self.fallback_responses['general'])
         
-        # Pseudo-random selection based on prompt
-        hash_input = f"{prompt}{int(time.time() / 300)}"  # Changes every 5 minutes
-        hash_val = int(hashlib.md5(hash_input.encode()).hexdigest(), 16)
+        # Pseudo-random selection based on prompt, changes every 5 minutes
+        bucket = int(time.time()) // 300
+        hash_val = (hash(prompt) ^ bucket * 0x9E3779B97F4A7C15) & 0xFFFFFFFF
         selected = responses[hash_val % len(responses)]
         
         self.logger.info(f"📤 Fallback response ({category}): {selected}")
@@ -211,11 +218,12 @@ class OllamaManager:
         model = model or self.default_model
         max_tokens = max_tokens or config.ai.MAX_TOKENS
         temperature = temperature or config.ai.TEMPERATURE
-        system_prompt = system_prompt or config.ai.SYSTEM_PROMPT
         
-        # Build messages
+        # Build messages (prompt système par défaut : dict partagé)
+        system_msg = ({"role": "system", "content": system_prompt} if system_prompt
+                      else self._system_msg)
         messages = [
-            {"role": "system", "content": system_prompt},
+            system_msg,
             {"role": "user", "content": prompt}
         ]
         
@@ -297,7 +305,7 @@ class OllamaManager:
             payload = {
                 "model": model,
                 "messages": [
-                    {"role": "system", "content": config.ai.SYSTEM_PROMPT},
+                    self._system_msg,
                     {"role": "user", "content": prompt}
                 ],
                 "stream": True
@@ -383,10 +391,7 @@ class OllamaManager:
             
             # Add default system message if none provided
             if not system_added:
-                formatted_messages.insert(0, {
-                    "role": "system", 
-                    "content": config.ai.SYSTEM_PROMPT
-                })
+                formatted_messages.insert(0, self._system_msg)
             
             payload = {
                 "model": model,
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests du cache de réponses de GideonCore (exact + sémantique)
+L'embedder est remplacé par des vecteurs fixes : aucun modèle requis
+"""
+
+import asyncio
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# GideonCore importe ces modules sans fallback
+for module in ("face_recognition", "cv2", "speech_recognition", "pyttsx3", "httpx"):
+    pytest.importorskip(module)
+
+import numpy as np
+
+from config import config
+from core.assistant_core import GideonCore
+
+
+def make_core(embedder):
+    """GideonCore réduit à ses caches (sans micro, TTS ni client HTTP)"""
+    core = GideonCore.__new__(GideonCore)
+    core._response_cache = OrderedDict()
+    core._cache_embeddings = np.empty((0, config.memory.EMBEDDING_DIMENSION), np.float32)
+    core._cache_responses = []
+    core.embedder = embedder
+    return core
+
+
+def test_semantic_cache_hit_and_miss(fake_embedder, unit):
+    """Une question proche retrouve la réponse, une question éloignée non"""
+    core = make_core(fake_embedder({
+        "quelle heure est-il": unit(1.0, 0.0),
+        "quelle heure est-il ?": unit(1.0, 0.05),
+        "raconte une blague": unit(0.0, 1.0),
+    }))
+
+    cached, embedding = asyncio.run(core._get_cached_response("Quelle heure est-il"))
+    assert cached is None
+    core._cache_response("Quelle heure est-il", "Il est midi.", embedding)
+
+    # Le prompt n'est encodé qu'une fois : l'embedding du lookup est réutilisé
+    assert core.embedder.calls == 1
+
+    cached, _ = asyncio.run(core._get_cached_response("quelle heure est-il ?"))
+    assert cached == "Il est midi."
+
+    cached, _ = asyncio.run(core._get_cached_response("raconte une blague"))
+    assert cached is None
+
+
+def test_exact_cache_hit_skips_embedding(fake_embedder, unit):
+    """Le cache exact répond sans calculer d'embedding"""
+    core = make_core(fake_embedder({"bonjour": unit(1.0)}))
+    core._cache_response("Bonjour", "Bonjour !")
+
+    assert asyncio.run(core._get_cached_response(" bonjour ")) == ("Bonjour !", None)
+    assert core.embedder.calls == 0
+
+
+def test_semantic_cache_is_bounded(fake_embedder, unit):
+    """Le cache sémantique garde au plus SEMANTIC_CACHE_SIZE réponses"""
+    limit = config.ai.SEMANTIC_CACHE_SIZE
+    core = make_core(fake_embedder({}))
+    for i in range(limit + 5):
+        core._cache_response(f"question {i}", f"réponse {i}", unit(1.0, float(i)))
+
+    assert len(core._cache_responses) == limit
+    assert core._cache_embeddings.shape[0] == limit
+    assert core._cache_responses[0] == "réponse 5"
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests du flux de réponse d'AssistantCore (cache, fallback)
+Ollama est remplacé par un générateur local : aucun serveur requis
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.assistant_core_production import AssistantCore
+
+QUESTION = "Présente-toi en une phrase"
+ANSWER = ["Bonjour, je suis ", "Gideon, votre assistant local."]
+
+
+def make_assistant(chunks, error=None, embedder=None):
+    """AssistantCore dont Ollama produit `chunks` puis lève `error` si fourni"""
+    assistant = AssistantCore(embedder=embedder)
+
+    def fake_stream(messages, model=None):
+        yield from chunks
+        if error is not None:
+            raise error
+
+    assistant.ollama_client.is_available = True
+    assistant.ollama_client.chat_completion_stream = fake_stream
+    return assistant
+
+
+def test_stream_error_is_not_cached():
+    """Une erreur en cours de flux bascule sur le fallback sans rien mettre en cache"""
+    assistant = make_assistant(ANSWER[:1], ConnectionError("flux coupé"))
+
+    result = {}
+    chunks = list(assistant.generate_ai_response_stream(QUESTION, result))
+
+    assert chunks[0] == ANSWER[0]
+    assert result['method'] == 'fallback'
+    assert result['fallback_used'] is True
+    assert result['response'] != ANSWER[0].strip()
+    assert "".join(chunks).endswith(result['response'])
+    assert not assistant.response_cache
+    assert assistant.stats.ollama_responses == 0
+    assert assistant.stats.errors == 1
+
+    # La même question n'est pas servie depuis le cache
+    assistant._clear_context()
+    assert assistant.generate_ai_response(QUESTION)['method'] == 'fallback'
+
+
+def test_stream_cache_hit_returns_cached_text():
+    """Une réponse complète est mise en cache puis resservie telle quelle"""
+    assistant = make_assistant(ANSWER)
+
+    first = assistant.generate_ai_response(QUESTION)
+    assert first['method'] == 'ollama'
+    assert first['response'] == "".join(ANSWER)
+
+    assistant._clear_context()
+    result = {}
+    chunks = list(assistant.generate_ai_response_stream(QUESTION, result))
+
+    assert chunks == ["".join(ANSWER)]
+    assert result['method'] == 'cache'
+    assert result['response'] == "".join(ANSWER)
+    assert assistant.stats.cached_responses == 1
+
+
+def test_semantic_cache_hit_and_miss(fake_embedder, unit):
+    """Une question proche est servie par le cache sémantique, une autre non"""
+    assistant = make_assistant(ANSWER, embedder=fake_embedder({
+        QUESTION.casefold(): unit(1.0, 0.0),
+        "présente-toi en une phrase stp": unit(1.0, 0.05),
+        "quelle heure est-il": unit(0.0, 1.0),
+    }))
+
+    assert assistant.generate_ai_response(QUESTION)['method'] == 'ollama'
+
+    assistant._clear_context()
+    similar = assistant.generate_ai_response("Présente-toi en une phrase stp")
+    assert similar['method'] == 'cache'
+    assert similar['response'] == "".join(ANSWER)
+
+    assistant._clear_context()
+    assert assistant.generate_ai_response("Quelle heure est-il")['method'] == 'ollama'
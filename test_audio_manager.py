@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires du gestionnaire audio (texte TTS français, wake words)
+Aucun micro ni moteur TTS requis
+"""
+
+import difflib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import core.audio_manager_optimized as audio_module
+from core.audio_manager_optimized import AudioConfig, EnhancedAudioManager, WakeWordDetector
+
+# Chaîne de str.replace d'origine de _process_french_text
+OLD_FRENCH_REPLACEMENTS = {
+    ' IA ': ' intelligence artificielle ',
+    ' AI ': ' intelligence artificielle ',
+    ' OK ': ' d\'accord ',
+    ' email ': ' courriel ',
+    ' emails ': ' courriels ',
+    ' web ': ' ouèbe ',
+    ' wifi ': ' wi-fi ',
+    ' bluetooth ': ' bluetooth ',
+    '°C': ' degrés Celsius',
+    '°F': ' degrés Fahrenheit',
+    ' USD ': ' dollars américains ',
+    ' EUR ': ' euros ',
+}
+
+
+def old_process_french_text(text: str) -> str:
+    for old, new in OLD_FRENCH_REPLACEMENTS.items():
+        text = text.replace(old, new)
+    return text
+
+
+def process_french_text(text: str) -> str:
+    # Méthode sans état d'instance : pas besoin d'initialiser micro et TTS
+    return EnhancedAudioManager._process_french_text(
+        EnhancedAudioManager.__new__(EnhancedAudioManager), text
+    )
+
+
+def test_french_text_matches_replacement_chain():
+    """Une passe regex donne le même texte que la chaîne de str.replace"""
+    samples = [
+        "",
+        "Bonjour",
+        "L' IA répond OK ",
+        "J'ai reçu 3 emails et un email hier ",
+        "Le web et le wifi marchent avec bluetooth ",
+        "Il fait 21°C ici et 70°F là-bas",
+        "Cela coûte 10 USD soit 9 EUR environ",
+        " AI, IA et OK collés à la ponctuation.",
+        "IAx webs emailing USDT",
+        " emails email emails ",
+    ]
+    for text in samples:
+        assert process_french_text(text) == old_process_french_text(text), text
+
+
+def test_french_text_rewrites_adjacent_terms():
+    """Deux termes voisins partagent l'espace : les deux sont remplacés"""
+    assert process_french_text(" web web ") == " ouèbe ouèbe "
+    assert process_french_text("un IA AI OK test") == (
+        "un intelligence artificielle intelligence artificielle d'accord test"
+    )
+
+
+# Transcriptions typiques : wake word exact, variantes proches, phrases sans wake word
+WAKE_WORD_SAMPLES = [
+    "", "jarvis", "salut jarvis comment vas tu", "hé gideon", "salu gideon",
+    "salut gidéon", "hey jarvi", "jarvice", "jarves", "hey jervis", "gidon",
+    "gideons", "bonjour gidon", "bonjour jarviss", "ordinateurs", "ordinatrice",
+    "assistance", "assistante", "quelle heure est il", "computer", "gédéon",
+    "la météo demain", "allume la lumière", "ordi", "assis", "bonjour",
+]
+
+
+def baseline_detect_wake_word(wake_words, threshold, text):
+    """detect_wake_word d'origine : boucle `in` puis un SequenceMatcher par mot"""
+    wake_words = [word.lower().strip() for word in wake_words]
+    if not text:
+        return False, ""
+    text_lower = text.lower().strip()
+    for wake_word in wake_words:
+        if wake_word in text_lower:
+            return True, wake_word
+    best_match, best_ratio = "", 0
+    for wake_word in wake_words:
+        ratio = difflib.SequenceMatcher(None, wake_word, text_lower).ratio()
+        if ratio > best_ratio and ratio >= threshold:
+            best_ratio, best_match = ratio, wake_word
+    if best_match:
+        return True, f"{best_match} (fuzzy: {best_ratio:.2f})"
+    return False, ""
+
+
+def make_detector(monkeypatch, rapidfuzz: bool, ahocorasick: bool):
+    """WakeWordDetector de la config par défaut, chemins optionnels choisis"""
+    monkeypatch.setattr(audio_module, "HAS_RAPIDFUZZ", rapidfuzz)
+    monkeypatch.setattr(audio_module, "HAS_AHOCORASICK", ahocorasick)
+    config = AudioConfig()
+    return WakeWordDetector(config.WAKE_WORDS, config.WAKE_WORD_THRESHOLD), config
+
+
+def matched_word(result):
+    """(détecté, wake word) sans le score fuzzy formaté"""
+    return result[0], result[1].split(" (fuzzy")[0]
+
+
+def test_wake_word_difflib_matches_baseline(monkeypatch):
+    """Sans rapidfuzz ni ahocorasick : résultats identiques, score compris"""
+    detector, config = make_detector(monkeypatch, rapidfuzz=False, ahocorasick=False)
+    for text in WAKE_WORD_SAMPLES + ["jarvis " * 40, "gidon " + "x" * 250]:
+        expected = baseline_detect_wake_word(config.WAKE_WORDS, config.WAKE_WORD_THRESHOLD, text)
+        assert detector.detect_wake_word(text) == expected, text
+
+
+def test_wake_word_ahocorasick_matches_baseline(monkeypatch):
+    """Recherche exacte Aho-Corasick : même wake word (priorité de la liste)"""
+    pytest.importorskip("ahocorasick")
+    detector, config = make_detector(monkeypatch, rapidfuzz=False, ahocorasick=True)
+    for text in WAKE_WORD_SAMPLES + ["gideon et jarvis", "ordinateur hey jarvis"]:
+        expected = baseline_detect_wake_word(config.WAKE_WORDS, config.WAKE_WORD_THRESHOLD, text)
+        assert detector.detect_wake_word(text) == expected, text
+
+
+def test_wake_word_rapidfuzz_matches_baseline(monkeypatch):
+    """rapidfuzz (distance Indel) : mêmes décisions et même wake word que difflib"""
+    pytest.importorskip("rapidfuzz")
+    detector, config = make_detector(monkeypatch, rapidfuzz=True, ahocorasick=False)
+    for text in WAKE_WORD_SAMPLES:
+        expected = baseline_detect_wake_word(config.WAKE_WORDS, config.WAKE_WORD_THRESHOLD, text)
+        assert matched_word(detector.detect_wake_word(text)) == matched_word(expected), text